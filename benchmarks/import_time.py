@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Measure cold-start import cost for each GitCrew entry point
+
+Each module is imported in a fresh interpreter with `-X importtime`, so the
+numbers reflect what a container cold start or gunicorn worker spawn pays.
+
+Usage:
+    python benchmarks/import_time.py [--runs 5] [--top 10] [module ...]
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Entry points and the module imported to start them
+ENTRY_POINTS = {
+    "FastAPI app (gunicorn main:app)": "main",
+    "Streamlit dashboard": "streamlit_app",
+    "Streamlit dashboard (new)": "streamlit_app_new",
+    "Crew setup": "src.crew.gitcrew",
+}
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s*(\S+)")
+
+
+def measure_import(module: str):
+    """Import a module in a fresh interpreter; return wall seconds and per-package self import microseconds."""
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True
+    )
+    wall = time.perf_counter() - start
+
+    if completed.returncode != 0:
+        last_line = completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else "unknown error"
+        raise RuntimeError(last_line)
+
+    # Attribute each module's self time (not the cumulative column, which would
+    # count nested imports once per parent) to its top-level package
+    packages = {}
+    for match in IMPORTTIME_LINE.finditer(completed.stderr):
+        self_us, name = int(match.group(1)), match.group(3)
+        root = name.split(".")[0]
+        packages[root] = packages.get(root, 0) + self_us
+
+    return wall, packages
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure import cost per entry point")
+    parser.add_argument("modules", nargs="*", help="Modules to measure (default: all entry points)")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per module")
+    parser.add_argument("--top", type=int, default=10, help="Heaviest packages to list per module")
+    args = parser.parse_args()
+
+    targets = {module: module for module in args.modules} if args.modules else ENTRY_POINTS
+
+    for label, module in targets.items():
+        print(f"\n{label} ({module})")
+        try:
+            runs = [measure_import(module) for _ in range(args.runs)]
+        except RuntimeError as e:
+            print(f"  import failed: {e}")
+            continue
+
+        walls = [wall for wall, _ in runs]
+        print(f"  wall time: median {statistics.median(walls) * 1000:.1f} ms, "
+              f"min {min(walls) * 1000:.1f} ms over {args.runs} runs")
+
+        packages = runs[-1][1]
+        print("  self import time by top-level package:")
+        for name, self_us in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+            print(f"  {self_us / 1000:9.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
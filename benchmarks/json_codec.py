@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Compare the JSON codec backends on the sample reports in the repository
+
+Every installed backend parses each report, then serializes it compactly
+and with indent=2 (the download button's format). Times are the best of
+--runs rounds of --number repetitions, per operation per report.
+
+Usage:
+    python benchmarks/json_codec.py [--runs 5] [--number 200] [report.json ...]
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from src.crew.tools.json_codec import available_backends, get_codec
+from src.crew.tools.report_parsing import strip_markdown_fences
+
+EXCLUDED_DIRS = {".git", ".venv", "venv", "node_modules", "__pycache__"}
+
+
+def find_sample_reports():
+    """Report files shipped in the repository, skipping virtualenvs and VCS data."""
+    return sorted(
+        path for path in REPO_ROOT.rglob("github_analysis_report_*.json")
+        if not EXCLUDED_DIRS.intersection(path.relative_to(REPO_ROOT).parts)
+    )
+
+
+def best_time(statement, runs: int, number: int) -> float:
+    """Best per-call time in microseconds."""
+    return min(timeit.repeat(statement, repeat=runs, number=number)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON codec backends on report files")
+    parser.add_argument("reports", nargs="*", type=Path, help="Report files (default: the repository's sample reports)")
+    parser.add_argument("--runs", type=int, default=5, help="Timing rounds per operation")
+    parser.add_argument("--number", type=int, default=200, help="Calls per timing round")
+    args = parser.parse_args()
+
+    reports = args.reports or find_sample_reports()
+    if not reports:
+        print("No report files found")
+        return
+
+    backends = available_backends()
+    print(f"Backends: {', '.join(backends)}")
+
+    for report_path in reports:
+        text = strip_markdown_fences(report_path.read_text(encoding="utf-8"))
+        print(f"\n{report_path.relative_to(REPO_ROOT) if report_path.is_absolute() else report_path} ({len(text) / 1024:.1f} KiB)")
+        print(f"  {'backend':<10}{'loads':>12}{'dumps':>12}{'dumps(indent=2)':>18}")
+
+        for name in backends:
+            codec = get_codec(name)
+            data = codec.loads(text)
+            loads_us = best_time(lambda: codec.loads(text), args.runs, args.number)
+            dumps_us = best_time(lambda: codec.dumps(data), args.runs, args.number)
+            indent_us = best_time(lambda: codec.dumps(data, indent=2), args.runs, args.number)
+            print(f"  {name:<10}{loads_us:>10.1f}us{dumps_us:>10.1f}us{indent_us:>16.1f}us")
+
+
+if __name__ == "__main__":
+    main()
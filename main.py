@@ -1,7 +1,10 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from src.crew.gitcrew import GitCrew
+from fastapi.responses import FileResponse, StreamingResponse
+import re
+from pathlib import Path
+from pydantic import BaseModel, Field
+from src.crew.tools.pydantic import AnalysisDepth, AnalysisOptions
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -23,9 +26,33 @@ app.add_middleware(
     allow_headers=["*"],  # Allows all headers
 )
 
+# GitHub usernames: letters, digits and single hyphens
+GITHUB_USERNAME_PATTERN = re.compile(r"^[A-Za-z0-9](?:[A-Za-z0-9-]{0,38})$")
+
 # Pydantic model for structured input
 class GitHubAnalysisRequest(BaseModel):
     github_username: str
+    analysis_depth: AnalysisDepth = AnalysisDepth.FULL
+    options: AnalysisOptions = Field(default_factory=AnalysisOptions)
+
+# Steps reported back to the client for each analysis depth
+ANALYSIS_STEPS = {
+    AnalysisDepth.METRICS: [
+        "🔍 GitHub profile data extraction",
+        "📊 Deterministic coding pattern and skill metrics"
+    ],
+    AnalysisDepth.SINGLE: [
+        "🔍 GitHub profile data extraction",
+        "🤖 Single-pass AI assessment and report generation"
+    ],
+    AnalysisDepth.FULL: [
+        "🔍 GitHub profile data extraction",
+        "📊 Repository analysis and code evaluation",
+        "🎯 Skill assessment and technology stack review",
+        "📈 Contribution patterns and activity analysis",
+        "🏆 Overall developer evaluation and scoring"
+    ]
+}
 
 @app.get("/")
 async def root():
@@ -51,30 +78,91 @@ async def analyze_github_profile(request: GitHubAnalysisRequest):
         if not request.github_username.strip():
             raise HTTPException(status_code=400, detail="GitHub username is required")
         
+        # Imported on first use: the crewai stack dominates worker start-up time
+        from src.crew.gitcrew import GitCrew
+        
         # Create GitCrew instance
-        git_crew = GitCrew()
+        git_crew = GitCrew(options=request.options)
         
-        # Prepare inputs for the crew
-        inputs = {
-            "github_username": request.github_username
-        }
+        # Run analysis at the requested depth
+        result = git_crew.run_analysis(request.github_username, request.analysis_depth)
         
-        # Get the crew and run analysis
-        crew = git_crew.crew()
-        result = crew.kickoff(inputs=inputs)
+        if isinstance(result, dict) and "error" in result:
+            raise HTTPException(status_code=404, detail=result["error"])
         
         return {
             "status": "success",
             "github_username": request.github_username,
-            "analysis_steps": [
-                "🔍 GitHub profile data extraction",
-                "📊 Repository analysis and code evaluation",
-                "🎯 Skill assessment and technology stack review",
-                "📈 Contribution patterns and activity analysis",
-                "🏆 Overall developer evaluation and scoring"
-            ],
+            "analysis_depth": request.analysis_depth,
+            "analysis_steps": ANALYSIS_STEPS[request.analysis_depth],
             "result": result
         }
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"GitHub analysis failed: {str(e)}")
+
+@app.post("/analyze/stream")
+def stream_github_metrics(request: GitHubAnalysisRequest):
+    """
+    Stream the deterministic GitHub metrics as JSON, section by section
+    
+    The profile and metrics sections are sent while repository details are
+    still being fetched, so clients can start parsing early.
+    """
+    if not request.github_username.strip():
+        raise HTTPException(status_code=400, detail="GitHub username is required")
+    
+    from src.crew.tools.github import GitHubProfileAnalyzer
+    from src.crew.tools.json_stream import iter_json_object
+    
+    sections = GitHubProfileAnalyzer(options=request.options).iter_analysis_sections(request.github_username)
+    
+    # The first section tells a missing user apart before the response starts
+    first_key, first_value = next(sections)
+    if first_key == "error":
+        raise HTTPException(status_code=404, detail=first_value)
+    
+    def all_sections():
+        yield first_key, first_value
+        yield from sections
+    
+    return StreamingResponse(iter_json_object(all_sections()), media_type="application/json")
+
+def report_export_path(github_username: str, export: str) -> Path:
+    """The cached export of a saved report, rendered first if it is missing or stale"""
+    if not GITHUB_USERNAME_PATTERN.match(github_username):
+        raise HTTPException(status_code=400, detail="Invalid GitHub username")
+    
+    report_path = Path(f"github_analysis_report_{github_username}.json")
+    if not report_path.exists():
+        raise HTTPException(status_code=404, detail=f"No report found for {github_username}")
+    
+    from src.crew.tools import report_export
+    
+    if export == "pdf":
+        if not report_export.PDF_AVAILABLE:
+            raise HTTPException(status_code=501, detail="PDF export requires weasyprint")
+        output_path = report_export.export_pdf(report_path)
+    else:
+        output_path = report_export.export_html(report_path)
+    if output_path is None:
+        raise HTTPException(status_code=500, detail=f"Report for {github_username} could not be rendered")
+    return output_path
+
+@app.get("/reports/{github_username}/html")
+def get_report_html(github_username: str):
+    """
+    Serve the pre-rendered HTML page of a saved report
+    
+    Pages are rendered when the report is saved and cached beside it, so
+    repeated views only send the file.
+    """
+    return FileResponse(report_export_path(github_username, "html"), media_type="text/html")
+
+@app.get("/reports/{github_username}/pdf")
+def get_report_pdf(github_username: str):
+    """Serve the PDF export of a saved report (rendered on first request)"""
+    path = report_export_path(github_username, "pdf")
+    return FileResponse(path, media_type="application/pdf", filename=path.name)
@@ -0,0 +1,140 @@
+"""
+Background analysis jobs for the Streamlit dashboards
+
+Analyses run on a process-wide thread pool instead of the Streamlit script
+thread, so they survive reruns, page changes and closed tabs, and several
+users of one server can run analyses at the same time. Each job records its
+progress as GitCrew.run_analysis reports it; the dashboards poll the job
+objects. Saved reports are recorded in the report catalog by save_report.
+"""
+
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
+from src.crew.tools.pydantic import AnalysisDepth, AnalysisOptions
+
+# Analyses run at once per process; GITCREW_ANALYSIS_WORKERS overrides it
+DEFAULT_ANALYSIS_WORKERS = 2
+
+# Finished jobs kept for display, oldest dropped first
+MAX_FINISHED_JOBS = 100
+
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+@dataclass
+class AnalysisJob:
+    """One submitted analysis and its progress, updated by the worker thread."""
+
+    job_id: str
+    username: str
+    depth: AnalysisDepth
+    options: AnalysisOptions
+    status: JobStatus = JobStatus.QUEUED
+    # (completed_steps, total_steps, stage), replaced as a whole so readers see a consistent value
+    progress: Tuple[int, int, str] = (0, 1, "Queued")
+    submitted_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+    # Metrics dict for AnalysisDepth.METRICS; LLM reports are saved to disk instead
+    result: Optional[Dict[str, Any]] = None
+    report_file: Optional[str] = None
+
+    @property
+    def is_active(self) -> bool:
+        return self.status in (JobStatus.QUEUED, JobStatus.RUNNING)
+
+    @property
+    def fraction(self) -> float:
+        completed, total, _ = self.progress
+        return min(1.0, completed / total) if total else 0.0
+
+
+class AnalysisJobManager:
+    """Thread pool of GitCrew analyses, shared by every Streamlit session."""
+
+    def __init__(self, max_workers: int = DEFAULT_ANALYSIS_WORKERS):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="gitcrew-analysis")
+        self._jobs: Dict[str, AnalysisJob] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, username: str, depth: AnalysisDepth, options: Optional[AnalysisOptions] = None) -> AnalysisJob:
+        """
+        Queue an analysis and return its job.
+
+        An identical analysis that is still queued or running is returned
+        instead of starting a second one, so repeated clicks are harmless.
+        """
+        depth = AnalysisDepth(depth)
+        options = options or AnalysisOptions()
+        with self._lock:
+            for job in self._jobs.values():
+                if job.is_active and (job.username, job.depth, job.options) == (username, depth, options):
+                    return job
+            job = AnalysisJob(job_id=uuid.uuid4().hex, username=username, depth=depth, options=options)
+            self._jobs[job.job_id] = job
+            self._prune()
+        self._executor.submit(self._run, job)
+        return job
+
+    def get(self, job_id: str) -> Optional[AnalysisJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def jobs(self) -> List[AnalysisJob]:
+        """All known jobs, newest first."""
+        with self._lock:
+            return sorted(self._jobs.values(), key=lambda job: job.submitted_at, reverse=True)
+
+    def _prune(self) -> None:
+        finished = sorted((job for job in self._jobs.values() if not job.is_active), key=lambda job: job.finished_at)
+        for job in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self._jobs[job.job_id]
+
+    def _run(self, job: AnalysisJob) -> None:
+        job.status = JobStatus.RUNNING
+
+        def update(completed: int, total: int, stage: str) -> None:
+            job.progress = (completed, total, stage)
+
+        try:
+            from src.crew.gitcrew import GitCrew
+
+            result = GitCrew(options=job.options).run_analysis(job.username, job.depth, progress=update)
+            if isinstance(result, dict) and "error" in result:
+                job.error = result["error"]
+            elif job.depth == AnalysisDepth.METRICS:
+                job.result = result
+            else:
+                job.report_file = f"github_analysis_report_{job.username}.json"
+        except Exception as e:
+            print(f"Analysis of {job.username} failed: {e}")
+            job.error = str(e)
+
+        _, total, _ = job.progress
+        job.progress = (total, total, "Failed" if job.error else "Done")
+        job.finished_at = time.time()
+        job.status = JobStatus.FAILED if job.error else JobStatus.COMPLETED
+
+
+_manager: Optional[AnalysisJobManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_job_manager() -> AnalysisJobManager:
+    """Process-wide job manager, created on first use."""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = AnalysisJobManager(int(os.getenv("GITCREW_ANALYSIS_WORKERS", DEFAULT_ANALYSIS_WORKERS)))
+        return _manager
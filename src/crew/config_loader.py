@@ -0,0 +1,143 @@
+"""
+Process-wide cache of the parsed and validated crew YAML configuration
+"""
+
+import os
+import re
+import threading
+import time
+import yaml
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Iterable, Mapping, Tuple
+
+CONFIG_DIR = Path(__file__).parent / "config"
+
+# Keys every entry must define, per configuration file
+REQUIRED_KEYS = {
+    "agents.yaml": ("role", "goal", "backstory"),
+    "tasks.yaml": ("description", "expected_output"),
+}
+
+# Fields of an entry that CrewAI interpolates with the crew inputs
+TEMPLATE_FIELDS = ("role", "goal", "backstory", "description", "expected_output", "output_file")
+
+# Template variables such as {github_username}
+PLACEHOLDER_PATTERN = re.compile(r"\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
+# Minimum seconds between mtime checks, so hot-path lookups stay in memory
+MTIME_CHECK_INTERVAL = 2.0
+
+
+class ConfigError(ValueError):
+    """Raised when a crew YAML configuration file is missing or invalid."""
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert parsed YAML into read-only mappings and tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@dataclass(frozen=True)
+class CrewConfig:
+    """An immutable, validated agents.yaml or tasks.yaml configuration."""
+
+    filename: str
+    entries: Mapping[str, Mapping[str, Any]]
+    placeholders: Mapping[str, FrozenSet[str]]
+    mtime_ns: int
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return the entries as fresh top-level dicts for CrewAI.
+
+        CrewAI replaces entry keys (llm, tools, context) with objects in
+        place, so each entry is copied one level deep; the values inside are
+        the cached read-only mappings and tuples, shared rather than copied.
+        """
+        return {name: dict(entry) for name, entry in self.entries.items()}
+
+    def required_inputs(self, names: Iterable[str]) -> FrozenSet[str]:
+        """Template variables used by the given entries."""
+        return frozenset().union(*(self.placeholders[name] for name in names))
+
+
+def _template_variables(entry: Mapping[str, Any]) -> FrozenSet[str]:
+    """Collect the template variables an entry's text fields use (CrewAI interpolates them)."""
+    names = set()
+    for field in TEMPLATE_FIELDS:
+        text = entry.get(field)
+        if isinstance(text, str):
+            names.update(PLACEHOLDER_PATTERN.findall(text))
+    return frozenset(names)
+
+
+def _parse_config(path: Path) -> CrewConfig:
+    """Read, validate and freeze a configuration file."""
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+        with open(path, 'r', encoding='utf-8') as file:
+            data = yaml.safe_load(file)
+    except OSError as e:
+        raise ConfigError(f"Cannot read {path}: {e}") from e
+    except yaml.YAMLError as e:
+        raise ConfigError(f"Invalid YAML in {path}: {e}") from e
+
+    if not isinstance(data, dict) or not data:
+        raise ConfigError(f"{path.name} must map entry names to their configuration")
+
+    required_keys = REQUIRED_KEYS.get(path.name, ())
+    for name, entry in data.items():
+        if not isinstance(entry, dict):
+            raise ConfigError(f"{path.name}: '{name}' must be a mapping")
+        for key in required_keys:
+            if not isinstance(entry.get(key), str) or not entry[key].strip():
+                raise ConfigError(f"{path.name}: '{name}' is missing '{key}'")
+        for context_name in entry.get("context") or []:
+            if context_name not in data:
+                raise ConfigError(f"{path.name}: '{name}' has unknown context task '{context_name}'")
+
+    return CrewConfig(
+        filename=path.name,
+        entries=_freeze(data),
+        placeholders=MappingProxyType({name: _template_variables(entry) for name, entry in data.items()}),
+        mtime_ns=mtime_ns
+    )
+
+
+_cache: Dict[Path, Tuple[CrewConfig, float]] = {}
+_cache_lock = threading.Lock()
+
+
+def load_config(filename: str, config_dir: Path = CONFIG_DIR) -> CrewConfig:
+    """
+    Return the cached configuration for a file in the config directory.
+
+    The file is parsed once per process and re-parsed only when its mtime
+    changes; the mtime itself is checked at most every MTIME_CHECK_INTERVAL
+    seconds. Invalid or missing files raise ConfigError.
+    """
+    path = Path(config_dir) / filename
+    now = time.monotonic()
+
+    with _cache_lock:
+        cached = _cache.get(path)
+        if cached is not None:
+            config, checked_at = cached
+            if now - checked_at < MTIME_CHECK_INTERVAL:
+                return config
+            try:
+                if os.stat(path).st_mtime_ns == config.mtime_ns:
+                    _cache[path] = (config, now)
+                    return config
+            except OSError as e:
+                raise ConfigError(f"Cannot read {path}: {e}") from e
+
+        config = _parse_config(path)
+        _cache[path] = (config, now)
+        return config
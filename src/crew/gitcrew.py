@@ -4,45 +4,65 @@ GitCrew - AI HR System for GitHub Developer Analysis
 """
 
 import os
-import yaml
-from typing import Dict, Any
+from typing import Callable, Dict, Any, Optional, Union
 from pathlib import Path
 from dotenv import load_dotenv
 from crewai import Agent, Task, Crew, Process, LLM
 from crewai.project import CrewBase, agent, crew, task
+from src.crew.config_loader import ConfigError, load_config
+from src.crew.tools import json_codec
 from src.crew.tools.github import GitHubProfileAnalyzer
-from src.crew.tools.pydantic import GitHubDeveloperAnalysisReport
+from src.crew.tools.pydantic import GitHubDeveloperAnalysisReport, NarrativeReportSections, AnalysisDepth, AnalysisOptions
+from src.crew.tools.report_parsing import parse_report, schema_guardrail
+from src.crew.tools.report_builder import assemble_report, save_report
 # Load environment variables
 load_dotenv()
 
+# progress(completed_steps, total_steps, stage) callback of GitCrew.run_analysis
+ProgressCallback = Callable[[int, int, str], None]
+
 @CrewBase
 class GitCrew:
     """AI HR System for analyzing GitHub developers using CrewAI"""
     
-    def __init__(self):
-        """Initialize GitCrew with GitHub tools and configuration"""
+    # tasks.yaml entries run at each LLM analysis depth
+    FULL_TASKS = ("collect_github_data", "assess_developer_skills", "create_technical_profile", "generate_analysis_report")
+    SINGLE_TASKS = ("generate_consolidated_report",)
+    
+    def __init__(self, options: Optional[AnalysisOptions] = None):
+        """
+        Initialize GitCrew with GitHub tools and configuration
+        
+        Args:
+            options: Request budgets for the GitHub data collection, used both
+                up front and when agents call the analyzer tool
+        """
         # Initialize LLM
         self.llm = LLM(model="gemini/gemini-2.0-flash")
         
-        # Initialize tools
-        self.github_analyzer = GitHubProfileAnalyzer()
+        # Initialize tools, keeping collected data in the columnar snapshot store
+        # when configured (commit activity always goes to the persistent store)
+        snapshot_store = None
+        snapshot_dir = os.getenv("GITHUB_SNAPSHOT_DIR")
+        if snapshot_dir:
+            from src.crew.tools.snapshot_store import SnapshotStore
+            snapshot_store = SnapshotStore(Path(snapshot_dir))
+        
+        self.github_analyzer = GitHubProfileAnalyzer(
+            snapshot_store=snapshot_store,
+            options=options
+        )
         
         # Load configuration
         self.config_path = Path(__file__).parent / "config"
         
-        # Load YAML configurations
+        # Load YAML configurations (parsed and validated once per process)
         self.agents_config = self._load_yaml_config("agents.yaml")
         self.tasks_config = self._load_yaml_config("tasks.yaml")
     
     def _load_yaml_config(self, filename: str) -> Dict[str, Any]:
-        """Load YAML configuration file"""
-        config_file = self.config_path / filename
-        try:
-            with open(config_file, 'r', encoding='utf-8') as file:
-                return yaml.safe_load(file)
-        except Exception as e:
-            print(f"Error loading {filename}: {e}")
-            return {}
+        """Load YAML configuration file from the process-wide config cache"""
+        return load_config(filename, self.config_path).to_dict()
     
     @agent
     def github_data_collector(self) -> Agent:
@@ -114,6 +134,8 @@ class GitCrew:
         return Task(
             config=self.tasks_config.get('generate_analysis_report', {}),
             agent=self.report_generator(),
+            output_pydantic=NarrativeReportSections,
+            guardrail=schema_guardrail(NarrativeReportSections)
         )
     
     @crew
@@ -124,4 +146,86 @@ class GitCrew:
             tasks=self.tasks,
             process=Process.sequential,
             verbose=True
-        )
\ No newline at end of file
+        )
+    
+    def single_agent_crew(self) -> Crew:
+        """Create a one-agent, one-task crew that produces the report in a single LLM pass"""
+        # Built without the @agent/@task decorators so it stays out of the full crew.
+        # The collected data is passed in as the {github_data} input, so no tool call is needed.
+        consolidated_analyst = Agent(
+            config=self.agents_config.get('consolidated_analyst', {}),
+            verbose=True,
+            tools=[],
+            llm=self.llm
+        )
+        consolidated_report = Task(
+            config=self.tasks_config.get('generate_consolidated_report', {}),
+            agent=consolidated_analyst,
+            output_pydantic=NarrativeReportSections,
+            guardrail=schema_guardrail(NarrativeReportSections)
+        )
+        return Crew(
+            agents=[consolidated_analyst],
+            tasks=[consolidated_report],
+            process=Process.sequential,
+            verbose=True
+        )
+    
+    def run_analysis(
+        self,
+        github_username: str,
+        depth: AnalysisDepth = AnalysisDepth.FULL,
+        progress: Optional[ProgressCallback] = None
+    ) -> Union[Dict[str, Any], GitHubDeveloperAnalysisReport]:
+        """
+        Run an analysis at the requested depth.
+        
+        - metrics: deterministic GitHub metrics only (dict, no LLM calls)
+        - single: one consolidated LLM call
+        - full: the four-agent sequential crew
+        
+        The GitHub data is always collected up front. For the LLM depths the crew
+        only writes the narrative sections; the report is assembled around them
+        from the collected data and saved as github_analysis_report_{username}.json.
+        
+        progress, when given, is called as progress(completed_steps, total_steps, stage)
+        before data collection, after it and after each crew task.
+        """
+        depth = AnalysisDepth(depth)
+        task_names = () if depth == AnalysisDepth.METRICS else (
+            self.SINGLE_TASKS if depth == AnalysisDepth.SINGLE else self.FULL_TASKS
+        )
+        # Data collection, each crew task, then report assembly
+        total_steps = 1 + len(task_names) + (1 if task_names else 0)
+        report_progress = progress or (lambda completed, total, stage: None)
+        
+        report_progress(0, total_steps, "Collecting GitHub data")
+        analysis = self.github_analyzer.analyze_profile(github_username)
+        if depth == AnalysisDepth.METRICS or "error" in analysis:
+            return analysis
+        
+        inputs = {
+            "github_username": github_username,
+            "github_data": json_codec.dumps(analysis)
+        }
+        missing = load_config("tasks.yaml", self.config_path).required_inputs(task_names) - inputs.keys()
+        if missing:
+            raise ConfigError(f"Task templates require missing inputs: {', '.join(sorted(missing))}")
+        
+        crew = self.single_agent_crew() if depth == AnalysisDepth.SINGLE else self.crew()
+        finished_tasks = []
+        
+        def task_finished(output) -> None:
+            # Tasks run sequentially, so outputs arrive in task_names order
+            finished_tasks.append(output)
+            stage = task_names[len(finished_tasks)] if len(finished_tasks) < len(task_names) else "assembling_report"
+            report_progress(1 + len(finished_tasks), total_steps, stage.replace("_", " ").capitalize())
+        
+        crew.task_callback = task_finished
+        report_progress(1, total_steps, task_names[0].replace("_", " ").capitalize())
+        result = crew.kickoff(inputs=inputs)
+        
+        narrative = result.pydantic or parse_report(result.raw, NarrativeReportSections)
+        report = assemble_report(analysis, narrative)
+        save_report(report, github_username)
+        return report
\ No newline at end of file
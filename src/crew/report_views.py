@@ -0,0 +1,401 @@
+"""
+Streamlit rendering of normalized reports, shared by both dashboards
+
+Every function takes the canonical report produced by
+report_normalizer.normalize_report and reads its fields directly; format
+differences are resolved once, when the report is loaded.
+"""
+
+import importlib.util
+from typing import Any, Callable, Dict, List
+import streamlit as st
+from src.crew.tools import report_charts
+
+PLOTLY_AVAILABLE = importlib.util.find_spec("plotly") is not None
+
+
+def show_lazy_chart(label: str, key: str, build_figure: Callable[[], Any]) -> None:
+    """
+    Show a chart behind a toggle; the figure is only built while the toggle is on.
+
+    The toggle state is kept per key in the session, so a section stays open
+    across reruns and reports.
+    """
+    if st.toggle(label, key=f"chart_{key}"):
+        fig = build_figure()
+        if fig:
+            st.plotly_chart(fig, use_container_width=True)
+
+
+def _value(value: Any, suffix: str = "") -> str:
+    return "N/A" if value in (None, "") else f"{value}{suffix}"
+
+
+def _bullets(items: List[str], empty_message: str = "") -> None:
+    for item in items:
+        st.write(f"• {item}")
+    if not items and empty_message:
+        st.info(empty_message)
+
+
+def _boxes(items: List[str], css_class: str, empty_message: str = "") -> None:
+    for item in items:
+        st.markdown(f'<div class="{css_class}">• {item}</div>', unsafe_allow_html=True)
+    if not items and empty_message:
+        st.info(empty_message)
+
+
+def _summary(text: str, title: str = "📋 Summary") -> None:
+    if text:
+        st.subheader(title)
+        st.markdown(f'<div class="info-box">{text}</div>', unsafe_allow_html=True)
+
+
+def _skills(skills: Dict[str, Dict[str, str]], icon: str) -> None:
+    for name, skill in skills.items():
+        title = f"{icon} {name} - {skill['proficiency']}" if skill["proficiency"] else f"{icon} {name}"
+        if skill["description"] or skill["evidence"]:
+            with st.expander(title):
+                if skill["description"]:
+                    st.write(f"**Description:** {skill['description']}")
+                if skill["evidence"]:
+                    st.write(f"**Evidence:** {skill['evidence']}")
+        else:
+            st.write(f"• **{name}**" + (f" - {skill['proficiency']}" if skill["proficiency"] else ""))
+
+
+def display_executive_summary(report: Dict[str, Any]) -> None:
+    """Display executive summary section"""
+    st.markdown('<div class="section-header">📋 Executive Summary</div>', unsafe_allow_html=True)
+    summary = report["executive_summary"]
+
+    if summary["overview"]:
+        st.markdown(f'<div class="info-box">{summary["overview"]}</div>', unsafe_allow_html=True)
+
+    if summary["key_findings"]:
+        st.subheader("🔍 Key Findings")
+        _bullets(summary["key_findings"])
+
+    st.subheader("🎯 Key Recommendations")
+    if summary["recommendations"]:
+        for i, recommendation in enumerate(summary["recommendations"], 1):
+            st.write(f"{i}. {recommendation}")
+    else:
+        st.info("No recommendations available")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        if summary["strengths_summary"]:
+            st.markdown(f'<div class="success-box"><strong>Strengths:</strong> {summary["strengths_summary"]}</div>', unsafe_allow_html=True)
+    with col2:
+        if summary["weaknesses_summary"]:
+            st.markdown(f'<div class="warning-box"><strong>Areas for Improvement:</strong> {summary["weaknesses_summary"]}</div>', unsafe_allow_html=True)
+
+
+def display_developer_profile(report: Dict[str, Any]) -> None:
+    """Display developer profile overview, including experience classification and specializations"""
+    st.markdown('<div class="section-header">👤 Developer Profile Overview</div>', unsafe_allow_html=True)
+    profile = report["developer_profile_overview"]
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Username", _value(profile["username"]))
+        st.metric("Name", _value(profile["name"]))
+    with col2:
+        st.metric("Location", _value(profile["location"]))
+        account_age = profile["account_age_days"]
+        st.metric("Account Age", f"{round(account_age / 365.25, 1)} years" if account_age else "N/A")
+    with col3:
+        st.metric("Followers", _value(profile["followers"]))
+        st.metric("Following", _value(profile["following"]))
+    with col4:
+        st.metric("Public Repos", _value(profile["public_repos"]))
+        if profile["avatar_url"]:
+            st.image(profile["avatar_url"], width=100, caption="Avatar")
+
+    st.subheader("📊 Key Metrics")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Experience Level", _value(profile["experience_level"]))
+    with col2:
+        st.metric("Activity Level", _value(profile["activity_level"]))
+    with col3:
+        st.metric("Community Involvement", _value(profile["community_involvement"]))
+
+    if profile["primary_languages"]:
+        st.subheader("💻 Primary Languages")
+        languages_text = ", ".join(profile["primary_languages"])
+        st.markdown(f'<div class="success-box"><strong>Languages:</strong> {languages_text}</div>', unsafe_allow_html=True)
+
+    if profile["bio"]:
+        st.subheader("📝 Bio")
+        st.markdown(f'<div class="info-box">{profile["bio"]}</div>', unsafe_allow_html=True)
+
+    if profile["summary"]:
+        st.subheader("📋 Profile Summary")
+        st.write(profile["summary"])
+
+    if profile["experience_evidence"] or profile["experience_reasoning"]:
+        st.subheader("🎓 Experience Level Classification")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.write("**Evidence:**", profile["experience_evidence"] or "No evidence provided")
+        with col2:
+            st.write("**Reasoning:**", profile["experience_reasoning"] or "No reasoning provided")
+
+    if profile["specialization_areas"]:
+        st.subheader("🏆 Specialization Areas")
+        _bullets(profile["specialization_areas"])
+        if profile["specialization_details"]:
+            st.write(profile["specialization_details"])
+
+
+def display_technical_skills(report: Dict[str, Any]) -> None:
+    """Display technical skills analysis"""
+    st.markdown('<div class="section-header">⚡ Technical Skills Analysis</div>', unsafe_allow_html=True)
+    skills = report["technical_skills_analysis"]
+
+    st.subheader("💻 Programming Languages")
+    if skills["programming_languages"]:
+        _skills(skills["programming_languages"], "🔧")
+    else:
+        st.info("No programming language assessment available")
+
+    if skills["frameworks_and_libraries"]:
+        st.subheader("🛠️ Frameworks & Libraries")
+        _skills(skills["frameworks_and_libraries"], "⚙️")
+
+    if skills["tools_and_technologies"]:
+        st.subheader("🧰 Tools & Technologies")
+        _skills(skills["tools_and_technologies"], "🔩")
+
+    _summary(skills["summary"], "📊 Skills Summary")
+
+    if skills["skill_gaps"]:
+        st.subheader("🎯 Areas for Development")
+        _bullets(skills["skill_gaps"])
+
+
+def display_repository_analysis(report: Dict[str, Any]) -> None:
+    """Display repository portfolio analysis"""
+    st.markdown('<div class="section-header">📁 Repository Portfolio Analysis</div>', unsafe_allow_html=True)
+    portfolio = report["repository_portfolio_review"]
+    coding_patterns = portfolio["coding_patterns"]
+
+    if portfolio["total_repos"] is not None or portfolio["analyzed_repos"] is not None:
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Total Repositories", _value(portfolio["total_repos"]))
+        with col2:
+            st.metric("Analyzed Repositories", _value(portfolio["analyzed_repos"]))
+
+    st.subheader("🌟 Top Repositories")
+    for repo in portfolio["top_repositories"]:
+        with st.expander(f"📦 {repo['name'] or 'Unknown'} ({repo['language'] or 'N/A'})"):
+            st.write(f"**Description:** {repo['description'] or 'No description'}")
+            st.write(f"**Recent Commits:** {_value(repo['recent_commits_count'])}")
+            if repo["stargazers_count"] is not None:
+                st.write(f"**Stars:** {repo['stargazers_count']}")
+            if repo["purpose"]:
+                st.write(f"**Purpose:** {repo['purpose']}")
+            if repo["key_aspects"]:
+                st.write(f"**Key Aspects:** {repo['key_aspects']}")
+    if not portfolio["top_repositories"]:
+        st.info("No repository information available")
+
+    if portfolio["repository_patterns"]:
+        st.subheader("🔍 Repository Patterns")
+        _bullets(portfolio["repository_patterns"])
+
+    languages = coding_patterns.get("languages_used") or {}
+    if languages and PLOTLY_AVAILABLE:
+        st.subheader("📊 Language Usage Distribution")
+        show_lazy_chart("Show language chart", "repo_languages", lambda: report_charts.language_pie_chart(languages))
+
+    if coding_patterns:
+        st.subheader("📈 Repository Metrics")
+        if PLOTLY_AVAILABLE:
+            show_lazy_chart("Show metrics chart", "repo_metrics", lambda: report_charts.metrics_bar_chart(coding_patterns))
+        else:
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Documentation Rate", f"{coding_patterns.get('documentation_rate', 0)}%")
+            with col2:
+                st.metric("License Usage Rate", f"{coding_patterns.get('license_usage_rate', 0)}%")
+            with col3:
+                st.metric("Activity Rate", f"{coding_patterns.get('activity_rate', 0)}%")
+
+    _summary(portfolio["summary"])
+
+
+def display_activity_engagement(report: Dict[str, Any]) -> None:
+    """Display activity and engagement assessment with the analyzer's metrics"""
+    st.markdown('<div class="section-header">📊 Activity & Engagement Assessment</div>', unsafe_allow_html=True)
+    activity = report["activity_and_engagement_assessment"]
+    coding_patterns = report["repository_portfolio_review"]["coding_patterns"]
+    skill_metrics = report["appendices"]["raw_data_summary"].get("skill_metrics") or {}
+
+    if coding_patterns:
+        st.subheader("💻 Coding Activity")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Active Repos (6m)", _value(coding_patterns.get("active_repos_last_6_months")))
+            st.metric("Total Stars", _value(coding_patterns.get("total_stars_received")))
+        with col2:
+            st.metric("Activity Rate", _value(coding_patterns.get("activity_rate"), "%"))
+            st.metric("Total Forks", _value(coding_patterns.get("total_forks_received")))
+        with col3:
+            st.metric("Open Issues", _value(coding_patterns.get("total_open_issues")))
+
+    if skill_metrics:
+        st.subheader("📈 Skill Metrics")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Experience Score", _value(skill_metrics.get("experience_score"), "/100"))
+            st.metric("Language Diversity", _value(skill_metrics.get("language_diversity")))
+        with col2:
+            st.metric("Community Engagement", _value(skill_metrics.get("community_engagement")))
+            st.metric("Repos per Year", _value(skill_metrics.get("repos_per_year")))
+        with col3:
+            st.metric("Project Maintenance", _value(skill_metrics.get("project_maintenance"), "%"))
+            st.metric("Avg Repo Size", _value(skill_metrics.get("average_repo_size_kb"), " KB"))
+
+    if activity["activity_metrics"]:
+        st.subheader("📈 Activity Metrics")
+        for aspect, description in activity["activity_metrics"].items():
+            st.write(f"**{aspect}:** {description}")
+
+    if activity["engagement_patterns"]:
+        st.subheader("🤝 Engagement Patterns")
+        for aspect, description in activity["engagement_patterns"].items():
+            st.write(f"**{aspect}:** {description}")
+
+    if activity["recommendations"]:
+        st.subheader("💡 Recommendations")
+        _bullets(activity["recommendations"])
+
+    _summary(activity["summary"])
+
+
+def display_strengths_development(report: Dict[str, Any]) -> None:
+    """Display strengths and development areas"""
+    st.markdown('<div class="section-header">💪 Strengths & Development Areas</div>', unsafe_allow_html=True)
+    section = report["strengths_and_development_areas"]
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.subheader("✅ Strengths")
+        _boxes(section["strengths"], "success-box", "No strengths specified")
+    with col2:
+        st.subheader("🎯 Areas for Improvement")
+        _boxes(section["development_areas"], "warning-box", "No improvement areas specified")
+
+    if section["recommendations"]:
+        st.subheader("💡 Recommendations")
+        _bullets(section["recommendations"])
+
+    _summary(section["summary"])
+
+
+def display_hiring_recommendations(report: Dict[str, Any]) -> None:
+    """Display hiring and project fit recommendations"""
+    st.markdown('<div class="section-header">🎯 Hiring & Project Fit Recommendations</div>', unsafe_allow_html=True)
+    hiring = report["hiring_and_project_fit_recommendations"]
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.subheader("💼 Suitable Roles")
+        _bullets(hiring["suitable_roles"], "No suitable roles specified")
+    with col2:
+        st.subheader("🚀 Suitable Projects")
+        _bullets(hiring["suitable_projects"], "No suitable projects specified")
+
+    if hiring["unsuitable_projects"]:
+        st.subheader("🚫 Less Suitable Projects")
+        _bullets(hiring["unsuitable_projects"])
+
+    if hiring["recommendations"]:
+        st.subheader("📋 Hiring Recommendations")
+        _bullets(hiring["recommendations"])
+
+    if hiring["considerations"]:
+        st.subheader("🤔 Considerations")
+        st.markdown(f'<div class="warning-box">{hiring["considerations"]}</div>', unsafe_allow_html=True)
+
+    _summary(hiring["summary"])
+
+
+def display_risk_analysis(report: Dict[str, Any]) -> None:
+    """Display risk analysis and considerations"""
+    st.markdown('<div class="section-header">⚠️ Risk Analysis & Considerations</div>', unsafe_allow_html=True)
+    risk = report["risk_analysis_and_considerations"]
+
+    for heading, aspects in risk["assessments"].items():
+        st.subheader(f"🔍 {heading}")
+        for aspect, description in aspects.items():
+            st.write(f"**{aspect}:** {description}")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.subheader("🚨 Identified Risks")
+        _boxes(risk["risks"], "warning-box", "No risks identified")
+    with col2:
+        if risk["mitigation_strategies"] or not risk["considerations"]:
+            st.subheader("🛡️ Mitigation Strategies")
+            _boxes(risk["mitigation_strategies"], "info-box", "No mitigation strategies provided")
+        if risk["considerations"]:
+            st.subheader("🤔 Considerations")
+            _boxes(risk["considerations"], "info-box")
+
+    _summary(risk["summary"])
+
+
+def display_action_steps(report: Dict[str, Any]) -> None:
+    """Display actionable next steps"""
+    st.markdown('<div class="section-header">🚀 Actionable Next Steps</div>', unsafe_allow_html=True)
+    actions = report["actionable_next_steps"]
+
+    if actions["developer_actions"] or actions["managerial_actions"]:
+        col1, col2 = st.columns(2)
+        with col1:
+            st.subheader("👨‍💻 Developer Actions")
+            _bullets(actions["developer_actions"], "No developer actions specified")
+        with col2:
+            st.subheader("👔 Managerial Actions")
+            _bullets(actions["managerial_actions"], "No managerial actions specified")
+
+    if actions["short_term_actions"] or actions["long_term_actions"]:
+        col1, col2 = st.columns(2)
+        with col1:
+            st.subheader("📅 Short Term Actions")
+            _bullets(actions["short_term_actions"], "No short term actions specified")
+        with col2:
+            st.subheader("🎯 Long Term Actions")
+            _bullets(actions["long_term_actions"], "No long term actions specified")
+
+    if not any(actions[field] for field in ("developer_actions", "managerial_actions", "short_term_actions", "long_term_actions")):
+        st.info("No next steps available")
+
+    _summary(actions["summary"])
+
+
+REPORT_SECTIONS = (
+    display_executive_summary,
+    display_developer_profile,
+    display_technical_skills,
+    display_repository_analysis,
+    display_activity_engagement,
+    display_strengths_development,
+    display_hiring_recommendations,
+    display_risk_analysis,
+    display_action_steps,
+)
+
+
+def render_report(report: Dict[str, Any]) -> None:
+    """Render every section of a normalized report; a failing section does not stop the others."""
+    for display_section in REPORT_SECTIONS:
+        try:
+            display_section(report)
+        except Exception as e:
+            st.error(f"Error displaying {display_section.__name__.replace('display_', '').replace('_', ' ')}: {e}")
@@ -0,0 +1,284 @@
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from src.crew.tools.report_parsing import REPORT_ENVELOPE_KEYS, wrap_report_envelope
+from src.crew.tools.timestamps import ACTIVITY_WINDOW_DAYS, SECONDS_PER_DAY, parse_timestamp, reference_now
+
+# Repository columns the engine reads, with the value used when a field is missing
+REPO_COLUMNS = {
+    "language": None,
+    "stargazers_count": 0,
+    "forks_count": 0,
+    "open_issues_count": 0,
+    "size": 0,
+    "has_wiki": False,
+    "has_pages": False,
+    "license": None,
+    "pushed_at": None,
+}
+
+# User columns the engine reads
+USER_COLUMNS = {
+    "account_age_days": 0,
+    "followers": 0,
+    "following": 0,
+}
+
+# GitHub's timestamp format, parsed with a fixed format instead of inference
+GITHUB_TIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+# Epoch value for unknown push times; compares older than any real time
+MISSING_EPOCH = np.iinfo(np.int64).min
+
+# Where each saved report format keeps the analyzer's raw data
+RAW_DATA_PATHS = {
+    "report": ("appendices", "raw_data_summary"),
+    "skill_assessment_report": ("appendices", "raw_data_summaries"),
+    "github_analysis_report": ("appendices", "raw_data_summary"),
+}
+
+# Metric columns read from a saved report's skill_metrics and coding_patterns blocks
+REPORT_METRIC_COLUMNS = {
+    "skill_metrics": (
+        "experience_score", "language_diversity", "average_repo_size_kb",
+        "repos_per_year", "community_engagement", "project_maintenance",
+    ),
+    "coding_patterns": (
+        "documentation_rate", "license_usage_rate", "activity_rate",
+        "total_stars_received", "total_forks_received", "active_repos_last_6_months",
+    ),
+}
+
+
+@dataclass
+class BatchMetrics:
+    """Per-user metrics for a batch of profiles, in columnar form."""
+
+    # One row per username with the coding pattern and skill metric columns
+    metrics: pd.DataFrame
+    # Long-format language counts: username, language, repo_count
+    languages: pd.DataFrame
+
+    def language_matrix(self) -> pd.DataFrame:
+        """Users x languages matrix of repository counts."""
+        return self.languages.pivot_table(
+            index="username", columns="language", values="repo_count", fill_value=0, aggfunc="sum"
+        ).reindex(self.metrics.index, fill_value=0)
+
+
+def frames_from_profiles(profiles: Dict[str, Tuple[Dict, List[Dict]]]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Build the columnar users and repos frames from collected profile data.
+
+    Args:
+        profiles: username -> (user_info, repos) as returned by
+            GitHubProfileAnalyzer._get_user_info and _get_repositories
+            (RepoRecord objects or raw repository dicts)
+
+    Returns:
+        (users, repos) DataFrames, keyed by a "username" column, with
+        pushed_at as epoch seconds
+    """
+    users = pd.DataFrame(
+        [{"username": username, **{column: user_info.get(column, default) for column, default in USER_COLUMNS.items()}}
+         for username, (user_info, _) in profiles.items()],
+        columns=["username", *USER_COLUMNS]
+    )
+
+    repos = pd.DataFrame(
+        [{"username": username, **{column: repo.get(column, default) for column, default in REPO_COLUMNS.items()}}
+         for username, (_, user_repos) in profiles.items() for repo in user_repos],
+        columns=["username", *REPO_COLUMNS]
+    )
+    # The license is a name (RepoRecord) or the raw nested object; only its presence matters here
+    repos["license"] = repos["license"].map(bool)
+    # RepoRecords carry the push time already parsed; raw dicts are parsed once here
+    repos["pushed_at"] = np.array(
+        [_pushed_at_epoch(repo) for _, user_repos in profiles.values() for repo in user_repos], dtype=np.int64
+    )
+
+    return users, repos
+
+
+def _pushed_at_epoch(repo) -> int:
+    epoch = getattr(repo, "pushed_at_epoch", None)
+    if epoch is None:
+        epoch = parse_timestamp(repo.get("pushed_at"))
+    return MISSING_EPOCH if epoch is None else epoch
+
+
+def epoch_seconds(values: pd.Series) -> np.ndarray:
+    """
+    Convert a timestamp column to int64 epoch seconds, MISSING_EPOCH where unknown.
+
+    Accepts epoch integers (from frames_from_profiles), datetime64 columns
+    (from SnapshotStore.latest_frames) and GitHub timestamp strings.
+    """
+    if pd.api.types.is_integer_dtype(values):
+        return values.to_numpy(dtype=np.int64)
+    if pd.api.types.is_numeric_dtype(values):
+        return values.fillna(MISSING_EPOCH).to_numpy(dtype=np.int64)
+    if not pd.api.types.is_datetime64_any_dtype(values):
+        values = pd.to_datetime(values, format=GITHUB_TIME_FORMAT, utc=True, errors="coerce")
+    # Naive datetimes are read as UTC, aware ones are converted to it
+    moments = values.to_numpy(dtype="datetime64[s]")
+    return np.where(np.isnat(moments), MISSING_EPOCH, moments.astype(np.int64))
+
+
+def compute_batch_metrics(users: pd.DataFrame, repos: pd.DataFrame, now: Optional[datetime] = None) -> BatchMetrics:
+    """
+    Compute coding patterns and skill metrics for many users in one vectorized pass.
+
+    Mirrors GitHubProfileAnalyzer._analyze_coding_patterns and
+    _calculate_skill_metrics without per-repository Python loops.
+
+    Args:
+        users: One row per user with username, account_age_days, followers, following
+        repos: One row per repository with username and the REPO_COLUMNS fields
+        now: Reference time for the activity window (defaults to the current time);
+            all comparisons are on int64 epoch seconds
+
+    Returns:
+        BatchMetrics indexed by username
+    """
+    activity_threshold = reference_now(now) - ACTIVITY_WINDOW_DAYS * SECONDS_PER_DAY
+
+    users = users.set_index("username")
+    n_users = len(users)
+
+    # Map every repository to its user's row once; all aggregates are then
+    # integer-keyed bincounts instead of per-column string groupbys
+    user_codes = users.index.get_indexer(repos["username"])
+    known = user_codes >= 0
+    user_codes = user_codes[known]
+    repos = repos.loc[known]
+
+    def per_user(values) -> np.ndarray:
+        return np.bincount(user_codes, weights=np.asarray(values, dtype=np.float64), minlength=n_users)
+
+    pushed_at = epoch_seconds(repos["pushed_at"])
+    documented = repos["has_wiki"].fillna(False).astype(bool) | repos["has_pages"].fillna(False).astype(bool)
+
+    total_repos = np.bincount(user_codes, minlength=n_users).astype(np.float64)
+    metrics = pd.DataFrame({
+        "total_repos": total_repos.astype(np.int64),
+        "total_stars_received": per_user(repos["stargazers_count"].fillna(0)).astype(np.int64),
+        "total_forks_received": per_user(repos["forks_count"].fillna(0)).astype(np.int64),
+        "total_open_issues": per_user(repos["open_issues_count"].fillna(0)).astype(np.int64),
+        "repos_with_documentation": per_user(documented).astype(np.int64),
+        "repos_with_license": per_user(repos["license"].fillna(False).astype(bool)).astype(np.int64),
+        "active_repos_last_6_months": per_user(pushed_at > activity_threshold).astype(np.int64),
+    }, index=users.index)
+    total_size_kb = per_user(repos["size"].fillna(0))
+
+    # Language counts as (user, language) pairs, kept sparse
+    has_language = (repos["language"].notna() & (repos["language"] != "")).to_numpy()
+    language_codes, language_names = pd.factorize(repos["language"].to_numpy()[has_language])
+    n_languages = max(len(language_names), 1)
+    pair_keys, pair_counts = np.unique(
+        user_codes[has_language].astype(np.int64) * n_languages + language_codes, return_counts=True
+    )
+    pair_users, pair_languages = np.divmod(pair_keys, n_languages)
+    languages = pd.DataFrame({
+        "username": users.index.to_numpy()[pair_users],
+        "language": np.asarray(language_names, dtype=object)[pair_languages],
+        "repo_count": pair_counts,
+    }).sort_values(["username", "repo_count"], ascending=[True, False], kind="stable").reset_index(drop=True)
+    language_diversity = np.bincount(pair_users, minlength=n_users)
+
+    has_repos = total_repos > 0
+    safe_total = np.where(has_repos, total_repos, 1.0)
+
+    def rate(column: str) -> np.ndarray:
+        return np.where(has_repos, np.round(metrics[column].to_numpy() / safe_total * 100, 2), 0)
+
+    metrics["documentation_rate"] = rate("repos_with_documentation")
+    metrics["license_usage_rate"] = rate("repos_with_license")
+    metrics["activity_rate"] = rate("active_repos_last_6_months")
+
+    account_age_years = users["account_age_days"].fillna(0).to_numpy(dtype=np.float64) / 365.25
+    has_age = account_age_years > 0
+    experience_score = (
+        np.where(has_age, np.minimum(account_age_years * 10, 30), 0)
+        + np.minimum(total_repos * 2, 40)
+        + np.minimum(metrics["total_stars_received"].to_numpy(dtype=np.float64), 30)
+    )
+
+    metrics["experience_score"] = np.round(experience_score, 1)
+    metrics["language_diversity"] = language_diversity
+    metrics["average_repo_size_kb"] = np.where(has_repos, np.round(total_size_kb / safe_total, 2), 0)
+    metrics["repos_per_year"] = np.where(has_age, np.round(total_repos / np.where(has_age, account_age_years, 1.0), 2), 0)
+    metrics["community_engagement"] = (users["followers"].fillna(0) + users["following"].fillna(0)).astype(np.int64).to_numpy()
+    metrics["project_maintenance"] = metrics["activity_rate"]
+
+    # Same thresholds as the summary block of GitHubProfileAnalyzer._run
+    metrics["activity_level"] = np.select(
+        [metrics["activity_rate"] > 50, metrics["activity_rate"] > 20], ["High", "Medium"], "Low"
+    )
+    metrics["experience_level"] = np.select(
+        [metrics["experience_score"] > 70, metrics["experience_score"] > 40], ["Senior", "Mid-level"], "Junior"
+    )
+    metrics["community_involvement"] = np.select(
+        [metrics["community_engagement"] > 100, metrics["community_engagement"] > 20], ["High", "Medium"], "Low"
+    )
+
+    return BatchMetrics(metrics=metrics, languages=languages)
+
+
+def _raw_data_summary(report: Dict[str, Any]) -> Dict[str, Any]:
+    if not isinstance(report, dict):
+        return {}
+    report = wrap_report_envelope(report)
+    for key in REPORT_ENVELOPE_KEYS:
+        section = report.get(key)
+        if isinstance(section, dict):
+            for part in RAW_DATA_PATHS[key]:
+                section = section.get(part) if isinstance(section, dict) else None
+            return section if isinstance(section, dict) else {}
+    return {}
+
+
+def metrics_from_reports(reports: Dict[str, Dict[str, Any]]) -> BatchMetrics:
+    """
+    Collect the precomputed metrics of saved reports into BatchMetrics.
+
+    Only the deterministic skill_metrics and coding_patterns blocks of each
+    report's raw data summary are read, so candidates are compared on the
+    analyzer's numbers rather than on LLM text. Missing, malformed or
+    non-numeric metrics are NaN.
+
+    Args:
+        reports: Candidate label -> parsed report in any saved format
+
+    Returns:
+        BatchMetrics indexed by candidate label, with the REPORT_METRIC_COLUMNS
+        columns and the languages_used counts as the language frame
+    """
+    columns: Dict[str, List[Any]] = {column: [] for names in REPORT_METRIC_COLUMNS.values() for column in names}
+    language_rows: Dict[str, List[Any]] = {"username": [], "language": [], "repo_count": []}
+
+    for label, report in reports.items():
+        raw = _raw_data_summary(report)
+        for block, names in REPORT_METRIC_COLUMNS.items():
+            values = raw.get(block) if isinstance(raw.get(block), dict) else {}
+            for column in names:
+                columns[column].append(values.get(column))
+
+        # Malformed sections (strings, lists) contribute no languages instead of failing the batch
+        coding_patterns = raw.get("coding_patterns") if isinstance(raw.get("coding_patterns"), dict) else {}
+        languages_used = coding_patterns.get("languages_used")
+        if isinstance(languages_used, list):
+            languages_used = dict.fromkeys((language for language in languages_used if isinstance(language, str)), 1)
+        elif not isinstance(languages_used, dict):
+            languages_used = {}
+        for language, count in languages_used.items():
+            language_rows["username"].append(label)
+            language_rows["language"].append(language)
+            language_rows["repo_count"].append(count)
+
+    metrics = pd.DataFrame(columns, index=pd.Index(list(reports), name="username")).apply(pd.to_numeric, errors="coerce")
+    languages = pd.DataFrame(language_rows)
+    languages["repo_count"] = pd.to_numeric(languages["repo_count"], errors="coerce").fillna(0).astype(np.int64)
+    return BatchMetrics(metrics=metrics, languages=languages)
@@ -0,0 +1,234 @@
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# Default database location, overridable with GITHUB_ACTIVITY_DB
+DEFAULT_ACTIVITY_DB = Path(".gitcrew") / "commit_activity.sqlite3"
+
+# Weeks kept in a repository's activity series (matches the stats endpoints)
+SERIES_WEEKS = 52
+
+# Commits per page and page cap for the paginated fallback used while
+# participation stats are still being computed (202) or unavailable
+COMMITS_PER_PAGE = 100
+DEFAULT_MAX_COMMIT_PAGES = 1
+
+
+def week_start(moment: datetime) -> datetime:
+    """Start (Sunday 00:00 UTC) of the week containing a moment, as GitHub's stats weeks are."""
+    moment = moment.astimezone(timezone.utc)
+    days_since_sunday = (moment.weekday() + 1) % 7
+    return (moment - timedelta(days=days_since_sunday)).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _series(counts: Dict[int, int], now: datetime, weeks: int = SERIES_WEEKS) -> List[int]:
+    """Counts by week start for the last `weeks` weeks, oldest first, zero-filled."""
+    first = week_start(now) - timedelta(weeks=weeks - 1)
+    return [counts.get(int((first + timedelta(weeks=i)).timestamp()), 0) for i in range(weeks)]
+
+
+def _parse_github_time(value: str) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (ValueError, AttributeError):
+        return None
+
+
+class CommitActivityStore:
+    """
+    SQLite store of weekly commit counts per repository.
+
+    Besides the counts it keeps a cursor per repository (the time up to which
+    commits are counted and the pushed_at seen then), so later collections only
+    fetch what changed. Uses an in-memory database when no path is given.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.executescript("""
+                CREATE TABLE IF NOT EXISTS commit_weeks (
+                    owner TEXT NOT NULL,
+                    repo TEXT NOT NULL,
+                    week_start INTEGER NOT NULL,
+                    commits INTEGER NOT NULL,
+                    PRIMARY KEY (owner, repo, week_start)
+                );
+                CREATE TABLE IF NOT EXISTS commit_cursors (
+                    owner TEXT NOT NULL,
+                    repo TEXT NOT NULL,
+                    counted_until TEXT NOT NULL,
+                    pushed_at TEXT NOT NULL,
+                    PRIMARY KEY (owner, repo)
+                );
+            """)
+
+    def cursor(self, owner: str, repo: str) -> Optional[Dict[str, str]]:
+        """Return {"counted_until", "pushed_at"} for a repository, if collected before."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT counted_until, pushed_at FROM commit_cursors WHERE owner = ? AND repo = ?",
+                (owner.lower(), repo)
+            ).fetchone()
+        return {"counted_until": row[0], "pushed_at": row[1]} if row else None
+
+    def replace_weeks(self, owner: str, repo: str, weeks: Dict[int, int], counted_until: str, pushed_at: str) -> None:
+        """Overwrite the given weeks with authoritative counts and move the cursor."""
+        self._write(owner, repo, weeks, counted_until, pushed_at, accumulate=False)
+
+    def add_weeks(self, owner: str, repo: str, weeks: Dict[int, int], counted_until: str, pushed_at: str) -> None:
+        """Add newly counted commits to the given weeks and move the cursor."""
+        self._write(owner, repo, weeks, counted_until, pushed_at, accumulate=True)
+
+    def _write(self, owner: str, repo: str, weeks: Dict[int, int], counted_until: str, pushed_at: str, accumulate: bool) -> None:
+        conflict = "commits = commits + excluded.commits" if accumulate else "commits = excluded.commits"
+        owner = owner.lower()
+        with self._lock, self._connection:
+            self._connection.executemany(
+                f"INSERT INTO commit_weeks (owner, repo, week_start, commits) VALUES (?, ?, ?, ?) "
+                f"ON CONFLICT (owner, repo, week_start) DO UPDATE SET {conflict}",
+                [(owner, repo, week, count) for week, count in weeks.items()]
+            )
+            self._connection.execute(
+                "INSERT INTO commit_cursors (owner, repo, counted_until, pushed_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (owner, repo) DO UPDATE SET counted_until = excluded.counted_until, pushed_at = excluded.pushed_at",
+                (owner, repo, counted_until, pushed_at)
+            )
+
+    def weekly_series(self, owner: str, repo: str, now: datetime, weeks: int = SERIES_WEEKS) -> List[int]:
+        """Commit counts for the last `weeks` weeks, oldest first, zero-filled."""
+        first = week_start(now) - timedelta(weeks=weeks - 1)
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT week_start, commits FROM commit_weeks WHERE owner = ? AND repo = ? AND week_start >= ?",
+                (owner.lower(), repo, int(first.timestamp()))
+            ).fetchall()
+        return _series(dict(rows), now, weeks)
+
+
+_stores: Dict[Path, CommitActivityStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_activity_store() -> CommitActivityStore:
+    """
+    Process-wide persistent store, shared by every analyzer in the process.
+
+    Analyzers are created per API request and per background job, so the
+    activity collected by one run is only reused by the next through this
+    file-backed store.
+    """
+    key = Path(os.getenv("GITHUB_ACTIVITY_DB") or DEFAULT_ACTIVITY_DB).resolve()
+    with _stores_lock:
+        if key not in _stores:
+            _stores[key] = CommitActivityStore(str(key))
+        return _stores[key]
+
+
+class CommitActivityCollector:
+    """
+    Builds weekly commit time series for repositories.
+
+    Uses the stats/participation endpoint (the owner's commits over the last
+    52 weeks) when GitHub has it computed, and otherwise pages through the
+    owner's commits with a `since` cursor, up to a page cap. Repositories
+    whose pushed_at has not changed since the last collection cost no
+    requests at all.
+    """
+
+    def __init__(self, make_request: Callable[..., Optional[Any]], store: Optional[CommitActivityStore] = None,
+                 max_pages: int = DEFAULT_MAX_COMMIT_PAGES):
+        self._make_request = make_request
+        self.store = store or CommitActivityStore()
+        self.max_pages = max_pages
+
+    def collect(self, owner: str, repo: str, pushed_at: str, now: Optional[datetime] = None,
+                max_pages: Optional[int] = None) -> Optional[List[int]]:
+        """
+        Return the repository's weekly commit counts for the last year, oldest first.
+
+        `max_pages` overrides the collector's commit page cap for this call;
+        0 disables the paginated fallback. Returns None when the activity is
+        unknown: nothing was ever collected and this run could not collect it.
+        A history longer than the page cap is returned as counted this run
+        (its most recent commits) but not stored.
+        """
+        now = now or datetime.now(timezone.utc)
+        max_pages = self.max_pages if max_pages is None else max_pages
+        cursor = self.store.cursor(owner, repo)
+
+        if cursor is None or cursor["pushed_at"] != (pushed_at or ""):
+            if not self._collect_participation(owner, repo, pushed_at, now) and max_pages > 0:
+                truncated = self._collect_commits(owner, repo, pushed_at, now, cursor, max_pages)
+                if truncated is not None:
+                    stored = self.store.weekly_series(owner, repo, now)
+                    return [count + extra for count, extra in zip(stored, _series(truncated, now))]
+            if cursor is None and self.store.cursor(owner, repo) is None:
+                return None
+
+        return self.store.weekly_series(owner, repo, now)
+
+    def _collect_participation(self, owner: str, repo: str, pushed_at: str, now: datetime) -> bool:
+        """Store the owner's weekly counts from stats/participation; False when unavailable."""
+        participation = self._make_request(f"repos/{owner}/{repo}/stats/participation")
+        owner_weeks = participation.get("owner") if isinstance(participation, dict) else None
+        if not owner_weeks:
+            return False
+
+        current = week_start(now)
+        weeks = {
+            int((current - timedelta(weeks=len(owner_weeks) - 1 - i)).timestamp()): count
+            for i, count in enumerate(owner_weeks)
+        }
+        self.store.replace_weeks(owner, repo, weeks, now.isoformat(), pushed_at or "")
+        return True
+
+    def _collect_commits(self, owner: str, repo: str, pushed_at: str, now: datetime, cursor: Optional[Dict[str, str]],
+                         max_pages: int) -> Optional[Dict[int, int]]:
+        """
+        Count the owner's commits since the cursor (or the series start) into weeks.
+
+        Counts are stored and the cursor moved only once every page since the
+        cursor has been read. A failed request or a history longer than
+        max_pages stores nothing, since commits come newest first and the
+        unread ones would otherwise be skipped for good; for the latter the
+        counts of the pages read are returned instead.
+        """
+        since = week_start(now) - timedelta(weeks=SERIES_WEEKS - 1)
+        # `since` is inclusive; commits exactly at a previous cursor were already counted
+        resuming = False
+        if cursor:
+            counted_until = datetime.fromisoformat(cursor["counted_until"])
+            resuming = counted_until > since
+            since = max(since, counted_until)
+
+        weeks: Dict[int, int] = {}
+        for page in range(1, max_pages + 1):
+            commits = self._make_request(
+                f"repos/{owner}/{repo}/commits",
+                params={"author": owner, "since": since.strftime("%Y-%m-%dT%H:%M:%SZ"), "per_page": COMMITS_PER_PAGE, "page": page}
+            )
+            if commits is None:
+                # Request failed (e.g. rate limited): keep the cursor so the next run retries
+                return None
+
+            for commit in commits:
+                committed_at = _parse_github_time(commit.get("commit", {}).get("author", {}).get("date", ""))
+                if committed_at is not None and (committed_at > since or (committed_at == since and not resuming)):
+                    week = int(week_start(committed_at).timestamp())
+                    weeks[week] = weeks.get(week, 0) + 1
+
+            if len(commits) < COMMITS_PER_PAGE:
+                break
+        else:
+            print(f"More than {max_pages} commit pages for {owner}/{repo}; only the latest are counted this run")
+            return weeks
+
+        self.store.add_weeks(owner, repo, weeks, now.isoformat(), pushed_at or "")
+        return None
@@ -1,9 +1,59 @@
 import requests
-import json
-from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
-from collections import Counter
+import math
+import threading
+from typing import Dict, List, Any, Iterator, Optional, TextIO, Tuple
+from datetime import datetime, timezone
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from crewai.tools import BaseTool
+from src.crew.tools.commit_activity import CommitActivityCollector, CommitActivityStore, get_activity_store
+from src.crew.tools import json_codec
+from src.crew.tools.json_stream import write_json_object
+from src.crew.tools.pydantic import AnalysisOptions
+from src.crew.tools.repo_record import RepoRecord
+from src.crew.tools.timestamps import ACTIVITY_WINDOW_DAYS, SECONDS_PER_DAY, days_between, parse_timestamp, reference_now
+
+# Language byte maps by (owner, repo, pushed_at), shared across analyses in the
+# process. A push changes pushed_at, so cached entries never go stale.
+LANGUAGE_CACHE_SIZE = 10000
+_language_cache: "OrderedDict[tuple, Dict[str, int]]" = OrderedDict()
+_language_cache_lock = threading.Lock()
+
+# Language aggregation defaults
+DEFAULT_LANGUAGE_REQUEST_BUDGET = 0   # Extra /languages requests beyond the detailed repos
+DEFAULT_LANGUAGE_WORKERS = 8          # Concurrent /languages requests
+LANGUAGE_HALF_LIFE_DAYS = 365         # Recency weight halves every year
+LANGUAGE_VECTOR_SIZE = 10             # Languages kept in the per-user vector
+
+# Weeks counted as "recent" for recent_commits_count
+RECENT_COMMIT_WEEKS = 13
+
+# Weights of the listing-data signals that rank repositories for detailed analysis
+RANK_STAR_WEIGHT = 3.0      # per log of stars
+RANK_FORK_WEIGHT = 2.0      # per log of forks
+RANK_SIZE_WEIGHT = 1.0      # per log10 of size in KB
+RANK_RECENCY_WEIGHT = 2.0   # times the recency factor (1 when just pushed)
+RANK_TOPIC_WEIGHT = 0.5     # per topic, counting at most RANK_MAX_TOPICS
+RANK_MAX_TOPICS = 4
+
+# Repositories per listing page (GitHub's maximum)
+LISTING_PAGE_SIZE = 100
+
+# Cost model for AnalysisOptions(auto=True)
+ESTIMATED_REQUEST_SECONDS = 0.5  # Typical GitHub API round trip
+DETAIL_REQUESTS_PER_REPO = 3     # Repository, participation and language requests
+UNAUTHENTICATED_RATE_LIMIT = 60  # Hourly core limit assumed when /rate_limit cannot be read
+
+# Top-level sections of an analysis, in the key order of analyze_profile
+ANALYSIS_SECTIONS = (
+    "user_profile",
+    "repository_overview",
+    "coding_patterns",
+    "language_profile",
+    "skill_metrics",
+    "summary",
+    "analysis_metadata",
+)
 
 
 class GitHubProfileAnalyzer(BaseTool):
@@ -15,8 +65,19 @@ class GitHubProfileAnalyzer(BaseTool):
     and overall development experience without requiring authentication.
     """
     
-    def __init__(self):
-        """Initialize the GitHub Profile Analyzer tool for public data only."""
+    def __init__(self, snapshot_store=None, activity_store: Optional[CommitActivityStore] = None,
+                 options: Optional[AnalysisOptions] = None):
+        """
+        Initialize the GitHub Profile Analyzer tool for public data only.
+        
+        Args:
+            snapshot_store: Optional SnapshotStore that keeps the collected user
+                and repository records in columnar form
+            activity_store: Optional CommitActivityStore; defaults to the
+                process-wide store under .gitcrew/ (see get_activity_store)
+            options: Default AnalysisOptions for analyses (including the ones
+                agents run through the tool)
+        """
         super().__init__()
         # Use instance variables instead of class attributes
         self._base_url = "https://api.github.com"
@@ -24,6 +85,12 @@ class GitHubProfileAnalyzer(BaseTool):
             "Accept": "application/vnd.github.v3+json",
             "User-Agent": "GitHubProfileAnalyzer/1.0"
         }
+        # Completed analyses by (username, options, now), so agents calling the
+        # tool reuse data already collected for this instance instead of re-fetching it
+        self._analysis_cache = {}
+        self._snapshot_store = snapshot_store
+        self._commit_activity = CommitActivityCollector(self._make_request, activity_store or get_activity_store())
+        self._options = options or AnalysisOptions()
     
     def _make_request(self, endpoint: str, params: Dict = None) -> Optional[Any]:
         """Make a request to GitHub API with error handling and rate limiting."""
@@ -48,7 +115,7 @@ class GitHubProfileAnalyzer(BaseTool):
             print(f"Request error: {e}")
             return None
     
-    def _get_user_info(self, username: str) -> Dict:
+    def _get_user_info(self, username: str, now: Optional[int] = None) -> Dict:
         """Get basic user information from public profile."""
         user_data = self._make_request(f"users/{username}")
         if not user_data:
@@ -67,26 +134,20 @@ class GitHubProfileAnalyzer(BaseTool):
             "following": user_data.get("following", 0),
             "created_at": user_data.get("created_at", ""),
             "updated_at": user_data.get("updated_at", ""),
-            "account_age_days": self._calculate_account_age(user_data.get("created_at", "")),
+            "account_age_days": self._calculate_account_age(user_data.get("created_at", ""), now),
             "avatar_url": user_data.get("avatar_url", ""),
             "html_url": user_data.get("html_url", "")
         }
     
-    def _calculate_account_age(self, created_at: str) -> int:
-        """Calculate account age in days."""
-        if not created_at:
-            return 0
-        try:
-            created_date = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-            return (datetime.now().replace(tzinfo=created_date.tzinfo) - created_date).days
-        except:
-            return 0
+    def _calculate_account_age(self, created_at: str, now: Optional[int] = None) -> int:
+        """Calculate account age in days (0 when created_at is missing or malformed)."""
+        return max(days_between(parse_timestamp(created_at), reference_now() if now is None else now), 0)
     
-    def _get_repositories(self, username: str, max_repos: int = 100) -> List[Dict]:
-        """Get public repositories for a user (limited to avoid rate limits)."""
+    def _get_repositories(self, username: str, max_repos: int = 100) -> List[RepoRecord]:
+        """Get public repositories for a user (limited to avoid rate limits), as compact records."""
         repos = []
         page = 1
-        per_page = min(30, max_repos)  # Limit to avoid rate limiting
+        per_page = min(LISTING_PAGE_SIZE, max_repos)  # Fewest requests for the listing
         
         while len(repos) < max_repos:
             repo_data = self._make_request(
@@ -102,7 +163,8 @@ class GitHubProfileAnalyzer(BaseTool):
             if not repo_data or len(repo_data) == 0:
                 break
                 
-            repos.extend(repo_data)
+            # Keep only the fields the analysis reads, not the full API objects
+            repos.extend(RepoRecord.from_api(repo) for repo in repo_data)
             
             if len(repo_data) < per_page:
                 break
@@ -111,21 +173,141 @@ class GitHubProfileAnalyzer(BaseTool):
             
         return repos[:max_repos]
     
-    def _analyze_repository_languages(self, username: str, repo_name: str) -> Dict:
-        """Get languages used in a repository."""
+    def _cached_repository_languages(self, username: str, repo_name: str, pushed_at: str = "") -> Optional[Dict]:
+        """Languages of a repository from the process-wide cache, or None when not cached."""
+        if not pushed_at:
+            return None
+        cache_key = (username.lower(), repo_name, pushed_at)
+        with _language_cache_lock:
+            if cache_key in _language_cache:
+                _language_cache.move_to_end(cache_key)
+                return _language_cache[cache_key]
+        return None
+    
+    def _analyze_repository_languages(self, username: str, repo_name: str, pushed_at: str = "") -> Dict:
+        """Get languages used in a repository, served from the process-wide cache when possible."""
+        cached = self._cached_repository_languages(username, repo_name, pushed_at)
+        if cached is not None:
+            return cached
+        
+        cache_key = (username.lower(), repo_name, pushed_at)
         languages = self._make_request(f"repos/{username}/{repo_name}/languages")
-        return languages or {}
+        if languages is None:
+            # Failed requests (rate limits, errors) are not cached
+            return {}
+        
+        if pushed_at:
+            with _language_cache_lock:
+                _language_cache[cache_key] = languages
+                if len(_language_cache) > LANGUAGE_CACHE_SIZE:
+                    _language_cache.popitem(last=False)
+        return languages
+    
+    def _repository_weight(self, repo: RepoRecord, now: int) -> float:
+        """Weight of a repository's languages in the vector, by recency of its last push (epoch seconds) and size."""
+        if repo.pushed_at_epoch is None:
+            return 0.0
+        age_days = max(days_between(repo.pushed_at_epoch, now), 0)
+        recency = 0.5 ** (age_days / LANGUAGE_HALF_LIFE_DAYS)
+        return recency * math.log2(2 + (repo.size or 0))
     
-    def _get_repository_stats(self, username: str, repo_name: str) -> Dict:
+    def _rank_repositories(self, repos: List[RepoRecord], now: int) -> List[RepoRecord]:
+        """
+        Order repositories by how much they tell about the developer, using listing data only.
+        
+        Forks and archived repositories are dropped. The rest are scored on
+        stars, forks, size, recency of the last push and topics, so the
+        expensive detailed requests go to substantial, maintained projects
+        rather than to whatever was touched most recently.
+        """
+        def score(repo: RepoRecord) -> float:
+            age_days = max(days_between(repo.pushed_at_epoch, now), 0) if repo.pushed_at_epoch is not None else None
+            recency = 0.5 ** (age_days / LANGUAGE_HALF_LIFE_DAYS) if age_days is not None else 0.0
+            return (
+                RANK_STAR_WEIGHT * math.log1p(repo.stargazers_count)
+                + RANK_FORK_WEIGHT * math.log1p(repo.forks_count)
+                + RANK_SIZE_WEIGHT * math.log10(1 + (repo.size or 0))
+                + RANK_RECENCY_WEIGHT * recency
+                + RANK_TOPIC_WEIGHT * min(len(repo.topics), RANK_MAX_TOPICS)
+            )
+        
+        candidates = [repo for repo in repos if not repo.fork and not repo.archived]
+        return sorted(candidates, key=score, reverse=True)
+    
+    def _aggregate_languages(self, username: str, repos: List[RepoRecord],
+                             known: Optional[Dict[str, Dict]] = None,
+                             request_budget: int = DEFAULT_LANGUAGE_REQUEST_BUDGET,
+                             max_workers: int = DEFAULT_LANGUAGE_WORKERS,
+                             now: Optional[int] = None) -> Dict:
+        """
+        Merge language byte counts across a user's repositories.
+        
+        Forks and archived repositories are skipped. The languages already in
+        `known` (by repository name, from the detailed repositories) and the
+        ones in the process-wide cache cost nothing; of the rest, at most
+        `request_budget` repositories, in _rank_repositories order, have their
+        languages fetched concurrently. Each repository's language shares are
+        weighted by recency and log size to build the vector.
+        
+        Returns:
+            Dict: language_bytes (raw totals), language_vector (weighted shares of
+            the top languages, summing to 1) and sampling counts
+        """
+        now = reference_now() if now is None else now
+        known = known or {}
+        candidates = self._rank_repositories(repos, now)
+        
+        sampled = []
+        to_fetch = []
+        for repo in candidates:
+            languages = known.get(repo.name)
+            if languages is None:
+                languages = self._cached_repository_languages(username, repo.name, repo.pushed_at)
+            if languages is not None:
+                sampled.append((repo, languages))
+            elif len(to_fetch) < request_budget:
+                to_fetch.append(repo)
+        
+        def fetch(repo: RepoRecord) -> Dict:
+            return self._analyze_repository_languages(username, repo.name, repo.pushed_at)
+        
+        if to_fetch:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(to_fetch)))) as executor:
+                sampled.extend(zip(to_fetch, executor.map(fetch, to_fetch)))
+        
+        language_bytes = Counter()
+        scores = Counter()
+        for repo, languages in sampled:
+            weight = self._repository_weight(repo, now)
+            repo_bytes = sum(languages.values())
+            if not repo_bytes:
+                continue
+            language_bytes.update(languages)
+            for language, count in languages.items():
+                scores[language] += weight * count / repo_bytes
+        
+        top_scores = scores.most_common(LANGUAGE_VECTOR_SIZE)
+        total_score = sum(score for _, score in top_scores)
+        
+        return {
+            "language_bytes": dict(language_bytes.most_common()),
+            "language_vector": {language: round(score / total_score, 4) for language, score in top_scores} if total_score else {},
+            "repos_sampled": sum(1 for _, languages in sampled if languages),
+            "repos_eligible": len(candidates)
+        }
+    
+    def _get_repository_stats(self, username: str, repo_name: str, now: Optional[int] = None,
+                              max_commit_pages: Optional[int] = None) -> Dict:
         """Get basic stats for a repository."""
         repo_data = self._make_request(f"repos/{username}/{repo_name}")
         if not repo_data:
             return {}
         
-        # Get recent commits (limited to avoid rate limits)
-        commits = self._make_request(
-            f"repos/{username}/{repo_name}/commits",
-            params={"per_page": 10}  # Limited to recent commits
+        # Weekly commit series for the last year, collected incrementally
+        weekly_commits = self._commit_activity.collect(
+            username, repo_name, repo_data.get("pushed_at", ""),
+            now=datetime.fromtimestamp(now, timezone.utc) if now is not None else None,
+            max_pages=max_commit_pages
         )
         
         return {
@@ -148,10 +330,12 @@ class GitHubProfileAnalyzer(BaseTool):
             "disabled": repo_data.get("disabled", False),
             "license": repo_data.get("license", {}).get("name", "") if repo_data.get("license") else "",
             "topics": repo_data.get("topics", []),
-            "recent_commits_count": len(commits) if commits else 0
+            # None when the activity is not known yet, so it does not read as inactivity
+            "recent_commits_count": sum(weekly_commits[-RECENT_COMMIT_WEEKS:]) if weekly_commits is not None else None,
+            "weekly_commits": weekly_commits
         }
     
-    def _analyze_coding_patterns(self, repos: List[Dict]) -> Dict:
+    def _analyze_coding_patterns(self, repos: List[RepoRecord], now: Optional[int] = None) -> Dict:
         """Analyze coding patterns from repository data."""
         languages = Counter()
         topics = Counter()
@@ -162,36 +346,32 @@ class GitHubProfileAnalyzer(BaseTool):
         has_license = 0
         active_repos = 0
         
-        # Calculate activity threshold (last 6 months)
-        six_months_ago = datetime.now() - timedelta(days=180)
+        # Calculate activity threshold (last 6 months) as epoch seconds
+        six_months_ago = (reference_now() if now is None else now) - ACTIVITY_WINDOW_DAYS * SECONDS_PER_DAY
         
         for repo in repos:
             # Count languages
-            if repo.get("language"):
-                languages[repo["language"]] += 1
+            if repo.language:
+                languages[repo.language] += 1
             
             # Count topics
-            topics.update(repo.get("topics", []))
+            topics.update(repo.topics)
             
             # Aggregate stats
-            total_stars += repo.get("stargazers_count", 0)
-            total_forks += repo.get("forks_count", 0)
-            total_issues += repo.get("open_issues_count", 0)
+            total_stars += repo.stargazers_count
+            total_forks += repo.forks_count
+            total_issues += repo.open_issues_count
             
             # Check for documentation and license
-            if repo.get("has_wiki") or repo.get("has_pages"):
+            if repo.has_wiki or repo.has_pages:
                 has_documentation += 1
             
-            if repo.get("license"):
+            if repo.license:
                 has_license += 1
             
-            # Check activity (updated in last 6 months)
-            try:
-                last_push = datetime.fromisoformat(repo.get("pushed_at", "").replace('Z', '+00:00'))
-                if last_push.replace(tzinfo=None) > six_months_ago:
-                    active_repos += 1
-            except:
-                pass
+            # Check activity (pushed in last 6 months); unknown push times never count
+            if repo.pushed_at_epoch is not None and repo.pushed_at_epoch > six_months_ago:
+                active_repos += 1
         
         return {
             "languages_used": dict(languages.most_common()),
@@ -207,7 +387,7 @@ class GitHubProfileAnalyzer(BaseTool):
             "activity_rate": round(active_repos / len(repos) * 100, 2) if repos else 0
         }
     
-    def _calculate_skill_metrics(self, user_info: Dict, repos: List[Dict], coding_patterns: Dict) -> Dict:
+    def _calculate_skill_metrics(self, user_info: Dict, repos: List[RepoRecord], coding_patterns: Dict) -> Dict:
         """Calculate skill metrics based on available data."""
         total_repos = len(repos)
         account_age_years = user_info.get("account_age_days", 0) / 365.25
@@ -224,7 +404,7 @@ class GitHubProfileAnalyzer(BaseTool):
         num_languages = len(coding_patterns.get("languages_used", {}))
         
         # Project complexity estimation
-        avg_repo_size = sum(repo.get("size", 0) for repo in repos) / total_repos if repos else 0
+        avg_repo_size = sum(repo.size for repo in repos) / total_repos if repos else 0
         
         return {
             "experience_score": round(experience_score, 1),
@@ -235,72 +415,211 @@ class GitHubProfileAnalyzer(BaseTool):
             "project_maintenance": coding_patterns.get("activity_rate", 0)
         }
     
-    def _run(self, username: str) -> str:
+    def _run(self, username: str, options: Optional[AnalysisOptions] = None) -> str:
         """
         Main method to analyze a GitHub user's profile.
         
         Args:
             username (str): GitHub username to analyze
+            options (AnalysisOptions, optional): Request budgets; defaults to
+                the options the tool was created with
             
         Returns:
             str: JSON string containing comprehensive analysis
         """
+        return json_codec.dumps(self.analyze_profile(username, options=options), indent=2)
+    
+    def resolve_options(self, options: Optional[AnalysisOptions] = None) -> AnalysisOptions:
+        """
+        Return the concrete limits for an analysis.
+        
+        Options without auto are returned unchanged. In auto mode the remaining
+        core rate limit is read from /rate_limit (which does not count against
+        it) and the detailed repositories, extra language requests and commit
+        pages are lowered, never raised, until the estimated request count fits the
+        remaining budget and the estimated time fits latency_target_seconds.
+        Detailed repositories are funded first. Cached language maps cost no
+        requests, so the estimate is an upper bound. When /rate_limit cannot
+        be read, the full unauthenticated hourly limit is assumed.
+        """
+        options = options or self._options
+        if not options.auto:
+            return options
+        
+        rate_limit = self._make_request("rate_limit")
+        core = rate_limit.get("resources", {}).get("core", {}) if isinstance(rate_limit, dict) else {}
+        remaining = core.get("remaining")
+        if not isinstance(remaining, int):
+            print(f"Rate limit unavailable; assuming {UNAUTHENTICATED_RATE_LIMIT} remaining requests")
+            remaining = UNAUTHENTICATED_RATE_LIMIT
+        
+        # Every analysis fetches the profile and the listing pages
+        fixed_requests = 1 + math.ceil(options.max_repos / LISTING_PAGE_SIZE)
+        request_budget = max(remaining - fixed_requests, 0)
+        # Sequential request slots within the latency target
+        time_slots = max(int(options.latency_target_seconds / ESTIMATED_REQUEST_SECONDS) - fixed_requests, 0)
+        
+        detailed_repos = min(options.detailed_repos, request_budget // DETAIL_REQUESTS_PER_REPO,
+                             time_slots // DETAIL_REQUESTS_PER_REPO)
+        request_budget -= detailed_repos * DETAIL_REQUESTS_PER_REPO
+        time_slots -= detailed_repos * DETAIL_REQUESTS_PER_REPO
+        
+        # Language requests run concurrently, so each time slot fits several
+        language_budget = min(options.language_request_budget, request_budget, time_slots * DEFAULT_LANGUAGE_WORKERS)
+        request_budget -= language_budget
+        
+        # Commit pages are only spent when participation stats are missing
+        commit_pages = min(options.max_commit_pages, request_budget // max(detailed_repos, 1))
+        
+        print(f"Auto analysis limits for {remaining} remaining requests: {detailed_repos} detailed repos, "
+              f"{language_budget} language requests, {commit_pages} commit pages")
+        return options.model_copy(update={
+            "detailed_repos": detailed_repos,
+            "language_request_budget": language_budget,
+            "max_commit_pages": commit_pages,
+            "auto": False
+        })
+    
+    def analyze_profile(self, username: str, now: Optional[datetime] = None,
+                        options: Optional[AnalysisOptions] = None) -> Dict:
+        """
+        Analyze a GitHub user's profile and return the analysis as a dict.
+        
+        This is the deterministic part of the pipeline (no LLM involved) and
+        backs both the tool output and the metrics-only analysis depth.
+        
+        Args:
+            username (str): GitHub username to analyze
+            now (datetime, optional): Reference time for every date computation
+                in the run; fixing it makes results reproducible
+            options (AnalysisOptions, optional): Request budgets; defaults to
+                the options the tool was created with
+            
+        Returns:
+            Dict: Comprehensive analysis, or {"error": ...} on failure
+        """
+        options = options or self._options
+        # Runs at a fixed reference time are cached apart from the live ones
+        cache_key = (username, options, now)
+        if cache_key in self._analysis_cache:
+            return self._analysis_cache[cache_key]
+        
+        sections = dict(self.iter_analysis_sections(username, now, options))
+        if "error" in sections:
+            return sections
+        
+        analysis = {name: sections[name] for name in ANALYSIS_SECTIONS}
+        self._analysis_cache[cache_key] = analysis
+        return analysis
+    
+    def stream_profile(self, username: str, stream: TextIO, indent: Optional[int] = 2,
+                       now: Optional[datetime] = None, options: Optional[AnalysisOptions] = None) -> None:
+        """
+        Write the analysis to a text stream as JSON, section by section.
+        
+        Sections are written and flushed as soon as they are computed, so
+        readers can start parsing the profile and metrics while repositories
+        are still being fetched. Sections come in computation order rather
+        than the key order of analyze_profile.
+        """
+        cache_key = (username, options or self._options, now)
+        if cache_key in self._analysis_cache:
+            sections = self._analysis_cache[cache_key].items()
+        else:
+            sections = self.iter_analysis_sections(username, now, options)
+        write_json_object(sections, stream, indent)
+    
+    def iter_analysis_sections(self, username: str, now: Optional[datetime] = None,
+                               options: Optional[AnalysisOptions] = None) -> Iterator[Tuple[str, Any]]:
+        """
+        Compute the analysis lazily, yielding (section, value) pairs.
+        
+        Cheap sections derived from the profile and repository listing come
+        first; the detailed repository overview, which costs most of the API
+        requests, follows, and the language profile built from its languages
+        comes last. On failure a single ("error", message) pair is
+        yielded. Results are not cached here; analyze_profile caches them.
+        
+        All dates are compared against a single reference time taken at the
+        start of the run (`now`, defaulting to the current time). Request
+        budgets come from `options`, resolved once per run (see resolve_options).
+        """
         if not username:
-            return json.dumps({"error": "Username is required"}, indent=2)
+            yield "error", "Username is required"
+            return
         
         print(f"Analyzing GitHub profile for: {username}")
+        reference = reference_now(now)
+        options = self.resolve_options(options)
         
         # Get user information
-        user_info = self._get_user_info(username)
+        user_info = self._get_user_info(username, reference)
         if not user_info:
-            return json.dumps({"error": f"User '{username}' not found"}, indent=2)
+            yield "error", f"User '{username}' not found"
+            return
         
         print(f"Found user with {user_info.get('public_repos', 0)} public repositories")
+        yield "user_profile", user_info
         
         # Get repositories (limited to avoid rate limits)
-        repos = self._get_repositories(username, max_repos=50)
+        repos = self._get_repositories(username, max_repos=options.max_repos)
+        
+        if self._snapshot_store is not None:
+            try:
+                self._snapshot_store.append(user_info, repos)
+            except Exception as e:
+                print(f"Error storing snapshot for {username}: {e}")
+        
+        # Analyze coding patterns
+        coding_patterns = self._analyze_coding_patterns(repos, reference)
+        yield "coding_patterns", coding_patterns
         
-        # Analyze detailed repository data for top repositories
+        # Calculate skill metrics
+        skill_metrics = self._calculate_skill_metrics(user_info, repos, coding_patterns)
+        yield "skill_metrics", skill_metrics
+        
+        # Analyze detailed repository data for the top-ranked repositories
         detailed_repos = []
-        for i, repo in enumerate(repos[:10]):  # Limit to top 10 to avoid rate limits
-            repo_name = repo.get("name", "")
-            print(f"Analyzing repository {i+1}/10: {repo_name}")
+        detailed_languages = {}
+        # Ranked locally so the request budget goes to the most telling repositories
+        selected = self._rank_repositories(repos, reference)[:options.detailed_repos]
+        for i, repo in enumerate(selected):
+            repo_name = repo.name
+            print(f"Analyzing repository {i+1}/{len(selected)}: {repo_name}")
             
-            repo_stats = self._get_repository_stats(username, repo_name)
+            repo_stats = self._get_repository_stats(username, repo_name, reference, options.max_commit_pages)
             if repo_stats:
-                # Get languages for this repository
-                languages = self._analyze_repository_languages(username, repo_name)
+                # Get languages for this repository (reused by the language profile below)
+                languages = self._analyze_repository_languages(username, repo_name, repo.pushed_at)
                 repo_stats["languages"] = languages
+                detailed_languages[repo_name] = languages
                 detailed_repos.append(repo_stats)
         
-        # Analyze coding patterns
-        coding_patterns = self._analyze_coding_patterns(repos)
+        yield "repository_overview", {
+            "total_public_repos": len(repos),
+            "analyzed_repos": len(detailed_repos),
+            "top_repositories": detailed_repos[:options.top_repositories]
+        }
         
-        # Calculate skill metrics
-        skill_metrics = self._calculate_skill_metrics(user_info, repos, coding_patterns)
+        # Merge language byte counts across repositories; after the detailed
+        # repositories so their languages are reused and the core data is
+        # fetched first when the rate limit is tight
+        yield "language_profile", self._aggregate_languages(
+            username, repos, known=detailed_languages,
+            request_budget=options.language_request_budget, now=reference
+        )
         
-        # Compile comprehensive analysis
-        analysis = {
-            "user_profile": user_info,
-            "repository_overview": {
-                "total_public_repos": len(repos),
-                "analyzed_repos": len(detailed_repos),
-                "top_repositories": detailed_repos[:5]  # Show top 5
-            },
-            "coding_patterns": coding_patterns,
-            "skill_metrics": skill_metrics,
-            "summary": {
-                "primary_languages": list(coding_patterns.get("languages_used", {}).keys())[:3],
-                "specialization_areas": list(coding_patterns.get("popular_topics", {}).keys())[:5],
-                "activity_level": "High" if coding_patterns.get("activity_rate", 0) > 50 else "Medium" if coding_patterns.get("activity_rate", 0) > 20 else "Low",
-                "experience_level": "Senior" if skill_metrics.get("experience_score", 0) > 70 else "Mid-level" if skill_metrics.get("experience_score", 0) > 40 else "Junior",
-                "community_involvement": "High" if skill_metrics.get("community_engagement", 0) > 100 else "Medium" if skill_metrics.get("community_engagement", 0) > 20 else "Low"
-            },
-            "analysis_metadata": {
-                "analyzed_at": datetime.now().isoformat(),
-                "data_source": "GitHub Public API",
-                "rate_limit_considerations": "Analysis limited to public data only"
-            }
+        yield "summary", {
+            "primary_languages": list(coding_patterns.get("languages_used", {}).keys())[:3],
+            "specialization_areas": list(coding_patterns.get("popular_topics", {}).keys())[:5],
+            "activity_level": "High" if coding_patterns.get("activity_rate", 0) > 50 else "Medium" if coding_patterns.get("activity_rate", 0) > 20 else "Low",
+            "experience_level": "Senior" if skill_metrics.get("experience_score", 0) > 70 else "Mid-level" if skill_metrics.get("experience_score", 0) > 40 else "Junior",
+            "community_involvement": "High" if skill_metrics.get("community_engagement", 0) > 100 else "Medium" if skill_metrics.get("community_engagement", 0) > 20 else "Low"
         }
         
-        return json.dumps(analysis, indent=2, default=str)
\ No newline at end of file
+        yield "analysis_metadata", {
+            "analyzed_at": datetime.fromtimestamp(reference).isoformat(),
+            "data_source": "GitHub Public API",
+            "rate_limit_considerations": "Analysis limited to public data only",
+            "analysis_options": options.model_dump()
+        }
@@ -0,0 +1,117 @@
+"""
+Pluggable JSON codec for analysis data and reports
+
+Uses orjson or msgspec when installed and falls back to the standard library.
+Set GITCREW_JSON_BACKEND to "orjson", "msgspec" or "stdlib" to force a backend.
+Decode errors are always raised as json.JSONDecodeError, whatever the backend.
+The fast backends write non-ASCII text unescaped (it parses back to the same
+values) and datetimes in ISO 8601 form instead of their str().
+"""
+
+import importlib.util
+import json
+import os
+from typing import Any, Callable, Dict, Optional, Union
+
+# Preferred backends, fastest first
+BACKEND_PREFERENCE = ("orjson", "msgspec", "stdlib")
+
+JSONDecodeError = json.JSONDecodeError
+
+
+class StdlibCodec:
+    """The json module, with the options the repo has always used."""
+
+    name = "stdlib"
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any, indent: Optional[int] = None) -> str:
+        return json.dumps(obj, indent=indent, default=str)
+
+
+class OrjsonCodec:
+    """orjson; only 2-space indentation is supported natively."""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        # orjson.JSONDecodeError already subclasses json.JSONDecodeError
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any, indent: Optional[int] = None) -> str:
+        if indent not in (None, 2):
+            return json.dumps(obj, indent=indent, default=str)
+        option = self._orjson.OPT_NON_STR_KEYS | (self._orjson.OPT_INDENT_2 if indent else 0)
+        return self._orjson.dumps(obj, default=str, option=option).decode("utf-8")
+
+
+class MsgspecCodec:
+    """msgspec.json, re-indenting its compact output when asked to."""
+
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+        self._msgspec = msgspec
+        self._encoder = msgspec.json.Encoder(enc_hook=str)
+        self._decoder = msgspec.json.Decoder()
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._msgspec.DecodeError as e:
+            document = data if isinstance(data, str) else data.decode("utf-8", errors="replace")
+            raise JSONDecodeError(str(e), document, 0) from e
+
+    def dumps(self, obj: Any, indent: Optional[int] = None) -> str:
+        encoded = self._encoder.encode(obj)
+        if indent:
+            encoded = self._msgspec.json.format(encoded, indent=indent)
+        return encoded.decode("utf-8")
+
+
+CODECS: Dict[str, Callable[[], Any]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "stdlib": StdlibCodec,
+}
+
+
+def available_backends():
+    """Names of the backends importable in this environment, fastest first."""
+    return [name for name in BACKEND_PREFERENCE if name == "stdlib" or importlib.util.find_spec(name) is not None]
+
+
+def get_codec(name: Optional[str] = None):
+    """
+    Return a codec by backend name, or the fastest available one.
+
+    Raises:
+        ValueError: If the backend is unknown or not installed
+    """
+    if name is None:
+        name = available_backends()[0]
+    if name not in CODECS:
+        raise ValueError(f"Unknown JSON backend '{name}'; choose from {', '.join(BACKEND_PREFERENCE)}")
+    if name not in available_backends():
+        raise ValueError(f"JSON backend '{name}' is not installed")
+    return CODECS[name]()
+
+
+codec = get_codec(os.getenv("GITCREW_JSON_BACKEND") or None)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON text or bytes with the configured backend."""
+    return codec.loads(data)
+
+
+def dumps(obj: Any, indent: Optional[int] = None) -> str:
+    """Serialize to JSON text with the configured backend; unknown types are str()-ed."""
+    return codec.dumps(obj, indent)
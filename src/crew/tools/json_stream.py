@@ -0,0 +1,193 @@
+import codecs
+import json
+from typing import IO, Any, Iterable, Iterator, List, Optional, TextIO, Tuple
+from src.crew.tools import json_codec
+
+# Characters (or bytes) read from a stream at a time by JSONStreamReader
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+
+# Characters that can continue a number, e.g. "33" at a chunk end followed by ".5"
+_NUMBER_CHARACTERS = frozenset("0123456789+-.eE")
+
+
+def iter_json_object(sections: Iterable[Tuple[str, Any]], indent: Optional[int] = 2) -> Iterator[str]:
+    """
+    Encode (key, value) pairs as one JSON object, one chunk per section.
+
+    Each section is serialized as soon as the iterable produces it, so only
+    one section is held in encoded form at a time. Sections are encoded with
+    the configured json_codec backend; with the stdlib backend the output is
+    identical to json.dumps(dict(sections), indent=indent, default=str).
+    """
+    if indent is None:
+        opening, separator, closing, padding = "{", ", ", "}", ""
+    else:
+        opening, separator, closing, padding = "{\n", ",\n", "\n}", " " * indent
+
+    first = True
+    for key, value in sections:
+        encoded = json_codec.dumps(value, indent)
+        if padding:
+            # Strings never contain raw newlines in JSON, so every newline is structural
+            encoded = encoded.replace("\n", "\n" + padding)
+        yield f"{opening if first else separator}{padding}{json.dumps(str(key))}: {encoded}"
+        first = False
+
+    yield "{}" if first else closing
+
+
+def write_json_object(sections: Iterable[Tuple[str, Any]], stream: TextIO, indent: Optional[int] = 2) -> None:
+    """Write (key, value) pairs to a text stream as one JSON object, flushing after each section."""
+    for chunk in iter_json_object(sections, indent):
+        stream.write(chunk)
+        stream.flush()
+
+
+class JSONStreamReader:
+    """
+    Incremental decoder for one JSON document read from a text or binary stream.
+
+    The stream is read in chunks and only the text of the value being decoded
+    is buffered, so an object can be consumed member by member without the
+    whole document ever being in memory as text. Values are decoded with the
+    stdlib decoder, which is the only one that can parse a prefix of a buffer.
+    Malformed input raises json.JSONDecodeError (positions are relative to
+    the current buffer, not the document).
+    """
+
+    def __init__(self, stream: IO, chunk_size: int = STREAM_CHUNK_SIZE):
+        self._stream = stream
+        self._chunk_size = chunk_size
+        # Binary streams (uploads, zip members) are decoded as UTF-8 chunk by chunk
+        self._text_decoder = codecs.getincrementaldecoder("utf-8-sig")() if isinstance(stream.read(0), bytes) else None
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        # One entry per object opened with begin_object: True until its first member is read
+        self._open_objects: List[bool] = []
+
+    def _fill(self, size: Optional[int] = None) -> bool:
+        """Append up to size more characters to the buffer; False at end of stream."""
+        if self._eof:
+            return False
+        if self._pos:
+            # Drop the consumed prefix so the buffer only holds unread text
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+        while True:
+            raw = self._stream.read(size or self._chunk_size)
+            # A chunk ending inside a multi-byte character may decode to nothing yet
+            chunk = raw if self._text_decoder is None else self._text_decoder.decode(raw, final=not raw)
+            if chunk or not raw:
+                break
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer += chunk
+        return True
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self._buffer, self._pos)
+
+    def peek(self, size: int = 1) -> str:
+        """The next size unread characters (fewer at end of stream), without consuming them."""
+        while len(self._buffer) - self._pos < size and self._fill():
+            pass
+        return self._buffer[self._pos:self._pos + size]
+
+    def skip_whitespace(self) -> None:
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer) or not self._fill():
+                return
+
+    def at_end(self) -> bool:
+        """True when only whitespace is left in the stream."""
+        self.skip_whitespace()
+        return not self.peek()
+
+    def expect(self, text: str) -> None:
+        """Consume text after optional whitespace, or raise JSONDecodeError."""
+        self.skip_whitespace()
+        if self.peek(len(text)) != text:
+            raise self._error(f"Expecting {text!r}")
+        self._pos += len(text)
+
+    def read_line(self) -> str:
+        """Consume and return the rest of the current line, without the line break."""
+        while "\n" not in self._buffer[self._pos:] and self._fill():
+            pass
+        end = self._buffer.find("\n", self._pos)
+        end = len(self._buffer) if end < 0 else end
+        line = self._buffer[self._pos:end]
+        self._pos = min(end + 1, len(self._buffer))
+        return line.rstrip("\r")
+
+    def read_value(self) -> Any:
+        """Decode the next JSON value, reading more of the stream until it is complete."""
+        self.skip_whitespace()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                value, end = None, None
+            # A number followed by nothing but number characters may continue in the next chunk
+            if end is not None and (self._eof or not self._may_continue(value, end)):
+                self._pos = end
+                return value
+            # Double the buffered text on every retry, so large values are re-scanned only log(n) times
+            if not self._fill(max(self._chunk_size, len(self._buffer) - self._pos)):
+                if end is not None:
+                    self._pos = end
+                    return value
+                return self._decoder.raw_decode(self._buffer, self._pos)[0]
+
+    def _may_continue(self, value: Any, end: int) -> bool:
+        if end == len(self._buffer):
+            # A value ending exactly at the buffer end may be a truncated number or literal
+            return True
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return False
+        return all(character in _NUMBER_CHARACTERS for character in self._buffer[end:])
+
+    def begin_object(self) -> None:
+        """Consume the opening brace of an object whose members are then read with next_key."""
+        self.expect("{")
+        self._open_objects.append(True)
+
+    def next_key(self) -> Optional[str]:
+        """
+        Consume the next member key and its colon, or the closing brace (returning None).
+
+        The value of every returned key must be consumed, with read_value or a
+        nested begin_object, before the next call.
+        """
+        if not self._open_objects:
+            raise self._error("next_key called outside an object")
+        self.skip_whitespace()
+        if self.peek() == "}":
+            self._pos += 1
+            self._open_objects.pop()
+            return None
+        if not self._open_objects[-1]:
+            self.expect(",")
+            self.skip_whitespace()
+        if self.peek() != '"':
+            raise self._error("Expecting property name enclosed in double quotes")
+        key = self.read_value()
+        self.expect(":")
+        self._open_objects[-1] = False
+        return key
+
+    def iter_members(self) -> Iterator[Tuple[str, Any]]:
+        """Decode an object member by member, yielding (key, value) pairs as they are read."""
+        self.begin_object()
+        while True:
+            key = self.next_key()
+            if key is None:
+                return
+            yield key, self.read_value()
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 from typing import List, Dict, Optional, Union
 from datetime import datetime
 from enum import Enum
@@ -25,6 +25,40 @@ class SkillLevel(str, Enum):
     EXPERT = "Expert"
 
 
+class AnalysisDepth(str, Enum):
+    METRICS = "metrics"  # Deterministic GitHub metrics only, no LLM calls
+    SINGLE = "single"    # One consolidated LLM call
+    FULL = "full"        # Four-agent sequential crew
+
+
+class AnalysisOptions(BaseModel):
+    """
+    Request budgets for one GitHub profile analysis.
+    
+    The defaults keep an analysis close to the requests the analyzer has always
+    made: three per detailed repository, plus one commits page for each whose
+    participation stats GitHub is still computing. With auto=True the
+    analyzer lowers the request-heavy limits to fit the remaining GitHub rate
+    limit and the latency target.
+    
+    The language profile always merges the full /languages breakdowns of the
+    detailed repositories and of any repository already in the process-wide
+    language cache. language_request_budget only adds uncached repositories
+    beyond those, so the default of 0 samples the detailed repositories
+    rather than all of them, keeping a default analysis under the
+    unauthenticated rate limit.
+    """
+    model_config = ConfigDict(frozen=True)
+    
+    max_repos: int = Field(default=50, ge=1, le=1000, description="Repositories listed and used for patterns and metrics")
+    detailed_repos: int = Field(default=10, ge=0, le=100, description="Repositories fetched in detail (stats and commit activity)")
+    top_repositories: int = Field(default=5, ge=0, le=100, description="Detailed repositories included in the output")
+    max_commit_pages: int = Field(default=1, ge=0, le=10, description="Commit pages per repository when participation stats are unavailable")
+    language_request_budget: int = Field(default=0, ge=0, le=1000, description="Extra repositories whose language breakdown is fetched, beyond the detailed and cached ones (0 samples only those)")
+    auto: bool = Field(default=False, description="Pick limits from the current rate-limit budget and the latency target")
+    latency_target_seconds: float = Field(default=30.0, gt=0, description="Target analysis time used by auto mode")
+
+
 class ExecutiveSummary(BaseModel):
     overview: str = Field(..., description="High-level overview of the developer's profile")
     recommendations: List[str] = Field(..., description="Key recommendations for improvement")
@@ -55,7 +89,7 @@ class Repository(BaseModel):
     name: str = Field(..., description="Repository name")
     description: str = Field(..., description="Repository description")
     language: Optional[str] = Field(None, description="Primary programming language")
-    recent_commits_count: int = Field(..., description="Number of recent commits")
+    recent_commits_count: Optional[int] = Field(..., description="Number of recent commits (None when unknown)")
     purpose: str = Field(..., description="Purpose of the repository")
     key_aspects: str = Field(..., description="Key aspects and observations")
 
@@ -203,6 +237,32 @@ class GitHubDeveloperAnalysisReport(BaseModel):
         }
 
 
+class RepositoryInsight(BaseModel):
+    name: str = Field(..., description="Repository name, as listed in the collected data")
+    purpose: str = Field(..., description="Purpose of the repository")
+    key_aspects: str = Field(..., description="Key aspects and observations")
+
+
+class NarrativeReportSections(BaseModel):
+    """
+    The narrative parts of GitHubDeveloperAnalysisReport written by the LLM.
+    
+    Counts, rates, levels and raw data are filled in from GitHubProfileAnalyzer
+    output, so the LLM never regenerates them.
+    """
+    
+    executive_summary: ExecutiveSummary = Field(..., description="Executive summary of the analysis")
+    profile_summary: str = Field(..., description="Summary of the developer's profile")
+    technical_skills_analysis: TechnicalSkillsAnalysis = Field(..., description="Technical skills analysis")
+    repository_insights: List[RepositoryInsight] = Field(..., description="Purpose and key aspects of the top repositories")
+    repository_patterns: List[str] = Field(..., description="Observed repository patterns")
+    activity_and_engagement_assessment: ActivityAndEngagementAssessment = Field(..., description="Activity and engagement assessment")
+    strengths_and_development_areas: StrengthsAndDevelopmentAreas = Field(..., description="Strengths and development areas")
+    hiring_and_project_fit_recommendations: HiringAndProjectFitRecommendations = Field(..., description="Hiring and project fit recommendations")
+    risk_analysis_and_considerations: RiskAnalysisAndConsiderations = Field(..., description="Risk analysis and considerations")
+    actionable_next_steps: ActionableNextSteps = Field(..., description="Actionable next steps")
+
+
 # Wrapper model for the complete report
 class ReportWrapper(BaseModel):
     """
@@ -218,7 +278,7 @@ class CrewAITask(BaseModel):
     """
     task_id: str = Field(..., description="Unique task identifier")
     github_username: str = Field(..., description="GitHub username to analyze")
-    analysis_depth: str = Field(default="comprehensive", description="Analysis depth level")
+    analysis_depth: AnalysisDepth = Field(default=AnalysisDepth.FULL, description="Analysis depth level")
     output_format: str = Field(default="json", description="Output format")
     
     def create_analysis_prompt(self) -> str:
@@ -0,0 +1,83 @@
+from typing import Any, Dict, Iterator, Optional, Tuple
+from src.crew.tools.timestamps import parse_timestamp
+
+# Repository listing fields the analyzer, snapshot store and batch engine read,
+# with the value used when GitHub omits one
+REPO_FIELDS: Dict[str, Any] = {
+    "name": "",
+    "description": None,
+    "language": None,
+    "size": 0,
+    "stargazers_count": 0,
+    "watchers_count": 0,
+    "forks_count": 0,
+    "open_issues_count": 0,
+    "created_at": "",
+    "updated_at": "",
+    "pushed_at": "",
+    "fork": False,
+    "archived": False,
+    "has_wiki": False,
+    "has_pages": False,
+    "has_issues": False,
+    "license": "",
+    "topics": (),
+    "default_branch": "",
+}
+
+
+class RepoRecord:
+    """
+    Compact projection of a GitHub repository listing entry.
+
+    The API returns about a hundred fields per repository (owner object, URL
+    templates, permissions); only REPO_FIELDS are kept, in slots. The license
+    is reduced to its name and topics to a tuple, and pushed_at is parsed once
+    into pushed_at_epoch (epoch seconds, None if unknown). Records also support the
+    read-only mapping protocol (get, keys, [...]), so code written against
+    the raw dicts keeps working.
+    """
+
+    __slots__ = (*REPO_FIELDS, "pushed_at_epoch")
+
+    def __init__(self, **fields: Any):
+        for field, default in REPO_FIELDS.items():
+            setattr(self, field, fields.get(field, default))
+        self.pushed_at_epoch = parse_timestamp(self.pushed_at)
+
+    @classmethod
+    def from_api(cls, data: Dict[str, Any]) -> "RepoRecord":
+        """Project a raw /users/{username}/repos entry; null fields take their defaults."""
+        fields = {field: data[field] for field in REPO_FIELDS if data.get(field) is not None}
+        license_info = fields.pop("license", None)
+        if isinstance(license_info, dict):
+            license_info = license_info.get("name") or license_info.get("spdx_id")
+        fields["license"] = license_info or ""
+        fields["topics"] = tuple(fields.get("topics", ()))
+        return cls(**fields)
+
+    def get(self, field: str, default: Optional[Any] = None) -> Any:
+        return getattr(self, field) if field in REPO_FIELDS else default
+
+    def keys(self) -> Tuple[str, ...]:
+        return tuple(REPO_FIELDS)
+
+    def __getitem__(self, field: str) -> Any:
+        if field not in REPO_FIELDS:
+            raise KeyError(field)
+        return getattr(self, field)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(REPO_FIELDS)
+
+    def __len__(self) -> int:
+        return len(REPO_FIELDS)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict copy, with topics as a list, for JSON output."""
+        record = {field: getattr(self, field) for field in REPO_FIELDS}
+        record["topics"] = list(self.topics)
+        return record
+
+    def __repr__(self) -> str:
+        return f"RepoRecord(name={self.name!r}, language={self.language!r}, stargazers_count={self.stargazers_count})"
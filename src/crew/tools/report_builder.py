@@ -0,0 +1,139 @@
+from pathlib import Path
+from typing import Dict, List, Any, Union
+from src.crew.tools.report_catalog import get_catalog
+from src.crew.tools.report_export import export_html
+from src.crew.tools.pydantic import (
+    ActivityLevel,
+    Appendices,
+    CodingPatterns,
+    DeveloperProfileOverview,
+    ExperienceLevel,
+    GitHubDeveloperAnalysisReport,
+    NarrativeReportSections,
+    RawDataSummary,
+    ReportWrapper,
+    Repository,
+    RepositoryOverview,
+    RepositoryPortfolioReview,
+    SkillMetrics,
+    UserProfile,
+)
+
+
+def experience_level_from_score(experience_score: float) -> ExperienceLevel:
+    """Map GitHubProfileAnalyzer's 0-100 experience score onto ExperienceLevel."""
+    if experience_score > 85:
+        return ExperienceLevel.EXPERT
+    if experience_score > 70:
+        return ExperienceLevel.ADVANCED
+    if experience_score > 40:
+        return ExperienceLevel.INTERMEDIATE
+    return ExperienceLevel.BEGINNER
+
+
+def _scalar_fields(repo: Dict[str, Any]) -> Dict[str, Union[str, int, None]]:
+    """Keep only the scalar fields of a detailed repository record."""
+    return {key: value for key, value in repo.items() if value is None or isinstance(value, (str, int))}
+
+
+def build_raw_data_summary(analysis: Dict[str, Any]) -> RawDataSummary:
+    """Build the appendices' raw data summary straight from analyzer output."""
+    repository_overview = analysis.get("repository_overview", {})
+
+    return RawDataSummary(
+        user_profile=UserProfile.model_validate(analysis["user_profile"]),
+        repository_overview=RepositoryOverview(
+            total_public_repos=repository_overview.get("total_public_repos", 0),
+            analyzed_repos=repository_overview.get("analyzed_repos", 0),
+            top_repositories=[_scalar_fields(repo) for repo in repository_overview.get("top_repositories", [])]
+        ),
+        coding_patterns=CodingPatterns.model_validate(analysis["coding_patterns"]),
+        skill_metrics=SkillMetrics.model_validate(analysis["skill_metrics"])
+    )
+
+
+def build_top_repositories(analysis: Dict[str, Any], narrative: NarrativeReportSections) -> List[Repository]:
+    """Merge the LLM's repository insights into the collected top repositories by name."""
+    insights = {insight.name.lower(): insight for insight in narrative.repository_insights}
+    top_repositories = []
+
+    for repo in analysis.get("repository_overview", {}).get("top_repositories", []):
+        insight = insights.get(repo.get("name", "").lower())
+        top_repositories.append(Repository(
+            name=repo.get("name", ""),
+            description=repo.get("description") or "",
+            language=repo.get("language") or None,
+            recent_commits_count=repo.get("recent_commits_count"),
+            purpose=insight.purpose if insight else "",
+            key_aspects=insight.key_aspects if insight else ""
+        ))
+
+    return top_repositories
+
+
+def assemble_report(analysis: Dict[str, Any], narrative: NarrativeReportSections) -> GitHubDeveloperAnalysisReport:
+    """
+    Assemble the complete report from analyzer output and LLM narrative.
+
+    Every count, rate, level and raw data field is copied from the
+    deterministic analysis; only the narrative comes from the LLM.
+    """
+    user_profile = analysis["user_profile"]
+    summary = analysis.get("summary", {})
+    skill_metrics = analysis.get("skill_metrics", {})
+    raw_data_summary = build_raw_data_summary(analysis)
+
+    return GitHubDeveloperAnalysisReport(
+        executive_summary=narrative.executive_summary,
+        developer_profile_overview=DeveloperProfileOverview(
+            github_profile=user_profile["html_url"],
+            name=user_profile.get("name") or user_profile.get("username", ""),
+            account_age_days=user_profile.get("account_age_days", 0),
+            followers=user_profile.get("followers", 0),
+            following=user_profile.get("following", 0),
+            public_repos=user_profile.get("public_repos", 0),
+            primary_languages=summary.get("primary_languages", []),
+            experience_level=experience_level_from_score(skill_metrics.get("experience_score", 0)),
+            activity_level=ActivityLevel(summary.get("activity_level", ActivityLevel.LOW)),
+            community_involvement=ActivityLevel(summary.get("community_involvement", ActivityLevel.LOW)),
+            summary=narrative.profile_summary
+        ),
+        technical_skills_analysis=narrative.technical_skills_analysis,
+        repository_portfolio_review=RepositoryPortfolioReview(
+            top_repositories=build_top_repositories(analysis, narrative),
+            coding_patterns=raw_data_summary.coding_patterns,
+            repository_patterns=narrative.repository_patterns
+        ),
+        activity_and_engagement_assessment=narrative.activity_and_engagement_assessment,
+        strengths_and_development_areas=narrative.strengths_and_development_areas,
+        hiring_and_project_fit_recommendations=narrative.hiring_and_project_fit_recommendations,
+        risk_analysis_and_considerations=narrative.risk_analysis_and_considerations,
+        actionable_next_steps=narrative.actionable_next_steps,
+        appendices=Appendices(
+            raw_data_summary=raw_data_summary,
+            rate_limit_considerations=analysis.get("analysis_metadata", {}).get("rate_limit_considerations", "")
+        )
+    )
+
+
+def save_report(report: GitHubDeveloperAnalysisReport, github_username: str, directory: Path = Path(".")) -> Path:
+    """
+    Write the report as github_analysis_report_{username}.json in the {"report": ...} envelope.
+
+    The file is replaced atomically, added to the report catalog and
+    pre-rendered to a static HTML page beside it, so viewers never render it.
+    """
+    report_path = Path(directory) / f"github_analysis_report_{github_username}.json"
+    temp_path = report_path.with_name(f".{report_path.name}.tmp")
+    temp_path.write_text(ReportWrapper(report=report).model_dump_json(indent=2), encoding="utf-8")
+    temp_path.replace(report_path)
+
+    try:
+        get_catalog().record(report_path)
+    except Exception as e:
+        print(f"Error indexing {report_path}: {e}")
+    try:
+        export_html(report_path)
+    except Exception as e:
+        print(f"Error exporting {report_path}: {e}")
+    return report_path
@@ -0,0 +1,548 @@
+"""
+Indexed catalog of github_analysis_report_*.json files
+
+The catalog is a SQLite database holding each report's path, size, mtime and
+summary fields (username, name, date, levels, languages, scores). Refreshing
+it stats every directory once and only lists and parses directories whose
+mtime changed, so the Streamlit sidebar no longer walks the whole tree on
+every rerun. query() filters, sorts and pages the summaries in SQL, so the
+report browser never opens the JSON files themselves. Reports brought in by
+the bulk importer (report_import) are stored under IMPORT_DIR_NAME and the
+catalog remembers each imported source file, so unchanged sources are
+skipped when an archive is imported again.
+"""
+
+import fnmatch
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from src.crew.tools import json_codec
+from src.crew.tools.report_parsing import REPORT_ENVELOPE_KEYS, strip_markdown_fences, wrap_report_envelope
+from src.crew.tools.timestamps import parse_timestamp
+
+REPORT_PATTERN = "github_analysis_report_*.json"
+
+# Directories never scanned, besides every dot-directory
+EXCLUDED_DIRS = {"__pycache__", "node_modules", "venv", "site-packages"}
+
+# Catalog location relative to the scanned root, overridable with GITCREW_REPORT_CATALOG
+DEFAULT_CATALOG_NAME = Path(".gitcrew") / "report_catalog.sqlite3"
+
+# Directory under the root that imported reports are stored in
+IMPORT_DIR_NAME = "imported_reports"
+
+# Bumped whenever the tables change; an older catalog is dropped and rebuilt by the next refresh
+CATALOG_VERSION = 3
+
+# Minimum seconds between directory scans, so reruns in quick succession stay in memory
+REFRESH_INTERVAL = 2.0
+
+# Where each summary field lives in each report format, first match wins
+SUMMARY_PATHS: Dict[str, Dict[str, List[Tuple[str, ...]]]] = {
+    "report": {
+        "username": [("appendices", "raw_data_summary", "user_profile", "username")],
+        "developer_name": [("developer_profile_overview", "name")],
+        "report_date": [],  # Not recorded in this format; the file mtime stands in
+        "experience_level": [("developer_profile_overview", "experience_level")],
+        "activity_level": [("developer_profile_overview", "activity_level")],
+        "primary_languages": [("developer_profile_overview", "primary_languages")],
+        "experience_score": [("appendices", "raw_data_summary", "skill_metrics", "experience_score")],
+        "activity_rate": [("appendices", "raw_data_summary", "coding_patterns", "activity_rate")],
+    },
+    "skill_assessment_report": {
+        "username": [("developer_username",), ("github_username",),
+                     ("developer_profile_overview", "personal_information", "username")],
+        "developer_name": [("developer_name",), ("developer_profile_overview", "personal_information", "name")],
+        "report_date": [("report_generated",), ("assessment_date",), ("analysis_date",)],
+        "experience_level": [("experience_level_classification", "level"),
+                             ("developer_skill_assessment_summary", "experience_level")],
+        "activity_level": [("appendices", "raw_data_summaries", "summary", "activity_level")],
+        "primary_languages": [("developer_skill_assessment_summary", "primary_languages"),
+                              ("technical_skills_analysis", "programming_languages")],
+        "experience_score": [("appendices", "raw_data_summaries", "skill_metrics", "experience_score")],
+        "activity_rate": [("appendices", "raw_data_summaries", "coding_patterns", "activity_rate")],
+    },
+    "github_analysis_report": {
+        "username": [("2_developer_overview", "username")],
+        "developer_name": [("2_developer_overview", "name")],
+        "report_date": [("report_date",), ("analysis_metadata", "analyzed_at")],
+        "experience_level": [("2_developer_overview", "key_metrics", "experience_level")],
+        "activity_level": [("2_developer_overview", "key_metrics", "activity_level")],
+        "primary_languages": [("2_developer_overview", "key_metrics", "primary_languages"),
+                              ("3_technical_skills_breakdown", "programming_languages")],
+        "experience_score": [("appendices", "raw_data_summary", "skill_metrics", "experience_score")],
+        "activity_rate": [("appendices", "raw_data_summary", "coding_patterns", "activity_rate")],
+    },
+}
+
+SUMMARY_COLUMNS = (
+    "username", "developer_name", "report_date", "experience_level", "activity_level",
+    "primary_languages", "experience_score", "activity_rate",
+)
+
+# query() sort keys and the SQL they order by; the path breaks ties so pages are stable
+SORT_COLUMNS = {
+    "name": "name COLLATE NOCASE",
+    "developer_name": "developer_name COLLATE NOCASE",
+    "report_date": "report_epoch",
+    "modified": "mtime_ns",
+    "experience_score": "experience_score",
+    "activity_rate": "activity_rate",
+}
+
+ENTRY_COLUMNS = (
+    "path, name, directory, size, mtime_ns, report_format, username, developer_name, report_date, "
+    "experience_level, activity_level, primary_languages, experience_score, activity_rate, error"
+)
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    """One indexed report file and its summary fields."""
+
+    path: str
+    name: str
+    directory: str
+    size: int
+    mtime_ns: int
+    report_format: Optional[str]
+    username: Optional[str]
+    developer_name: Optional[str]
+    report_date: Optional[str]
+    experience_level: Optional[str]
+    activity_level: Optional[str]
+    primary_languages: Tuple[str, ...]
+    experience_score: Optional[float]
+    activity_rate: Optional[float]
+    error: Optional[str]
+
+    @property
+    def modified_at(self) -> datetime:
+        return datetime.fromtimestamp(self.mtime_ns / 1e9)
+
+
+@dataclass(frozen=True)
+class ImportedFile:
+    """One source file taken in by the bulk importer, and where its report is stored."""
+
+    source_path: str
+    size: int
+    mtime_ns: int
+    # sha256 of the report's canonical JSON; reports with equal content share one stored file
+    content_hash: str
+    stored_path: str
+
+
+def _lookup(data: Dict[str, Any], path: Tuple[str, ...]) -> Any:
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def _language_list(value: Any) -> Tuple[str, ...]:
+    """Accept languages as a list, a {language: details} dict or a comma-separated string."""
+    if isinstance(value, dict):
+        value = list(value)
+    elif isinstance(value, str):
+        value = value.split(",")
+    if not isinstance(value, list):
+        return ()
+    return tuple(str(language).strip() for language in value if str(language).strip())
+
+
+def _number(value: Any) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def summarize_report(data: Dict[str, Any], filename: str = "") -> Dict[str, Any]:
+    """
+    Extract the catalog's summary fields from a parsed report in any known format.
+
+    Missing fields are None; the username falls back to the one in the
+    github_analysis_report_{username}.json file name.
+    """
+    data = wrap_report_envelope(data)
+    report_format = next((key for key in REPORT_ENVELOPE_KEYS if isinstance(data.get(key), dict)), None)
+    summary: Dict[str, Any] = {"report_format": report_format}
+
+    for column in SUMMARY_COLUMNS:
+        value = None
+        if report_format:
+            for path in SUMMARY_PATHS[report_format][column]:
+                value = _lookup(data[report_format], path)
+                if value not in (None, "", [], {}):
+                    break
+        summary[column] = value
+
+    if not summary["username"] and filename.startswith("github_analysis_report_"):
+        summary["username"] = filename[len("github_analysis_report_"):].rsplit(".", 1)[0]
+
+    summary["primary_languages"] = _language_list(summary["primary_languages"])
+    summary["experience_score"] = _number(summary["experience_score"])
+    summary["activity_rate"] = _number(summary["activity_rate"])
+    for column in ("username", "developer_name", "report_date", "experience_level", "activity_level"):
+        if summary[column] is not None:
+            summary[column] = str(summary[column])
+    return summary
+
+
+class ReportCatalog:
+    """
+    SQLite index of report files under a root directory.
+
+    refresh() stats each directory; a directory whose mtime is unchanged is
+    not listed again (its known subdirectories are still visited), and only
+    report files whose size or mtime changed are re-parsed. Writers call
+    record() so a report rewritten in place is indexed without a scan.
+    """
+
+    def __init__(self, root: Path = Path("."), path: Optional[Path] = None):
+        self.root = Path(root)
+        self.path = Path(path) if path else self.root / DEFAULT_CATALOG_NAME
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._refreshed_at: Optional[float] = None
+        self._connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._connection:
+            if self._connection.execute("PRAGMA user_version").fetchone()[0] != CATALOG_VERSION:
+                # The catalog only caches what is on disk, so an outdated one is simply rebuilt
+                self._connection.executescript("""
+                    DROP TABLE IF EXISTS reports;
+                    DROP TABLE IF EXISTS report_languages;
+                    DROP TABLE IF EXISTS directories;
+                    DROP TABLE IF EXISTS imports;
+                """)
+                self._connection.execute(f"PRAGMA user_version = {CATALOG_VERSION}")
+            self._connection.executescript("""
+                CREATE TABLE IF NOT EXISTS reports (
+                    path TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    directory TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    report_format TEXT,
+                    username TEXT,
+                    developer_name TEXT,
+                    report_date TEXT,
+                    report_epoch INTEGER NOT NULL,
+                    experience_level TEXT,
+                    activity_level TEXT,
+                    primary_languages TEXT NOT NULL DEFAULT '[]',
+                    experience_score REAL,
+                    activity_rate REAL,
+                    error TEXT
+                );
+                CREATE INDEX IF NOT EXISTS reports_directory ON reports (directory);
+                CREATE INDEX IF NOT EXISTS reports_username ON reports (username);
+                CREATE INDEX IF NOT EXISTS reports_report_epoch ON reports (report_epoch);
+                CREATE INDEX IF NOT EXISTS reports_experience_level ON reports (experience_level COLLATE NOCASE);
+                CREATE INDEX IF NOT EXISTS reports_activity_level ON reports (activity_level COLLATE NOCASE);
+                CREATE TABLE IF NOT EXISTS report_languages (
+                    path TEXT NOT NULL,
+                    language TEXT NOT NULL COLLATE NOCASE,
+                    PRIMARY KEY (path, language)
+                );
+                CREATE INDEX IF NOT EXISTS report_languages_language ON report_languages (language);
+                CREATE TABLE IF NOT EXISTS directories (
+                    path TEXT PRIMARY KEY,
+                    mtime_ns INTEGER NOT NULL,
+                    subdirectories TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS imports (
+                    source_path TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    stored_path TEXT NOT NULL,
+                    imported_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS imports_content_hash ON imports (content_hash);
+            """)
+
+    def refresh(self, force: bool = False) -> int:
+        """
+        Bring the index up to date with the files on disk.
+
+        Skipped when the last refresh was less than REFRESH_INTERVAL seconds
+        ago, unless forced. Returns the number of reports added, updated or removed.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if not force and self._refreshed_at is not None and now - self._refreshed_at < REFRESH_INTERVAL:
+                return 0
+
+            known = {
+                path: (mtime_ns, subdirectories)
+                for path, mtime_ns, subdirectories in self._connection.execute(
+                    "SELECT path, mtime_ns, subdirectories FROM directories"
+                )
+            }
+            visited = set()
+            changes = 0
+            pending = [str(self.root)]
+
+            with self._connection:
+                while pending:
+                    directory = pending.pop()
+                    try:
+                        mtime_ns = os.stat(directory).st_mtime_ns
+                    except OSError:
+                        continue
+                    visited.add(directory)
+
+                    if directory in known and known[directory][0] == mtime_ns:
+                        pending.extend(json.loads(known[directory][1]))
+                        continue
+
+                    subdirectories, reports = self._list_directory(directory)
+                    changes += self._sync_directory(directory, reports)
+                    self._connection.execute(
+                        "INSERT INTO directories (path, mtime_ns, subdirectories) VALUES (?, ?, ?) "
+                        "ON CONFLICT (path) DO UPDATE SET mtime_ns = excluded.mtime_ns, subdirectories = excluded.subdirectories",
+                        (directory, mtime_ns, json.dumps(subdirectories))
+                    )
+                    pending.extend(subdirectories)
+
+                for directory in set(known) - visited:
+                    self._connection.execute(
+                        "DELETE FROM report_languages WHERE path IN (SELECT path FROM reports WHERE directory = ?)",
+                        (directory,)
+                    )
+                    changes += self._connection.execute("DELETE FROM reports WHERE directory = ?", (directory,)).rowcount
+                    self._connection.execute("DELETE FROM directories WHERE path = ?", (directory,))
+
+            self._refreshed_at = time.monotonic()
+            return changes
+
+    def _list_directory(self, directory: str) -> Tuple[List[str], List[os.DirEntry]]:
+        subdirectories, reports = [], []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith(".") and entry.name not in EXCLUDED_DIRS:
+                            subdirectories.append(entry.path)
+                    elif fnmatch.fnmatch(entry.name, REPORT_PATTERN):
+                        reports.append(entry)
+        except OSError as e:
+            print(f"Cannot list {directory}: {e}")
+        return subdirectories, reports
+
+    def _sync_directory(self, directory: str, reports: Iterable[os.DirEntry]) -> int:
+        """Re-index the changed reports of one directory and drop the deleted ones."""
+        indexed = {
+            path: (size, mtime_ns)
+            for path, size, mtime_ns in self._connection.execute(
+                "SELECT path, size, mtime_ns FROM reports WHERE directory = ?", (directory,)
+            )
+        }
+        changes = 0
+        for entry in reports:
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            if indexed.pop(entry.path, None) != (stat.st_size, stat.st_mtime_ns):
+                self._index_file(entry.path, directory, stat)
+                changes += 1
+
+        for path in indexed:
+            self._connection.execute("DELETE FROM reports WHERE path = ?", (path,))
+            self._connection.execute("DELETE FROM report_languages WHERE path = ?", (path,))
+        return changes + len(indexed)
+
+    def _index_file(self, path: str, directory: str, stat: os.stat_result) -> None:
+        name = os.path.basename(path)
+        error = None
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                data = json_codec.loads(strip_markdown_fences(file.read()))
+            summary = summarize_report(data if isinstance(data, dict) else {}, name)
+        except (OSError, UnicodeDecodeError, json_codec.JSONDecodeError) as e:
+            summary = summarize_report({}, name)
+            error = str(e)
+        self._write_entry(path, directory, stat, summary, error)
+
+    def _write_entry(self, path: str, directory: str, stat: os.stat_result,
+                     summary: Dict[str, Any], error: Optional[str] = None) -> None:
+        name = os.path.basename(path)
+        # Reports without a parseable date are dated by their file mtime
+        report_epoch = parse_timestamp(summary["report_date"])
+        if report_epoch is None:
+            report_epoch = stat.st_mtime_ns // 1_000_000_000
+
+        self._connection.execute(
+            "INSERT OR REPLACE INTO reports (path, name, directory, size, mtime_ns, report_format, username, "
+            "developer_name, report_date, report_epoch, experience_level, activity_level, primary_languages, "
+            "experience_score, activity_rate, error) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (path, name, directory, stat.st_size, stat.st_mtime_ns, summary["report_format"],
+             summary["username"], summary["developer_name"], summary["report_date"], report_epoch,
+             summary["experience_level"], summary["activity_level"], json.dumps(list(summary["primary_languages"])),
+             summary["experience_score"], summary["activity_rate"], error)
+        )
+        self._connection.execute("DELETE FROM report_languages WHERE path = ?", (path,))
+        self._connection.executemany(
+            "INSERT OR IGNORE INTO report_languages (path, language) VALUES (?, ?)",
+            [(path, language) for language in summary["primary_languages"]]
+        )
+
+    def record(self, report_path: Path) -> None:
+        """Index a report that was just written, if it lies under the catalog root."""
+        report_path = Path(report_path)
+        try:
+            relative = report_path.resolve().relative_to(self.root.resolve())
+        except ValueError:
+            return
+        # Same path strings as os.scandir produces during refresh()
+        path = os.path.join(str(self.root), str(relative))
+        with self._lock, self._connection:
+            self._index_file(path, os.path.dirname(path), os.stat(path))
+
+    def imported_files(self) -> Dict[str, ImportedFile]:
+        """Every source file imported so far, by source path."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT source_path, size, mtime_ns, content_hash, stored_path FROM imports"
+            ).fetchall()
+        return {row[0]: ImportedFile(*row) for row in rows}
+
+    def record_imports(self, imports: Iterable[Tuple[ImportedFile, Dict[str, Any]]]) -> int:
+        """
+        Record imported source files and index their stored reports, in one transaction.
+
+        Each stored report is indexed with the summary computed by the
+        importer (see summarize_report), so it is not parsed again here or by
+        the next refresh(). Returns the number of source files recorded.
+        """
+        count = 0
+        with self._lock, self._connection:
+            for imported, summary in imports:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO imports (source_path, size, mtime_ns, content_hash, stored_path, imported_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (imported.source_path, imported.size, imported.mtime_ns, imported.content_hash,
+                     imported.stored_path, time.time())
+                )
+                self._write_entry(imported.stored_path, os.path.dirname(imported.stored_path),
+                                  os.stat(imported.stored_path), summary)
+                count += 1
+        return count
+
+    def reports(self) -> List[CatalogEntry]:
+        """All indexed reports, by file name."""
+        with self._lock:
+            rows = self._connection.execute(f"SELECT {ENTRY_COLUMNS} FROM reports ORDER BY name, path").fetchall()
+        return [_entry(row) for row in rows]
+
+    def get(self, path: str) -> Optional[CatalogEntry]:
+        """The indexed entry for one report path, if any."""
+        with self._lock:
+            row = self._connection.execute(f"SELECT {ENTRY_COLUMNS} FROM reports WHERE path = ?", (path,)).fetchone()
+        return _entry(row) if row else None
+
+    def query(
+        self,
+        language: Optional[str] = None,
+        experience_level: Optional[str] = None,
+        activity_level: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        search: Optional[str] = None,
+        sort: str = "name",
+        descending: bool = False,
+        limit: int = 25,
+        offset: int = 0
+    ) -> Tuple[List[CatalogEntry], int]:
+        """
+        One page of reports matching the filters, and the total number of matches.
+
+        Filters are combined with AND and compared case-insensitively; the
+        date range is inclusive and applies to the report date (or the file
+        mtime for undated reports). search matches the file name, username or
+        developer name. Only the summary columns are read.
+        """
+        if sort not in SORT_COLUMNS:
+            raise ValueError(f"Unknown sort key {sort!r}; expected one of {', '.join(SORT_COLUMNS)}")
+
+        conditions, parameters = [], []
+        if language:
+            conditions.append("path IN (SELECT path FROM report_languages WHERE language = ?)")
+            parameters.append(language)
+        if experience_level:
+            conditions.append("experience_level = ? COLLATE NOCASE")
+            parameters.append(experience_level)
+        if activity_level:
+            conditions.append("activity_level = ? COLLATE NOCASE")
+            parameters.append(activity_level)
+        if date_from is not None:
+            conditions.append("report_epoch >= ?")
+            parameters.append(parse_timestamp(date_from))
+        if date_to is not None:
+            conditions.append("report_epoch <= ?")
+            parameters.append(parse_timestamp(date_to))
+        if search:
+            conditions.append("(name LIKE ? OR username LIKE ? OR developer_name LIKE ?)")
+            parameters.extend([f"%{search}%"] * 3)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        # NULLs sort last in both directions
+        order = f"{SORT_COLUMNS[sort].split()[0]} IS NULL, {SORT_COLUMNS[sort]} {'DESC' if descending else 'ASC'}, path"
+
+        with self._lock:
+            total = self._connection.execute(f"SELECT COUNT(*) FROM reports{where}", parameters).fetchone()[0]
+            rows = self._connection.execute(
+                f"SELECT {ENTRY_COLUMNS} FROM reports{where} ORDER BY {order} LIMIT ? OFFSET ?",
+                parameters + [limit, offset]
+            ).fetchall()
+        return [_entry(row) for row in rows], total
+
+    def facets(self) -> Dict[str, List[str]]:
+        """Distinct languages, experience levels and activity levels, for filter choices."""
+        with self._lock:
+            return {
+                "language": [row[0] for row in self._connection.execute(
+                    "SELECT language FROM report_languages GROUP BY language ORDER BY COUNT(*) DESC, language"
+                )],
+                "experience_level": [row[0] for row in self._connection.execute(
+                    "SELECT experience_level FROM reports WHERE experience_level IS NOT NULL "
+                    "GROUP BY experience_level COLLATE NOCASE ORDER BY experience_level COLLATE NOCASE"
+                )],
+                "activity_level": [row[0] for row in self._connection.execute(
+                    "SELECT activity_level FROM reports WHERE activity_level IS NOT NULL "
+                    "GROUP BY activity_level COLLATE NOCASE ORDER BY activity_level COLLATE NOCASE"
+                )],
+            }
+
+    def count(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM reports").fetchone()[0]
+
+
+def _entry(row: Tuple) -> CatalogEntry:
+    values = list(row)
+    values[11] = tuple(json.loads(values[11]))
+    return CatalogEntry(*values)
+
+
+_catalogs: Dict[Path, ReportCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_catalog(root: Path = Path(".")) -> ReportCatalog:
+    """Process-wide catalog for a root directory, shared by every Streamlit session."""
+    key = Path(root).resolve()
+    with _catalogs_lock:
+        if key not in _catalogs:
+            catalog_path = os.getenv("GITCREW_REPORT_CATALOG")
+            _catalogs[key] = ReportCatalog(Path(root), Path(catalog_path) if catalog_path else None)
+        return _catalogs[key]
@@ -0,0 +1,183 @@
+"""
+Memoized Plotly figures for the report dashboards
+
+Figures are cached by a digest of the data they are drawn from, so a
+Streamlit rerun that renders the same report again reuses the figures built
+on the first run instead of rebuilding them. The cache is process-wide and
+bounded; cached figures are shared between sessions and must not be
+modified by callers. Plotly is imported on first use.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+# Number of figures kept in the process-wide cache
+CHART_CACHE_MAX_ENTRIES = 128
+
+# Quality rates shown by the metrics bar chart, as (label, coding_patterns key)
+QUALITY_METRICS = (
+    ('Documentation Rate', 'documentation_rate'),
+    ('License Usage Rate', 'license_usage_rate'),
+    ('Activity Rate', 'activity_rate'),
+)
+
+# Metrics shown as grouped bars in the candidate comparison, as (label, metrics column)
+COMPARISON_METRICS = (
+    ('Experience Score', 'experience_score'),
+    ('Activity Rate', 'activity_rate'),
+    ('Documentation Rate', 'documentation_rate'),
+    ('License Usage Rate', 'license_usage_rate'),
+    ('Project Maintenance', 'project_maintenance'),
+)
+
+# Most used languages (over all compared candidates) shown in the comparison heatmap
+COMPARISON_MAX_LANGUAGES = 15
+
+_figures: "OrderedDict[str, Any]" = OrderedDict()
+_figures_lock = threading.Lock()
+
+
+def data_digest(kind: str, data: Any) -> str:
+    """Stable digest of a chart kind and the JSON-compatible data it plots."""
+    payload = json.dumps([kind, data], sort_keys=True, default=str, separators=(',', ':'))
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def cached_figure(kind: str, data: Any, build: Callable[[Any], Any]) -> Any:
+    """Return the cached figure for (kind, data), building it with build(data) on a miss."""
+    key = data_digest(kind, data)
+    with _figures_lock:
+        if key in _figures:
+            _figures.move_to_end(key)
+            return _figures[key]
+
+    fig = build(data)
+
+    with _figures_lock:
+        _figures[key] = fig
+        while len(_figures) > CHART_CACHE_MAX_ENTRIES:
+            _figures.popitem(last=False)
+    return fig
+
+
+def clear_chart_cache() -> None:
+    """Drop every cached figure."""
+    with _figures_lock:
+        _figures.clear()
+
+
+def _build_language_pie_chart(languages_data: Dict[str, Any]) -> Any:
+    import plotly.express as px
+
+    fig = px.pie(
+        values=list(languages_data.values()),
+        names=list(languages_data.keys()),
+        title="Programming Languages Distribution",
+        color_discrete_sequence=px.colors.qualitative.Set3
+    )
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    return fig
+
+
+def _build_metrics_bar_chart(values: list) -> Any:
+    import plotly.graph_objects as go
+
+    colors = ['green' if v >= 70 else 'orange' if v >= 40 else 'red' for v in values]
+
+    fig = go.Figure(data=[
+        go.Bar(
+            x=[label for label, _ in QUALITY_METRICS],
+            y=values,
+            marker_color=colors,
+            text=[f'{v}%' for v in values],
+            textposition='auto',
+        )
+    ])
+
+    fig.update_layout(
+        title="Repository Quality Metrics",
+        xaxis_title="Metrics",
+        yaxis_title="Percentage (%)",
+        yaxis=dict(range=[0, 100])
+    )
+
+    return fig
+
+
+def language_pie_chart(languages_data: Dict[str, Any]) -> Optional[Any]:
+    """Pie chart of language usage; None when there is nothing to plot."""
+    if not languages_data:
+        return None
+    # Key order is kept as part of the data, since it sets the slice order
+    return cached_figure("language_pie", list(languages_data.items()),
+                         lambda items: _build_language_pie_chart(dict(items)))
+
+
+def metrics_bar_chart(metrics_data: Dict[str, Any]) -> Any:
+    """Bar chart of the documentation, license and activity rates in coding_patterns."""
+    # Only the plotted values go into the cache key
+    values = [metrics_data.get(key, 0) for _, key in QUALITY_METRICS]
+    return cached_figure("metrics_bar", values, _build_metrics_bar_chart)
+
+
+def _build_comparison_chart(data: Dict[str, Any]) -> Any:
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    candidates = data["candidates"]
+    fig = make_subplots(
+        rows=2, cols=1,
+        subplot_titles=("Key Metrics", "Language Usage (% of each candidate's repositories)"),
+        vertical_spacing=0.18
+    )
+    for label, values in data["metrics"].items():
+        fig.add_trace(go.Bar(name=label, x=candidates, y=values), row=1, col=1)
+    if data["languages"]:
+        fig.add_trace(go.Heatmap(
+            z=data["language_shares"],
+            x=data["languages"],
+            y=candidates,
+            colorscale="Blues",
+            zmin=0,
+            zmax=100,
+            colorbar=dict(title="%", len=0.45, y=0.22)
+        ), row=2, col=1)
+
+    fig.update_layout(
+        title="Candidate Comparison",
+        barmode="group",
+        height=600 + 20 * len(candidates),
+        legend=dict(orientation="h", y=1.08)
+    )
+    fig.update_yaxes(title_text="Score / %", row=1, col=1)
+    return fig
+
+
+def comparison_chart(batch: Any) -> Optional[Any]:
+    """
+    One combined figure comparing candidates: grouped bars of the key metrics
+    over a candidates x languages heatmap of language shares.
+
+    Args:
+        batch: BatchMetrics from batch_metrics.metrics_from_reports
+    """
+    if batch.metrics.empty:
+        return None
+
+    metrics = batch.metrics.reindex(columns=[column for _, column in COMPARISON_METRICS])
+    matrix = batch.language_matrix()
+    top_languages = matrix.sum().sort_values(ascending=False).index[:COMPARISON_MAX_LANGUAGES]
+    totals = matrix.sum(axis=1).replace(0, 1)
+    shares = matrix[top_languages].div(totals, axis=0).mul(100).round(1)
+
+    # Plain lists, so the data can be hashed for the cache key; NaN stays a gap in the bars
+    data = {
+        "candidates": [str(candidate) for candidate in metrics.index],
+        "metrics": {label: metrics[column].round(2).tolist() for label, column in COMPARISON_METRICS},
+        "languages": [str(language) for language in top_languages],
+        "language_shares": shares.to_numpy().tolist(),
+    }
+    return cached_figure("comparison", data, _build_comparison_chart)
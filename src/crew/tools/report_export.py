@@ -0,0 +1,417 @@
+"""
+Static HTML (and optional PDF) exports of reports, cached next to the JSON
+
+A report is rendered once into a self-contained HTML page saved as
+<report>.html beside <report>.json; the dashboards and the API serve that
+file as it is instead of rendering the report on every view. The first line
+of the page records the size and mtime of the JSON it was rendered from and
+EXPORT_VERSION, so a rewritten report or a changed template is re-rendered
+on the next request. PDF export needs weasyprint and leaves out the charts,
+which are drawn by JavaScript.
+"""
+
+import html
+import importlib.util
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from src.crew.tools import report_charts
+from src.crew.tools.report_loader import load_report
+
+# Bump whenever the page layout changes, so cached exports are re-rendered
+EXPORT_VERSION = 1
+
+PLOTLY_AVAILABLE = importlib.util.find_spec("plotly") is not None
+PDF_AVAILABLE = importlib.util.find_spec("weasyprint") is not None
+
+_STAMP_PREFIX = "<!-- gitcrew-export "
+
+PAGE_STYLE = """
+body { font-family: -apple-system, "Segoe UI", Roboto, Helvetica, Arial, sans-serif; color: #262730; margin: 2rem auto; max-width: 1100px; padding: 0 1rem; line-height: 1.5; }
+h1 { color: #1f77b4; text-align: center; }
+h3 { margin-bottom: 0.4rem; }
+.section-header { font-size: 1.5rem; font-weight: bold; color: #2c3e50; margin: 2rem 0 1rem; border-bottom: 2px solid #3498db; padding-bottom: 0.5rem; }
+.success-box, .warning-box, .info-box { padding: 0.75rem 1rem; border-radius: 5px; margin: 0.4rem 0; }
+.success-box { background-color: #d4edda; color: #155724; border-left: 4px solid #28a745; }
+.warning-box { background-color: #fff3cd; color: #856404; border-left: 4px solid #ffc107; }
+.info-box { background-color: #d1ecf1; color: #0c5460; border-left: 4px solid #17a2b8; }
+.metrics { display: grid; grid-template-columns: repeat(auto-fill, minmax(170px, 1fr)); gap: 0.75rem; margin: 0.75rem 0; }
+.metric { background: #f0f2f6; border-radius: 5px; padding: 0.6rem 0.8rem; }
+.metric .label { font-size: 0.8rem; color: #555; }
+.metric .value { font-size: 1.3rem; font-weight: 600; }
+.columns { display: grid; grid-template-columns: 1fr 1fr; gap: 1.5rem; }
+details { border: 1px solid #ddd; border-radius: 5px; padding: 0.4rem 0.8rem; margin: 0.4rem 0; }
+summary { cursor: pointer; font-weight: 600; }
+@media print { details { border: none; } details > * { display: block; } }
+"""
+
+
+def _text(value: Any) -> str:
+    return html.escape(str(value))
+
+
+def _value(value: Any, suffix: str = "") -> str:
+    return "N/A" if value in (None, "") else _text(f"{value}{suffix}")
+
+
+def _metrics(pairs: Iterable[Tuple[str, Any]]) -> str:
+    cells = "".join(
+        f'<div class="metric"><div class="label">{_text(label)}</div><div class="value">{value}</div></div>'
+        for label, value in pairs
+    )
+    return f'<div class="metrics">{cells}</div>'
+
+
+def _list(items: List[Any], ordered: bool = False, empty_message: str = "") -> str:
+    if not items:
+        return f'<div class="info-box">{_text(empty_message)}</div>' if empty_message else ""
+    tag = "ol" if ordered else "ul"
+    return f"<{tag}>" + "".join(f"<li>{_text(item)}</li>" for item in items) + f"</{tag}>"
+
+
+def _boxes(items: List[Any], css_class: str, empty_message: str = "") -> str:
+    if not items:
+        return f'<div class="info-box">{_text(empty_message)}</div>' if empty_message else ""
+    return "".join(f'<div class="{css_class}">• {_text(item)}</div>' for item in items)
+
+
+def _box(text: Any, css_class: str = "info-box", label: str = "") -> str:
+    if not text:
+        return ""
+    label = f"<strong>{_text(label)}:</strong> " if label else ""
+    return f'<div class="{css_class}">{label}{_text(text)}</div>'
+
+
+def _text_map(values: Dict[str, Any]) -> str:
+    return "".join(f"<p><strong>{_text(key)}:</strong> {_text(value)}</p>" for key, value in values.items())
+
+
+def _heading(title: str, body: str) -> str:
+    return f"<h3>{title}</h3>{body}" if body else ""
+
+
+def _summary(text: str) -> str:
+    return _heading("📋 Summary", _box(text))
+
+
+def _skills(skills: Dict[str, Dict[str, str]]) -> str:
+    parts = []
+    for name, skill in skills.items():
+        title = _text(name) + (f" - {_text(skill['proficiency'])}" if skill["proficiency"] else "")
+        details = "".join(
+            f"<p><strong>{label}:</strong> {_text(skill[key])}</p>"
+            for label, key in (("Description", "description"), ("Evidence", "evidence")) if skill[key]
+        )
+        parts.append(f"<details><summary>{title}</summary>{details}</details>" if details else f"<p>• <strong>{title}</strong></p>")
+    return "".join(parts)
+
+
+def _chart(fig: Any, first_chart: List[bool]) -> str:
+    if fig is None:
+        return ""
+    # plotly.js is loaded once per page, by the first chart
+    include = "cdn" if first_chart[0] else False
+    first_chart[0] = False
+    return fig.to_html(full_html=False, include_plotlyjs=include)
+
+
+def _executive_summary(report: Dict[str, Any]) -> str:
+    summary = report["executive_summary"]
+    return (
+        _box(summary["overview"])
+        + _heading("🔍 Key Findings", _list(summary["key_findings"]))
+        + _heading("🎯 Key Recommendations", _list(summary["recommendations"], ordered=True, empty_message="No recommendations available"))
+        + '<div class="columns"><div>' + _box(summary["strengths_summary"], "success-box", "Strengths") + "</div><div>"
+        + _box(summary["weaknesses_summary"], "warning-box", "Areas for Improvement") + "</div></div>"
+    )
+
+
+def _developer_profile(report: Dict[str, Any]) -> str:
+    profile = report["developer_profile_overview"]
+    account_age = profile["account_age_days"]
+    avatar = f'<img src="{_text(profile["avatar_url"])}" alt="Avatar" width="100">' if profile["avatar_url"] else ""
+    experience = ""
+    if profile["experience_evidence"] or profile["experience_reasoning"]:
+        experience = _heading("🎓 Experience Level Classification", (
+            f"<p><strong>Evidence:</strong> {_text(profile['experience_evidence'] or 'No evidence provided')}</p>"
+            f"<p><strong>Reasoning:</strong> {_text(profile['experience_reasoning'] or 'No reasoning provided')}</p>"
+        ))
+    return (
+        avatar
+        + _metrics([
+            ("Username", _value(profile["username"])),
+            ("Name", _value(profile["name"])),
+            ("Location", _value(profile["location"])),
+            ("Account Age", f"{round(account_age / 365.25, 1)} years" if account_age else "N/A"),
+            ("Followers", _value(profile["followers"])),
+            ("Following", _value(profile["following"])),
+            ("Public Repos", _value(profile["public_repos"])),
+            ("Experience Level", _value(profile["experience_level"])),
+            ("Activity Level", _value(profile["activity_level"])),
+            ("Community Involvement", _value(profile["community_involvement"])),
+        ])
+        + _heading("💻 Primary Languages", _box(", ".join(profile["primary_languages"]), "success-box", "Languages"))
+        + _heading("📝 Bio", _box(profile["bio"]))
+        + _heading("📋 Profile Summary", f"<p>{_text(profile['summary'])}</p>" if profile["summary"] else "")
+        + experience
+        + _heading("🏆 Specialization Areas", _list(profile["specialization_areas"]) + (
+            f"<p>{_text(profile['specialization_details'])}</p>" if profile["specialization_details"] else ""
+        ) if profile["specialization_areas"] else "")
+    )
+
+
+def _technical_skills(report: Dict[str, Any]) -> str:
+    skills = report["technical_skills_analysis"]
+    return (
+        _heading("💻 Programming Languages", _skills(skills["programming_languages"])
+                 or _box("No programming language assessment available"))
+        + _heading("🛠️ Frameworks & Libraries", _skills(skills["frameworks_and_libraries"]))
+        + _heading("🧰 Tools & Technologies", _skills(skills["tools_and_technologies"]))
+        + _heading("📊 Skills Summary", _box(skills["summary"]))
+        + _heading("🎯 Areas for Development", _list(skills["skill_gaps"]))
+    )
+
+
+def _repository_portfolio(report: Dict[str, Any], include_charts: bool, first_chart: List[bool]) -> str:
+    portfolio = report["repository_portfolio_review"]
+    coding_patterns = portfolio["coding_patterns"]
+    repositories = "".join(
+        f"<details><summary>📦 {_text(repo['name'] or 'Unknown')} ({_text(repo['language'] or 'N/A')})</summary>"
+        f"<p><strong>Description:</strong> {_text(repo['description'] or 'No description')}</p>"
+        f"<p><strong>Recent Commits:</strong> {_value(repo['recent_commits_count'])}</p>"
+        + (f"<p><strong>Stars:</strong> {_value(repo['stargazers_count'])}</p>" if repo["stargazers_count"] is not None else "")
+        + (f"<p><strong>Purpose:</strong> {_text(repo['purpose'])}</p>" if repo["purpose"] else "")
+        + (f"<p><strong>Key Aspects:</strong> {_text(repo['key_aspects'])}</p>" if repo["key_aspects"] else "")
+        + "</details>"
+        for repo in portfolio["top_repositories"]
+    )
+    totals = ""
+    if portfolio["total_repos"] is not None or portfolio["analyzed_repos"] is not None:
+        totals = _metrics([("Total Repositories", _value(portfolio["total_repos"])),
+                           ("Analyzed Repositories", _value(portfolio["analyzed_repos"]))])
+    charts = ""
+    if include_charts and PLOTLY_AVAILABLE:
+        languages = coding_patterns.get("languages_used") or {}
+        charts = _chart(report_charts.language_pie_chart(languages), first_chart) if languages else ""
+        if coding_patterns:
+            charts += _chart(report_charts.metrics_bar_chart(coding_patterns), first_chart)
+    rates = ""
+    if coding_patterns and not charts:
+        rates = _metrics([
+            ("Documentation Rate", _value(coding_patterns.get("documentation_rate", 0), "%")),
+            ("License Usage Rate", _value(coding_patterns.get("license_usage_rate", 0), "%")),
+            ("Activity Rate", _value(coding_patterns.get("activity_rate", 0), "%")),
+        ])
+    return (
+        totals
+        + _heading("🌟 Top Repositories", repositories or _box("No repository information available"))
+        + _heading("🔍 Repository Patterns", _list(portfolio["repository_patterns"]))
+        + _heading("📈 Repository Metrics", charts + rates)
+        + _summary(portfolio["summary"])
+    )
+
+
+def _activity_engagement(report: Dict[str, Any]) -> str:
+    activity = report["activity_and_engagement_assessment"]
+    coding_patterns = report["repository_portfolio_review"]["coding_patterns"]
+    skill_metrics = report["appendices"]["raw_data_summary"].get("skill_metrics") or {}
+    coding = _metrics([
+        ("Active Repos (6m)", _value(coding_patterns.get("active_repos_last_6_months"))),
+        ("Activity Rate", _value(coding_patterns.get("activity_rate"), "%")),
+        ("Total Stars", _value(coding_patterns.get("total_stars_received"))),
+        ("Total Forks", _value(coding_patterns.get("total_forks_received"))),
+        ("Open Issues", _value(coding_patterns.get("total_open_issues"))),
+    ]) if coding_patterns else ""
+    skills = _metrics([
+        ("Experience Score", _value(skill_metrics.get("experience_score"), "/100")),
+        ("Language Diversity", _value(skill_metrics.get("language_diversity"))),
+        ("Community Engagement", _value(skill_metrics.get("community_engagement"))),
+        ("Repos per Year", _value(skill_metrics.get("repos_per_year"))),
+        ("Project Maintenance", _value(skill_metrics.get("project_maintenance"), "%")),
+        ("Avg Repo Size", _value(skill_metrics.get("average_repo_size_kb"), " KB")),
+    ]) if skill_metrics else ""
+    return (
+        _heading("💻 Coding Activity", coding)
+        + _heading("📈 Skill Metrics", skills)
+        + _heading("📈 Activity Metrics", _text_map(activity["activity_metrics"]))
+        + _heading("🤝 Engagement Patterns", _text_map(activity["engagement_patterns"]))
+        + _heading("💡 Recommendations", _list(activity["recommendations"]))
+        + _summary(activity["summary"])
+    )
+
+
+def _strengths_development(report: Dict[str, Any]) -> str:
+    section = report["strengths_and_development_areas"]
+    return (
+        '<div class="columns"><div>'
+        + _heading("✅ Strengths", _boxes(section["strengths"], "success-box", "No strengths specified"))
+        + "</div><div>"
+        + _heading("🎯 Areas for Improvement", _boxes(section["development_areas"], "warning-box", "No improvement areas specified"))
+        + "</div></div>"
+        + _heading("💡 Recommendations", _list(section["recommendations"]))
+        + _summary(section["summary"])
+    )
+
+
+def _hiring_recommendations(report: Dict[str, Any]) -> str:
+    hiring = report["hiring_and_project_fit_recommendations"]
+    return (
+        '<div class="columns"><div>'
+        + _heading("💼 Suitable Roles", _list(hiring["suitable_roles"], empty_message="No suitable roles specified"))
+        + "</div><div>"
+        + _heading("🚀 Suitable Projects", _list(hiring["suitable_projects"], empty_message="No suitable projects specified"))
+        + "</div></div>"
+        + _heading("🚫 Less Suitable Projects", _list(hiring["unsuitable_projects"]))
+        + _heading("📋 Hiring Recommendations", _list(hiring["recommendations"]))
+        + _heading("🤔 Considerations", _box(hiring["considerations"], "warning-box"))
+        + _summary(hiring["summary"])
+    )
+
+
+def _risk_analysis(report: Dict[str, Any]) -> str:
+    risk = report["risk_analysis_and_considerations"]
+    assessments = "".join(_heading(f"🔍 {_text(heading)}", _text_map(aspects)) for heading, aspects in risk["assessments"].items())
+    mitigations = ""
+    if risk["mitigation_strategies"] or not risk["considerations"]:
+        mitigations = _heading("🛡️ Mitigation Strategies", _boxes(risk["mitigation_strategies"], "info-box", "No mitigation strategies provided"))
+    return (
+        assessments
+        + '<div class="columns"><div>'
+        + _heading("🚨 Identified Risks", _boxes(risk["risks"], "warning-box", "No risks identified"))
+        + "</div><div>"
+        + mitigations
+        + _heading("🤔 Considerations", _boxes(risk["considerations"], "info-box"))
+        + "</div></div>"
+        + _summary(risk["summary"])
+    )
+
+
+def _action_steps(report: Dict[str, Any]) -> str:
+    actions = report["actionable_next_steps"]
+    groups = (
+        ("👨‍💻 Developer Actions", "developer_actions"), ("👔 Managerial Actions", "managerial_actions"),
+        ("📅 Short Term Actions", "short_term_actions"), ("🎯 Long Term Actions", "long_term_actions"),
+    )
+    body = "".join(_heading(title, _list(actions[key])) for title, key in groups)
+    return (body or _box("No next steps available")) + _summary(actions["summary"])
+
+
+def render_html(report: Dict[str, Any], include_charts: bool = True) -> str:
+    """
+    Render a normalized report (see report_normalizer) as a self-contained HTML page.
+
+    Charts need Plotly at render time and load plotly.js from its CDN when
+    the page is viewed; without charts the page has no scripts at all.
+    """
+    profile = report["developer_profile_overview"]
+    name = profile["name"] or profile["username"] or "Unknown developer"
+    first_chart = [True]
+    sections = (
+        ("📋 Executive Summary", _executive_summary(report)),
+        ("👤 Developer Profile Overview", _developer_profile(report)),
+        ("⚡ Technical Skills Analysis", _technical_skills(report)),
+        ("📁 Repository Portfolio Analysis", _repository_portfolio(report, include_charts, first_chart)),
+        ("📊 Activity & Engagement Assessment", _activity_engagement(report)),
+        ("💪 Strengths & Development Areas", _strengths_development(report)),
+        ("🎯 Hiring & Project Fit Recommendations", _hiring_recommendations(report)),
+        ("⚠️ Risk Analysis & Considerations", _risk_analysis(report)),
+        ("🚀 Actionable Next Steps", _action_steps(report)),
+    )
+    body = "".join(f'<div class="section-header">{title}</div>{content}' for title, content in sections)
+    report_date = report["metadata"]["report_date"]
+    subtitle = f"<p style=\"text-align:center\">Report date: {_text(report_date)}</p>" if report_date else ""
+    return (
+        "<!DOCTYPE html>\n"
+        f'<html lang="en"><head><meta charset="utf-8"><title>GitHub Analysis - {_text(name)}</title>'
+        f"<style>{PAGE_STYLE}</style></head>"
+        f"<body><h1>🚀 GitHub Analysis: {_text(name)}</h1>{subtitle}{body}</body></html>\n"
+    )
+
+
+def export_path(report_path, suffix: str = ".html") -> Path:
+    """Where the export of a report file is cached: beside it, with the given suffix."""
+    return Path(report_path).with_suffix(suffix)
+
+
+def _stamp(report_path) -> Optional[str]:
+    try:
+        stat = os.stat(report_path)
+    except OSError:
+        return None
+    return f"{_STAMP_PREFIX}v{EXPORT_VERSION} {stat.st_size}:{stat.st_mtime_ns} -->"
+
+
+def _is_fresh(output_path: Path, stamp: str) -> bool:
+    try:
+        with open(output_path, "r", encoding="utf-8") as file:
+            return file.readline().rstrip("\n") == stamp
+    except (OSError, UnicodeDecodeError):
+        return False
+
+
+def _write_atomically(output_path: Path, content) -> None:
+    temporary_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+    if isinstance(content, bytes):
+        temporary_path.write_bytes(content)
+    else:
+        temporary_path.write_text(content, encoding="utf-8")
+    temporary_path.replace(output_path)
+
+
+def export_html(report_path, force: bool = False) -> Optional[Path]:
+    """
+    Render a report file to <report>.html unless an up-to-date export exists.
+
+    Returns the export's path, or None when the report cannot be loaded.
+    """
+    stamp = _stamp(report_path)
+    if stamp is None:
+        return None
+    output_path = export_path(report_path)
+    if not force and _is_fresh(output_path, stamp):
+        return output_path
+
+    loaded = load_report(report_path)
+    if loaded.normalized is None:
+        print(f"Cannot export {report_path}: {loaded.error}")
+        return None
+    _write_atomically(output_path, f"{stamp}\n{render_html(loaded.normalized)}")
+    return output_path
+
+
+def cached_html(report_path) -> Optional[str]:
+    """The pre-rendered page of a report, rendering it first if needed."""
+    output_path = export_html(report_path)
+    if output_path is None:
+        return None
+    try:
+        return output_path.read_text(encoding="utf-8")
+    except OSError as e:
+        print(f"Cannot read {output_path}: {e}")
+        return None
+
+
+def export_pdf(report_path, force: bool = False) -> Optional[Path]:
+    """
+    Render a report file to <report>.pdf unless it is newer than the report.
+
+    Needs weasyprint (PDF_AVAILABLE); returns None without it or when the
+    report cannot be loaded.
+    """
+    if not PDF_AVAILABLE:
+        return None
+    output_path = export_path(report_path, ".pdf")
+    try:
+        if not force and os.stat(output_path).st_mtime_ns >= os.stat(report_path).st_mtime_ns:
+            return output_path
+    except OSError:
+        pass
+
+    loaded = load_report(report_path)
+    if loaded.normalized is None:
+        print(f"Cannot export {report_path}: {loaded.error}")
+        return None
+    from weasyprint import HTML
+
+    _write_atomically(output_path, HTML(string=render_html(loaded.normalized, include_charts=False)).write_pdf())
+    return output_path
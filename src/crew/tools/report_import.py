@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Bulk import of report archives into the indexed report store
+
+Walks one or more directory trees for report files and imports them in
+parallel worker processes. Each worker fence-strips a file, parses it,
+validates it against the Pydantic report models and rewrites it as clean
+enveloped JSON under the catalog root's IMPORT_DIR_NAME. The parent process
+only records the results in the report catalog, in batched transactions.
+
+Stored files are named after the sha256 of the report's canonical JSON, so a
+report found several times in an archive is stored once. Source files whose
+size and mtime are unchanged since their last import are skipped without
+being read.
+
+Usage:
+    python -m src.crew.tools.report_import ARCHIVE [ARCHIVE ...] [--root .] [--workers N] [--strict] [--html]
+
+With --html, workers also pre-render each stored report to static HTML
+(see report_export), so the dashboards serve imported reports without rendering them.
+"""
+
+import argparse
+import fnmatch
+import hashlib
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from pydantic import ValidationError
+from src.crew.tools import json_codec
+from src.crew.tools.pydantic import GitHubDeveloperAnalysisReport
+from src.crew.tools.report_catalog import (
+    EXCLUDED_DIRS, IMPORT_DIR_NAME, REPORT_PATTERN, ImportedFile, ReportCatalog, get_catalog, summarize_report
+)
+from src.crew.tools.report_export import export_html
+from src.crew.tools.report_parsing import describe_validation_errors, strip_markdown_fences, wrap_report_envelope
+
+# Imports recorded in the catalog per transaction
+IMPORT_BATCH_SIZE = 500
+
+# Failed or invalid files listed individually in the summary
+MAX_LISTED_PROBLEMS = 20
+
+_UNSAFE_NAME_CHARACTERS = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+@dataclass
+class PreparedReport:
+    """A source file after parsing and validation in a worker process."""
+
+    source_path: str
+    size: int = 0
+    mtime_ns: int = 0
+    content_hash: Optional[str] = None
+    stored_path: Optional[str] = None
+    summary: Optional[Dict[str, Any]] = None
+    # Validation problems, as "dotted.path: message"
+    problems: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+@dataclass
+class ImportStats:
+    scanned: int = 0
+    unchanged: int = 0
+    imported: int = 0
+    duplicates: int = 0
+    invalid: int = 0
+    failed: int = 0
+    # "path: reason" for failed and invalid files
+    problems: List[str] = field(default_factory=list)
+
+
+def find_report_files(sources: Iterable[Path], pattern: str = REPORT_PATTERN,
+                      skip: Iterable[str] = ()) -> Iterator[str]:
+    """Absolute paths of the files matching pattern under each source (a directory or a file)."""
+    skipped = {os.path.abspath(path) for path in skip}
+    for source in sources:
+        source = os.path.abspath(source)
+        if os.path.isfile(source):
+            yield source
+            continue
+        for directory, subdirectories, files in os.walk(source):
+            subdirectories[:] = sorted(
+                name for name in subdirectories
+                if not name.startswith(".") and name not in EXCLUDED_DIRS
+                and os.path.join(directory, name) not in skipped
+            )
+            for name in sorted(files):
+                if fnmatch.fnmatch(name, pattern):
+                    yield os.path.join(directory, name)
+
+
+def content_hash(data: Any) -> str:
+    """sha256 of a report's canonical JSON (sorted keys, compact), independent of formatting."""
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def validate_report(data: Dict[str, Any]) -> List[str]:
+    """
+    Validation problems of an enveloped report.
+
+    The standard "report" format is validated against GitHubDeveloperAnalysisReport;
+    the other formats have no model and are accepted as they are.
+    """
+    if not isinstance(data.get("report"), dict):
+        return []
+    try:
+        GitHubDeveloperAnalysisReport.model_validate(data["report"])
+    except ValidationError as e:
+        return describe_validation_errors(e)
+    return []
+
+
+def stored_report_path(store_dir: str, digest: str, username: Optional[str]) -> str:
+    """Where a report with this content hash is stored; shards keep directories small."""
+    safe_username = _UNSAFE_NAME_CHARACTERS.sub("-", username or "").strip("-.") or "unknown"
+    return os.path.join(store_dir, digest[:2], f"github_analysis_report_{safe_username}_{digest[:12]}.json")
+
+
+def prepare_report(source_path: str, store_dir: str, strict: bool = False, html: bool = False) -> PreparedReport:
+    """
+    Parse, validate, hash and store one source file (run in a worker process).
+
+    The stored copy is written once per content hash, atomically, so workers
+    storing the same report at the same time are harmless. With strict,
+    reports that fail validation are not stored; with html, the stored
+    report is also pre-rendered.
+    """
+    prepared = PreparedReport(source_path=source_path)
+    try:
+        stat = os.stat(source_path)
+        prepared.size, prepared.mtime_ns = stat.st_size, stat.st_mtime_ns
+        with open(source_path, "r", encoding="utf-8") as file:
+            data = wrap_report_envelope(json_codec.loads(strip_markdown_fences(file.read())))
+    except (OSError, UnicodeDecodeError, json_codec.JSONDecodeError) as e:
+        prepared.error = str(e)
+        return prepared
+
+    summary = summarize_report(data if isinstance(data, dict) else {}, os.path.basename(source_path))
+    if summary["report_format"] is None:
+        prepared.error = "Not a report: no known report envelope at the top level"
+        return prepared
+
+    prepared.problems = validate_report(data)
+    if strict and prepared.problems:
+        return prepared
+
+    prepared.summary = summary
+    prepared.content_hash = content_hash(data)
+    prepared.stored_path = stored_report_path(store_dir, prepared.content_hash, summary["username"])
+    if not os.path.exists(prepared.stored_path):
+        try:
+            os.makedirs(os.path.dirname(prepared.stored_path), exist_ok=True)
+            temporary_path = f"{prepared.stored_path}.{os.getpid()}.tmp"
+            with open(temporary_path, "w", encoding="utf-8") as file:
+                file.write(json_codec.dumps(data, indent=2))
+            os.replace(temporary_path, prepared.stored_path)
+        except OSError as e:
+            prepared.error = f"Cannot store report: {e}"
+    if html and not prepared.error:
+        export_html(prepared.stored_path)
+    return prepared
+
+
+def _map(function, items: List[str], workers: int) -> Iterator[PreparedReport]:
+    if workers <= 1 or len(items) <= 1:
+        yield from map(function, items)
+        return
+    # Large chunks keep the inter-process traffic low; several per worker keep the load balanced
+    chunksize = max(1, min(64, len(items) // (workers * 4)))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(function, items, chunksize=chunksize)
+
+
+def import_reports(
+    sources: Iterable[Path],
+    catalog: Optional[ReportCatalog] = None,
+    workers: Optional[int] = None,
+    strict: bool = False,
+    html: bool = False,
+    pattern: str = REPORT_PATTERN,
+    progress_every: int = 1000
+) -> ImportStats:
+    """
+    Import every report file under the sources into the catalog's report store.
+
+    Returns counts of scanned, unchanged (skipped), newly imported, duplicate
+    (content already stored), invalid (strict only) and failed files.
+    """
+    catalog = catalog or get_catalog()
+    store_dir = os.path.join(str(catalog.root), IMPORT_DIR_NAME)
+    workers = workers or os.cpu_count() or 1
+    stats = ImportStats()
+
+    known = catalog.imported_files()
+    stored_hashes = {imported.content_hash for imported in known.values()}
+    pending = []
+    for path in find_report_files(sources, pattern, skip=[store_dir]):
+        stats.scanned += 1
+        previous = known.get(path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            previous = None
+        else:
+            if previous is not None and (previous.size, previous.mtime_ns) == (stat.st_size, stat.st_mtime_ns) \
+                    and os.path.exists(previous.stored_path):
+                stats.unchanged += 1
+                continue
+        pending.append(path)
+
+    print(f"Found {stats.scanned} report files, {len(pending)} new or changed; importing with {workers} workers")
+    batch = []
+    worker = partial(prepare_report, store_dir=store_dir, strict=strict, html=html)
+    for done, prepared in enumerate(_map(worker, pending, workers), 1):
+        if prepared.error:
+            stats.failed += 1
+            stats.problems.append(f"{prepared.source_path}: {prepared.error}")
+        elif prepared.stored_path is None:
+            stats.invalid += 1
+            stats.problems.append(f"{prepared.source_path}: {len(prepared.problems)} validation problem(s), "
+                                  f"first: {prepared.problems[0]}")
+        else:
+            if prepared.content_hash in stored_hashes:
+                stats.duplicates += 1
+            else:
+                stats.imported += 1
+                stored_hashes.add(prepared.content_hash)
+            batch.append((
+                ImportedFile(prepared.source_path, prepared.size, prepared.mtime_ns,
+                             prepared.content_hash, prepared.stored_path),
+                prepared.summary
+            ))
+
+        if len(batch) >= IMPORT_BATCH_SIZE:
+            catalog.record_imports(batch)
+            batch = []
+        if progress_every and done % progress_every == 0:
+            print(f"  {done}/{len(pending)} files processed")
+
+    if batch:
+        catalog.record_imports(batch)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import report archives into the indexed report store")
+    parser.add_argument("sources", nargs="+", type=Path, help="Directories (searched recursively) or report files")
+    parser.add_argument("--root", type=Path, default=Path("."), help="Catalog root the dashboards use (default: .)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--strict", action="store_true", help="Skip reports that fail model validation")
+    parser.add_argument("--html", action="store_true", help="Pre-render every stored report to static HTML")
+    parser.add_argument("--pattern", default=REPORT_PATTERN, help=f"File name pattern (default: {REPORT_PATTERN})")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    stats = import_reports(args.sources, get_catalog(args.root), args.workers, args.strict, args.html, args.pattern)
+    elapsed = time.perf_counter() - started
+
+    for problem in stats.problems[:MAX_LISTED_PROBLEMS]:
+        print(f"  ! {problem}")
+    if len(stats.problems) > MAX_LISTED_PROBLEMS:
+        print(f"  ... and {len(stats.problems) - MAX_LISTED_PROBLEMS} more")
+    print(
+        f"Scanned {stats.scanned} files in {elapsed:.1f}s: {stats.imported} imported, "
+        f"{stats.duplicates} duplicates, {stats.unchanged} unchanged, "
+        f"{stats.invalid} invalid, {stats.failed} failed"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Memoized loading of report files, shared by both Streamlit dashboards
+
+A report is read, fence-stripped, parsed and normalized once per (path,
+mtime, size); later reruns get the cached result. The cache is process-wide (all sessions
+share it), bounded by entry count and total file size, and evicts the least
+recently used reports first. Cached data is shared, so callers must treat
+it as read-only.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+from src.crew.tools import json_codec
+from src.crew.tools.report_normalizer import normalize_report
+from src.crew.tools.report_parsing import strip_markdown_fences, wrap_report_envelope
+
+# Bounds of the process-wide cache
+REPORT_CACHE_MAX_ENTRIES = 256
+REPORT_CACHE_MAX_BYTES = 64 * 1024 * 1024  # Sum of cached file sizes
+
+# Characters of raw and fence-stripped content kept for the debug view of a failed parse
+RAW_PREVIEW_CHARS = 1000
+PARSED_PREVIEW_CHARS = 500
+
+
+@dataclass(frozen=True)
+class LoadedReport:
+    """The outcome of loading one report file."""
+
+    path: str
+    # Parsed report in its {"<envelope>": {...}} form, or None on failure
+    data: Optional[Dict[str, Any]]
+    # Error message when reading or parsing failed
+    error: Optional[str] = None
+    # True when the failure was invalid JSON (previews are then filled in)
+    is_json_error: bool = False
+    raw_preview: str = ""
+    parsed_preview: str = ""
+    # The report mapped onto report_normalizer.CANONICAL_LAYOUT, for display
+    normalized: Optional[Dict[str, Any]] = None
+
+
+_cache: "OrderedDict[str, Tuple[int, int, LoadedReport]]" = OrderedDict()
+_cache_bytes = 0
+_cache_lock = threading.Lock()
+
+
+def _preview(text: str, limit: int) -> str:
+    return text[:limit] + ("..." if len(text) > limit else "")
+
+
+def _read_report(path: str) -> LoadedReport:
+    try:
+        with open(path, 'r', encoding='utf-8') as file:
+            content = file.read()
+    except (OSError, UnicodeDecodeError) as e:
+        return LoadedReport(path=path, data=None, error=str(e))
+
+    clean_content = strip_markdown_fences(content)
+    try:
+        # Structured output is written without an envelope
+        data = wrap_report_envelope(json_codec.loads(clean_content))
+    except json_codec.JSONDecodeError as e:
+        # Keep the previews now so the debug view never re-reads the file
+        return LoadedReport(
+            path=path,
+            data=None,
+            error=str(e),
+            is_json_error=True,
+            raw_preview=_preview(content, RAW_PREVIEW_CHARS),
+            parsed_preview=_preview(clean_content, PARSED_PREVIEW_CHARS)
+        )
+    return LoadedReport(path=path, data=data, normalized=normalize_report(data))
+
+
+def load_report(file_path) -> LoadedReport:
+    """
+    Load a report file through the process-wide cache.
+
+    The cache key is the path; an entry is reused only while the file's
+    mtime and size are unchanged, so rewritten reports are re-parsed.
+    """
+    global _cache_bytes
+    path = os.path.abspath(file_path)
+    try:
+        stat = os.stat(path)
+    except OSError as e:
+        return LoadedReport(path=path, data=None, error=str(e))
+
+    with _cache_lock:
+        cached = _cache.get(path)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            _cache.move_to_end(path)
+            return cached[2]
+
+    report = _read_report(path)
+    if report.data is None and not report.is_json_error:
+        # Read errors are usually transient (file being replaced), so they are not cached
+        return report
+
+    with _cache_lock:
+        previous = _cache.pop(path, None)
+        if previous is not None:
+            _cache_bytes -= previous[1]
+        _cache[path] = (stat.st_mtime_ns, stat.st_size, report)
+        _cache_bytes += stat.st_size
+        while len(_cache) > 1 and (len(_cache) > REPORT_CACHE_MAX_ENTRIES or _cache_bytes > REPORT_CACHE_MAX_BYTES):
+            _, (_, size, _) = _cache.popitem(last=False)
+            _cache_bytes -= size
+    return report
+
+
+def clear_report_cache() -> None:
+    """Drop every cached report."""
+    global _cache_bytes
+    with _cache_lock:
+        _cache.clear()
+        _cache_bytes = 0
@@ -0,0 +1,511 @@
+"""
+One-pass normalization of saved reports into the canonical report layout
+
+Reports exist in three formats: the {"report": ...} envelope written by
+GitCrew (GitHubDeveloperAnalysisReport), and the older skill_assessment_report
+and github_analysis_report (numbered section keys) layouts written by earlier
+crews. normalize_report maps any of them onto CANONICAL_LAYOUT in a single
+pass over FIELD_PATHS, so display code reads fixed keys instead of guessing
+the format section by section. Every canonical field is always present.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from src.crew.tools.report_parsing import REPORT_ENVELOPE_KEYS, wrap_report_envelope
+
+Path = Tuple[str, ...]
+
+# Canonical layout: section -> field -> empty value. Each section starts with
+# the GitHubDeveloperAnalysisReport fields; the fields after them carry details
+# only some formats have, so nothing the dashboards showed before is lost.
+CANONICAL_LAYOUT: Dict[str, Dict[str, Any]] = {
+    "metadata": {
+        "source_format": "",
+        "title": "",
+        "report_date": "",
+    },
+    "executive_summary": {
+        "overview": "",
+        "recommendations": [],
+        "key_findings": [],
+        "strengths_summary": "",
+        "weaknesses_summary": "",
+    },
+    "developer_profile_overview": {
+        "github_profile": "",
+        "name": "",
+        "account_age_days": None,
+        "followers": None,
+        "following": None,
+        "public_repos": None,
+        "primary_languages": [],
+        "experience_level": "",
+        "activity_level": "",
+        "community_involvement": "",
+        "summary": "",
+        "username": "",
+        "bio": "",
+        "location": "",
+        "company": "",
+        "avatar_url": "",
+        "public_gists": None,
+        "created_at": "",
+        "experience_evidence": "",
+        "experience_reasoning": "",
+        "specialization_areas": [],
+        "specialization_details": "",
+    },
+    "technical_skills_analysis": {
+        # Skill maps hold name -> {"proficiency", "description", "evidence"}
+        "programming_languages": {},
+        "frameworks_and_libraries": {},
+        "tools_and_technologies": {},
+        "skill_gaps": [],
+        "summary": "",
+    },
+    "repository_portfolio_review": {
+        # Repositories hold REPOSITORY_FIELDS
+        "top_repositories": [],
+        # Analyzer coding_patterns keys (rates, totals, languages_used)
+        "coding_patterns": {},
+        "repository_patterns": [],
+        "total_repos": None,
+        "analyzed_repos": None,
+        "summary": "",
+    },
+    "activity_and_engagement_assessment": {
+        # Aspect -> description text
+        "activity_metrics": {},
+        "engagement_patterns": {},
+        "recommendations": [],
+        "summary": "",
+    },
+    "strengths_and_development_areas": {
+        "strengths": [],
+        "development_areas": [],
+        "recommendations": [],
+        "summary": "",
+    },
+    "hiring_and_project_fit_recommendations": {
+        "suitable_roles": [],
+        "suitable_projects": [],
+        "recommendations": [],
+        "unsuitable_projects": [],
+        "considerations": "",
+        "summary": "",
+    },
+    "risk_analysis_and_considerations": {
+        "risks": [],
+        "mitigation_strategies": [],
+        "considerations": [],
+        # Heading -> {aspect: description}
+        "assessments": {},
+        "summary": "",
+    },
+    "actionable_next_steps": {
+        "developer_actions": [],
+        "managerial_actions": [],
+        "short_term_actions": [],
+        "long_term_actions": [],
+        "summary": "",
+    },
+    "appendices": {
+        # Analyzer output as saved: user_profile, repository_overview, coding_patterns, skill_metrics
+        "raw_data_summary": {},
+        "rate_limit_considerations": "",
+    },
+}
+
+REPOSITORY_FIELDS = {
+    "name": "",
+    "description": "",
+    "language": "",
+    "recent_commits_count": None,
+    "stargazers_count": None,
+    "purpose": "",
+    "key_aspects": "",
+}
+
+# Section names of the github_analysis_report format
+GITHUB_ANALYSIS_SECTIONS = {
+    "executive_summary": "1_executive_summary",
+    "developer_profile_overview": "2_developer_overview",
+    "technical_skills_analysis": "3_technical_skills_breakdown",
+    "repository_portfolio_review": "4_repository_portfolio_analysis",
+    "activity_and_engagement_assessment": "5_activity_and_engagement_patterns",
+    "strengths_and_development_areas": "6_strengths_and_growth_areas",
+    "hiring_and_project_fit_recommendations": "7_hiring_recommendations",
+    "risk_analysis_and_considerations": "9_risk_assessment_and_considerations",
+    "actionable_next_steps": "10_next_steps_and_recommendations",
+}
+
+_USER = ("appendices", "raw_data_summary", "user_profile")
+_PERSONAL = ("developer_profile_overview", "personal_information")
+_METRICS = ("developer_profile_overview", "github_metrics")
+
+# Where each canonical "section.field" lives in each format, first non-empty
+# match wins (all matches are combined for MERGED_FIELDS). Fields not listed
+# are read from the same section and field name in the format's own layout.
+FIELD_PATHS: Dict[str, Dict[str, List[Path]]] = {
+    "report": {
+        "developer_profile_overview.username": [_USER + ("username",)],
+        "developer_profile_overview.bio": [_USER + ("bio",)],
+        "developer_profile_overview.location": [_USER + ("location",)],
+        "developer_profile_overview.company": [_USER + ("company",)],
+        "developer_profile_overview.avatar_url": [_USER + ("avatar_url",)],
+        "developer_profile_overview.public_gists": [_USER + ("public_gists",)],
+        "developer_profile_overview.created_at": [_USER + ("created_at",)],
+        "repository_portfolio_review.coding_patterns": [
+            ("repository_portfolio_review", "coding_patterns"),
+            ("appendices", "raw_data_summary", "coding_patterns"),
+        ],
+        "repository_portfolio_review.total_repos": [("appendices", "raw_data_summary", "repository_overview", "total_public_repos")],
+        "repository_portfolio_review.analyzed_repos": [("appendices", "raw_data_summary", "repository_overview", "analyzed_repos")],
+    },
+    "skill_assessment_report": {
+        "metadata.report_date": [("report_generated",), ("assessment_date",), ("analysis_date",)],
+        # Older reports have the summary as one string
+        "executive_summary.overview": [("executive_summary", "overview"), ("executive_summary",)],
+        "executive_summary.strengths_summary": [("executive_summary", "summary_of_strengths")],
+        "executive_summary.weaknesses_summary": [("executive_summary", "summary_of_weaknesses")],
+        "developer_profile_overview.github_profile": [_PERSONAL + ("profile_url",)],
+        "developer_profile_overview.name": [_PERSONAL + ("name",), ("developer_name",)],
+        "developer_profile_overview.username": [_PERSONAL + ("username",), ("developer_username",), ("github_username",)],
+        "developer_profile_overview.bio": [_PERSONAL + ("bio",)],
+        "developer_profile_overview.location": [_PERSONAL + ("location",)],
+        "developer_profile_overview.company": [_PERSONAL + ("company",)],
+        "developer_profile_overview.avatar_url": [_PERSONAL + ("avatar_url",)],
+        "developer_profile_overview.account_age_days": [_PERSONAL + ("account_age_days",)],
+        "developer_profile_overview.public_repos": [_METRICS + ("public_repos",)],
+        "developer_profile_overview.public_gists": [_METRICS + ("public_gists",)],
+        "developer_profile_overview.followers": [_METRICS + ("followers",)],
+        "developer_profile_overview.following": [_METRICS + ("following",)],
+        "developer_profile_overview.created_at": [_METRICS + ("created_at",)],
+        "developer_profile_overview.primary_languages": [
+            ("developer_skill_assessment_summary", "primary_languages"),
+            ("technical_skills_analysis", "programming_languages"),
+        ],
+        "developer_profile_overview.experience_level": [
+            ("experience_level_classification", "level"),
+            ("developer_skill_assessment_summary", "experience_level"),
+        ],
+        "developer_profile_overview.activity_level": [("appendices", "raw_data_summaries", "summary", "activity_level")],
+        "developer_profile_overview.community_involvement": [("developer_skill_assessment_summary", "community_involvement")],
+        "developer_profile_overview.summary": [
+            ("developer_profile_overview", "summary"),
+            ("developer_skill_assessment_summary", "skill_highlights"),
+        ],
+        "developer_profile_overview.experience_evidence": [("experience_level_classification", "evidence")],
+        "developer_profile_overview.experience_reasoning": [("experience_level_classification", "reasoning")],
+        "developer_profile_overview.specialization_areas": [
+            ("specialization_areas_and_domain_expertise", "areas"),
+            ("developer_skill_assessment_summary", "specialization_areas"),
+        ],
+        "developer_profile_overview.specialization_details": [("specialization_areas_and_domain_expertise", "details")],
+        "technical_skills_analysis.programming_languages": [
+            ("technical_skills_analysis", "programming_languages"),
+            ("technical_competency_matrix", "Programming Languages"),
+            ("technical_profile_overview", "programming_languages"),
+        ],
+        "technical_skills_analysis.frameworks_and_libraries": [
+            ("technical_skills_analysis", "technologies_and_frameworks"),
+            ("technical_skills_analysis", "frameworks_and_libraries"),
+            ("technical_competency_matrix", "Frameworks and Libraries"),
+            ("technical_profile_overview", "frameworks_and_libraries"),
+        ],
+        "technical_skills_analysis.tools_and_technologies": [
+            ("technical_skills_analysis", "tools_and_technologies"),
+            ("technical_competency_matrix", "Databases"),
+            ("technical_competency_matrix", "DevOps"),
+            ("technical_profile_overview", "tools_and_technologies"),
+            ("technical_profile_overview", "databases"),
+        ],
+        "technical_skills_analysis.summary": [
+            ("technical_skills_analysis", "language_summary"),
+            ("technical_profile_overview", "development_style"),
+        ],
+        "repository_portfolio_review.coding_patterns": [
+            ("repository_portfolio_review", "coding_patterns"),
+            ("activity_and_engagement_assessment", "metrics", "coding_patterns"),
+            ("appendices", "raw_data_summaries", "coding_patterns"),
+        ],
+        "repository_portfolio_review.summary": [("repository_portfolio_review", "portfolio_summary")],
+        "activity_and_engagement_assessment.activity_metrics": [
+            ("activity_and_engagement_assessment", "activity_metrics"),
+            ("activity_and_engagement_assessment", "metrics", "skill_metrics"),
+            ("detailed_github_profile_analysis",),
+        ],
+        "activity_and_engagement_assessment.summary": [
+            ("activity_and_engagement_assessment", "activity_summary"),
+            ("activity_and_engagement_assessment", "engagement_summary"),
+        ],
+        "strengths_and_development_areas.strengths": [
+            ("strengths_and_development_areas", "strengths"),
+            ("key_strengths_and_areas_for_improvement", "strengths"),
+        ],
+        "strengths_and_development_areas.development_areas": [
+            ("strengths_and_development_areas", "development_areas"),
+            ("strengths_and_development_areas", "areas_for_improvement"),
+            ("key_strengths_and_areas_for_improvement", "areas_for_improvement"),
+            ("developer_skill_assessment_summary", "areas_for_growth"),
+        ],
+        "hiring_and_project_fit_recommendations.suitable_roles": [
+            ("hiring_and_project_fit_recommendations", "suitable_roles"),
+            ("hiring_and_project_fit_recommendations", "roles"),
+            ("recommendations", "roles"),
+        ],
+        "hiring_and_project_fit_recommendations.suitable_projects": [
+            ("hiring_and_project_fit_recommendations", "suitable_projects"),
+            ("hiring_and_project_fit_recommendations", "project_types"),
+            ("recommendations", "project_types"),
+        ],
+        "risk_analysis_and_considerations.mitigation_strategies": [
+            ("risk_analysis_and_considerations", "mitigation_strategies"),
+            ("risk_analysis_and_considerations", "mitigations"),
+        ],
+        "risk_analysis_and_considerations.assessments": [("risk_analysis_and_considerations",)],
+        "actionable_next_steps.developer_actions": [
+            ("actionable_next_steps", "developer_actions"),
+            ("actionable_next_steps", "developer"),
+            ("recommendations", "development_focus"),
+        ],
+        "actionable_next_steps.managerial_actions": [
+            ("actionable_next_steps", "managerial_actions"),
+            ("actionable_next_steps", "hiring_manager"),
+        ],
+        "appendices.raw_data_summary": [("appendices", "raw_data_summary"), ("appendices", "raw_data_summaries")],
+    },
+    "github_analysis_report": {
+        "metadata.title": [("report_title",)],
+        "metadata.report_date": [("report_date",), ("analysis_metadata", "analyzed_at")],
+        "developer_profile_overview.github_profile": [_USER + ("html_url",)],
+        "developer_profile_overview.primary_languages": [("2_developer_overview", "key_metrics", "primary_languages")],
+        "developer_profile_overview.experience_level": [("2_developer_overview", "key_metrics", "experience_level")],
+        "developer_profile_overview.activity_level": [("2_developer_overview", "key_metrics", "activity_level")],
+        "developer_profile_overview.community_involvement": [("2_developer_overview", "key_metrics", "community_involvement")],
+        "developer_profile_overview.company": [_USER + ("company",)],
+        "developer_profile_overview.avatar_url": [_USER + ("avatar_url",)],
+        "developer_profile_overview.public_gists": [_USER + ("public_gists",)],
+        "developer_profile_overview.created_at": [_USER + ("created_at",)],
+        "technical_skills_analysis.frameworks_and_libraries": [("3_technical_skills_breakdown", "frameworks_and_technologies")],
+        "repository_portfolio_review.repository_patterns": [("4_repository_portfolio_analysis", "patterns")],
+        "repository_portfolio_review.coding_patterns": [
+            ("5_activity_and_engagement_patterns", "coding_activity"),
+            ("5_activity_and_engagement_patterns", "community_engagement"),
+            ("appendices", "raw_data_summary", "coding_patterns"),
+        ],
+        "activity_and_engagement_assessment.activity_metrics": [("5_activity_and_engagement_patterns", "coding_activity")],
+        "activity_and_engagement_assessment.engagement_patterns": [("5_activity_and_engagement_patterns", "community_engagement")],
+        "strengths_and_development_areas.development_areas": [("6_strengths_and_growth_areas", "growth_areas")],
+        "hiring_and_project_fit_recommendations.suitable_roles": [("7_hiring_recommendations", "potential_roles")],
+        "hiring_and_project_fit_recommendations.suitable_projects": [
+            ("8_project_fit_analysis", "suitable_projects"),
+            ("7_hiring_recommendations", "project_suitability"),
+        ],
+        "hiring_and_project_fit_recommendations.unsuitable_projects": [("8_project_fit_analysis", "unsuitable_projects")],
+        "actionable_next_steps.short_term_actions": [("10_next_steps_and_recommendations", "short_term")],
+        "actionable_next_steps.long_term_actions": [("10_next_steps_and_recommendations", "long_term")],
+        "appendices.rate_limit_considerations": [("analysis_metadata", "rate_limit_considerations")],
+    },
+}
+
+# Fields combined from every matching path instead of the first one
+MERGED_FIELDS = {
+    "repository_portfolio_review.coding_patterns",
+    "technical_skills_analysis.tools_and_technologies",
+    "hiring_and_project_fit_recommendations.suitable_projects",
+    "activity_and_engagement_assessment.summary",
+}
+
+
+def _lookup(data: Any, path: Path) -> Any:
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def _label(key: Any) -> str:
+    return str(key).replace("_", " ").strip().title() if "_" in str(key) or str(key).islower() else str(key)
+
+
+def _text(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return "; ".join(_text(item) for item in value if item not in (None, ""))
+    if isinstance(value, dict):
+        return "; ".join(f"{_label(key)}: {_text(item)}" for key, item in value.items() if item not in (None, ""))
+    return str(value)
+
+
+def _text_list(value: Any) -> List[str]:
+    if value in (None, ""):
+        return []
+    if isinstance(value, list):
+        return [_text(item) for item in value if item not in (None, "")]
+    if isinstance(value, dict):
+        return [f"{_label(key)}: {_text(item)}" for key, item in value.items() if item not in (None, "", [], {})]
+    return [str(value)]
+
+
+def _names(value: Any) -> List[str]:
+    """Names from a list, a {name: details} dict or a comma-separated string."""
+    if isinstance(value, dict):
+        value = list(value)
+    elif isinstance(value, str):
+        value = value.split(",")
+    if not isinstance(value, list):
+        return []
+    return [str(name).strip() for name in value if str(name).strip()]
+
+
+def _number(value: Any) -> Optional[float]:
+    if isinstance(value, bool) or value in (None, ""):
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    try:
+        number = float(str(value).replace(",", ""))
+    except ValueError:
+        return None
+    return int(number) if number.is_integer() else number
+
+
+def _text_map(value: Any) -> Dict[str, str]:
+    if isinstance(value, dict):
+        return {_label(key): _text(item) for key, item in value.items() if item not in (None, "", [], {})}
+    text = _text(value)
+    return {"Summary": text} if text else {}
+
+
+def _skills(value: Any) -> Dict[str, Dict[str, str]]:
+    """
+    Skill maps as name -> {"proficiency", "description", "evidence"}.
+
+    Accepts {name: {...}} dicts, {name: "Level - description"} strings
+    (the GitCrew format) and plain name lists or comma-separated strings.
+    """
+    if not isinstance(value, dict):
+        return {name: {"proficiency": "", "description": "", "evidence": ""} for name in _names(value)}
+
+    skills = {}
+    for name, details in value.items():
+        if isinstance(details, dict):
+            skills[str(name)] = {
+                "proficiency": _text(details.get("proficiency") or details.get("level")),
+                "description": _text(details.get("description") or details.get("details")),
+                "evidence": _text(details.get("evidence")),
+            }
+        else:
+            level, separator, description = _text(details).partition(" - ")
+            skills[str(name)] = {
+                "proficiency": level if separator else "",
+                "description": description if separator else level,
+                "evidence": "",
+            }
+    return skills
+
+
+def _repositories(value: Any) -> List[Dict[str, Any]]:
+    repositories = []
+    for repo in value if isinstance(value, list) else []:
+        if not isinstance(repo, dict):
+            repo = {"name": _text(repo)}
+        repositories.append({
+            field: _number(repo.get(field)) if default is None else _text(repo.get(field))
+            for field, default in REPOSITORY_FIELDS.items()
+        })
+    return repositories
+
+
+def _assessments(value: Any) -> Dict[str, Dict[str, str]]:
+    """Nested assessment blocks of a section, e.g. code_quality_and_best_practices_adherence."""
+    if not isinstance(value, dict):
+        return {}
+    return {_label(key): _text_map(block) for key, block in value.items() if isinstance(block, dict) and block}
+
+
+def _mapping(value: Any) -> Dict[str, Any]:
+    return dict(value) if isinstance(value, dict) else {}
+
+
+# Conversion of each field's raw value; fields not listed convert by the type of their empty value
+FIELD_CONVERTERS: Dict[str, Callable[[Any], Any]] = {
+    "developer_profile_overview.primary_languages": _names,
+    "developer_profile_overview.specialization_areas": _names,
+    "technical_skills_analysis.programming_languages": _skills,
+    "technical_skills_analysis.frameworks_and_libraries": _skills,
+    "technical_skills_analysis.tools_and_technologies": _skills,
+    "repository_portfolio_review.top_repositories": _repositories,
+    "repository_portfolio_review.coding_patterns": _mapping,
+    "activity_and_engagement_assessment.activity_metrics": _text_map,
+    "activity_and_engagement_assessment.engagement_patterns": _text_map,
+    "risk_analysis_and_considerations.assessments": _assessments,
+    "appendices.raw_data_summary": _mapping,
+}
+
+
+def _convert(key: str, empty: Any, value: Any) -> Any:
+    if key in FIELD_CONVERTERS:
+        return FIELD_CONVERTERS[key](value)
+    if isinstance(empty, list):
+        return _text_list(value)
+    if isinstance(empty, dict):
+        return _mapping(value)
+    if empty is None:
+        return _number(value)
+    return _text(value)
+
+
+def _merge(values: List[Any]) -> Any:
+    """Combine converted values: dicts key by key (earlier wins), lists without duplicates, text by paragraphs."""
+    if isinstance(values[0], dict):
+        merged: Dict[str, Any] = {}
+        for value in values:
+            for key, item in value.items():
+                merged.setdefault(key, item)
+        return merged
+    if isinstance(values[0], list):
+        return list(dict.fromkeys(item for value in values for item in value))
+    return "\n\n".join(value for value in values if value)
+
+
+def _is_empty(value: Any) -> bool:
+    return value in (None, "", [], {})
+
+
+def normalize_report(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map a parsed report in any known format onto CANONICAL_LAYOUT.
+
+    Returns a new dict with every canonical section and field; fields the
+    report does not have hold their empty value. metadata.source_format is
+    the report's envelope key ("" when the format is not recognized).
+    """
+    data = wrap_report_envelope(data) if isinstance(data, dict) else {}
+    source_format = next((key for key in REPORT_ENVELOPE_KEYS if isinstance(data.get(key), dict)), "")
+    report = data.get(source_format, {}) if source_format else {}
+    paths = FIELD_PATHS.get(source_format, {})
+    section_names = GITHUB_ANALYSIS_SECTIONS if source_format == "github_analysis_report" else {}
+
+    normalized: Dict[str, Dict[str, Any]] = {}
+    for section, fields in CANONICAL_LAYOUT.items():
+        normalized[section] = {}
+        for field, empty in fields.items():
+            key = f"{section}.{field}"
+            values = []
+            for path in paths.get(key, [(section_names.get(section, section), field)]):
+                value = _lookup(report, path)
+                if _is_empty(value):
+                    continue
+                values.append(_convert(key, empty, value))
+                if key not in MERGED_FIELDS:
+                    break
+            if not values:
+                normalized[section][field] = _convert(key, empty, None)
+            else:
+                normalized[section][field] = _merge(values) if len(values) > 1 else values[0]
+
+    normalized["metadata"]["source_format"] = source_format
+    return normalized
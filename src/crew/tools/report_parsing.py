@@ -0,0 +1,100 @@
+import json
+from typing import Any, Callable, List, Tuple, Type
+from pydantic import BaseModel, ValidationError
+from src.crew.tools import json_codec
+from src.crew.tools.pydantic import GitHubDeveloperAnalysisReport
+
+
+# Markdown code fence formats LLMs wrap JSON output in
+MARKDOWN_FENCES = [
+    ('```json\n', '\n```'),   # Standard JSON code block
+    ('```\n', '\n```'),       # Generic code block
+    ('````json\n', '\n````'), # Quad backticks
+    ('````\n', '\n````'),     # Quad backticks generic
+]
+
+# Top-level keys used by the report formats the dashboards understand
+REPORT_ENVELOPE_KEYS = ('report', 'skill_assessment_report', 'github_analysis_report')
+
+
+def strip_markdown_fences(content: str) -> str:
+    """Strip a markdown code fence wrapped around JSON content, if present."""
+    content = content.strip()
+
+    for start_pattern, end_pattern in MARKDOWN_FENCES:
+        if content.startswith(start_pattern) and content.endswith(end_pattern):
+            content = content[len(start_pattern):-len(end_pattern)].strip()
+            break
+
+    return content
+
+
+def wrap_report_envelope(data: Any) -> Any:
+    """
+    Wrap a bare GitHubDeveloperAnalysisReport dict in the {"report": ...} envelope.
+
+    Structured task output is written without an envelope, while the dashboards
+    expect one of the REPORT_ENVELOPE_KEYS at the top level.
+    """
+    if isinstance(data, dict) and 'executive_summary' in data and not any(key in data for key in REPORT_ENVELOPE_KEYS):
+        return {'report': data}
+    return data
+
+
+def parse_report(raw: str, model: Type[BaseModel] = GitHubDeveloperAnalysisReport) -> BaseModel:
+    """
+    Parse and validate raw LLM report output against a report model.
+
+    Raises:
+        json.JSONDecodeError: If the output is not valid JSON
+        ValidationError: If the JSON does not match the model
+    """
+    data = json_codec.loads(strip_markdown_fences(raw))
+
+    # Accept the report wrapped in the {"report": ...} envelope as well
+    if isinstance(data, dict) and set(data.keys()) == {'report'}:
+        data = data['report']
+
+    return model.model_validate(data)
+
+
+def describe_validation_errors(error: ValidationError) -> List[str]:
+    """Describe each invalid field as 'dotted.path: message'."""
+    return [
+        f"{'.'.join(str(part) for part in err['loc']) or '<root>'}: {err['msg']}"
+        for err in error.errors()
+    ]
+
+
+def schema_guardrail(model: Type[BaseModel]) -> Callable[[Any], Tuple[bool, Any]]:
+    """
+    Build a CrewAI task guardrail validating the task output against a report model.
+
+    Valid output is passed through (as clean JSON when it needed local repair).
+    Invalid output fails with a message naming only the broken fields, so the
+    retry repairs those fields instead of regenerating the whole report.
+    """
+    def guardrail(output: Any) -> Tuple[bool, Any]:
+        if getattr(output, 'pydantic', None) is not None:
+            return True, output
+
+        raw = getattr(output, 'raw', output)
+        try:
+            report = parse_report(raw, model)
+        except json.JSONDecodeError as e:
+            return False, (
+                f"The report is not valid JSON ({e}). Return only the JSON object for "
+                f"{model.__name__}, without markdown fences or commentary."
+            )
+        except ValidationError as e:
+            problems = "\n".join(f"- {problem}" for problem in describe_validation_errors(e))
+            return False, (
+                f"The report JSON failed validation against {model.__name__}. "
+                "Keep every other field exactly as it is and fix only these fields:\n"
+                f"{problems}"
+            )
+
+        return True, report.model_dump_json()
+
+    return guardrail
+
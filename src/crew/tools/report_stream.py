@@ -0,0 +1,250 @@
+"""
+Streaming parser for uploaded report files and report bundles
+
+An upload is parsed straight from its file object with JSONStreamReader:
+a surrounding markdown fence is skipped as it is read, report sections are
+decoded and validated one at a time as they arrive, and bundles (JSONL with
+one report per line, or zip archives of report files) are read one report
+at a time. The upload is never held as a decoded or fence-stripped string.
+"""
+
+import io
+import json
+import os
+import zipfile
+from dataclasses import dataclass, field
+from typing import IO, Any, Dict, Iterator, List, Optional
+from pydantic import TypeAdapter, ValidationError
+from src.crew.tools import json_codec
+from src.crew.tools.json_stream import JSONStreamReader
+from src.crew.tools.pydantic import GitHubDeveloperAnalysisReport
+from src.crew.tools.report_parsing import MARKDOWN_FENCES, REPORT_ENVELOPE_KEYS, wrap_report_envelope
+
+# Reports read from one bundle at most; the rest of the bundle is ignored
+MAX_BUNDLE_REPORTS = 200
+
+# File suffixes read as single reports and as JSONL bundles (also inside zip bundles)
+REPORT_SUFFIXES = ('.json', '.txt', '.md')
+JSONL_SUFFIXES = ('.jsonl', '.ndjson')
+
+# Opening fence lines ("```json", "```", ...) accepted before a report
+FENCE_OPENINGS = tuple(start.strip() for start, _ in MARKDOWN_FENCES)
+
+# Sections a GitHubDeveloperAnalysisReport must have
+REQUIRED_SECTIONS = tuple(
+    name for name, info in GitHubDeveloperAnalysisReport.model_fields.items() if info.is_required()
+)
+
+_section_adapters: Dict[str, TypeAdapter] = {}
+
+
+@dataclass
+class StreamedReport:
+    """One report read from an upload."""
+
+    # File name, "<archive>/<member>" for zip bundles or "<file>:<line>" for JSONL bundles
+    name: str
+    # Parsed report in its {"<envelope>": {...}} form, or None when it could not be read
+    data: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    # Section-level validation problems, as "section.field: message"
+    problems: List[str] = field(default_factory=list)
+
+
+def _section_adapter(section: str) -> TypeAdapter:
+    if section not in _section_adapters:
+        _section_adapters[section] = TypeAdapter(GitHubDeveloperAnalysisReport.model_fields[section].annotation)
+    return _section_adapters[section]
+
+
+def validate_section(envelope: str, section: str, value: Any) -> List[str]:
+    """
+    Problems with one report section, checked as soon as it is decoded.
+
+    Sections of the standard "report" format are validated against their
+    GitHubDeveloperAnalysisReport models. The other formats have no model
+    and are accepted as they are; report_normalizer maps what they contain.
+    """
+    if envelope != 'report' or section not in GitHubDeveloperAnalysisReport.model_fields:
+        return []
+    try:
+        _section_adapter(section).validate_python(value)
+    except ValidationError as e:
+        return [f"{'.'.join([section, *(str(part) for part in err['loc'])])}: {err['msg']}" for err in e.errors()]
+    return []
+
+
+def _missing_sections(envelope: str, sections: Dict[str, Any]) -> List[str]:
+    if envelope != 'report':
+        return []
+    return [f"{section}: Field required" for section in REQUIRED_SECTIONS if section not in sections]
+
+
+def _envelope(data: Any) -> Optional[str]:
+    if not isinstance(data, dict):
+        return None
+    return next((key for key in REPORT_ENVELOPE_KEYS if isinstance(data.get(key), dict)), None)
+
+
+def _finish(report: StreamedReport, data: Any) -> StreamedReport:
+    envelope = _envelope(data)
+    if envelope is None:
+        report.error = f"Not a report: expected one of {', '.join(REPORT_ENVELOPE_KEYS)} at the top level"
+        report.problems.clear()
+    else:
+        report.data = data
+    return report
+
+
+def _skip_opening_fence(reader: JSONStreamReader) -> bool:
+    reader.skip_whitespace()
+    if reader.peek() != '`':
+        return False
+    fence = reader.read_line().strip()
+    if fence not in FENCE_OPENINGS:
+        raise json.JSONDecodeError(f"Unsupported markdown fence {fence[:20]!r}", fence, 0)
+    return True
+
+
+def _read_sections(reader: JSONStreamReader, envelope: str, report: StreamedReport) -> Dict[str, Any]:
+    """Read the members of an open report object, validating each section as it arrives."""
+    sections = {}
+    while True:
+        section = reader.next_key()
+        if section is None:
+            break
+        sections[section] = reader.read_value()
+        report.problems.extend(validate_section(envelope, section, sections[section]))
+    report.problems.extend(_missing_sections(envelope, sections))
+    return sections
+
+
+def read_report_stream(stream: IO, name: str) -> StreamedReport:
+    """
+    Parse one report from a text or binary stream, optionally markdown-fenced.
+
+    Enveloped reports and bare GitHubDeveloperAnalysisReport objects are
+    accepted; bare reports come back wrapped in the "report" envelope.
+    Errors are returned in the StreamedReport instead of being raised.
+    """
+    report = StreamedReport(name=name)
+    reader = JSONStreamReader(stream)
+    try:
+        fenced = _skip_opening_fence(reader)
+        reader.begin_object()
+        data: Dict[str, Any] = {}
+        # Problems of top-level sections, kept in case this turns out to be a bare report
+        bare_problems: List[str] = []
+        while True:
+            key = reader.next_key()
+            if key is None:
+                break
+            reader.skip_whitespace()
+            if key in REPORT_ENVELOPE_KEYS and reader.peek() == '{':
+                # Descend into the envelope so its sections are decoded one at a time
+                reader.begin_object()
+                data[key] = _read_sections(reader, key, report)
+            else:
+                data[key] = reader.read_value()
+                bare_problems.extend(validate_section('report', key, data[key]))
+
+        reader.skip_whitespace()
+        if fenced and reader.peek() == '`':
+            reader.read_line()
+        if not reader.at_end():
+            raise json.JSONDecodeError("Extra data after the report", reader.peek(20), 0)
+    except json.JSONDecodeError as e:
+        report.error = f"Invalid JSON: {e}"
+        report.problems.clear()
+        return report
+    except UnicodeDecodeError as e:
+        report.error = f"Not UTF-8 text: {e}"
+        report.problems.clear()
+        return report
+
+    wrapped = wrap_report_envelope(data)
+    if wrapped is not data:
+        report.problems.extend(bare_problems + _missing_sections('report', data))
+    return _finish(report, wrapped)
+
+
+def _parse_report_line(line: str, name: str) -> StreamedReport:
+    report = StreamedReport(name=name)
+    try:
+        data = wrap_report_envelope(json_codec.loads(line))
+    except json_codec.JSONDecodeError as e:
+        report.error = f"Invalid JSON: {e}"
+        return report
+
+    envelope = _envelope(data)
+    if envelope is not None:
+        for section, value in data[envelope].items():
+            report.problems.extend(validate_section(envelope, section, value))
+        report.problems.extend(_missing_sections(envelope, data[envelope]))
+    return _finish(report, data)
+
+
+def iter_jsonl_reports(stream: IO, name: str) -> Iterator[StreamedReport]:
+    """Parse a JSONL bundle one line (one report) at a time; blank lines are skipped."""
+    text = io.TextIOWrapper(stream, encoding='utf-8-sig') if isinstance(stream.read(0), bytes) else stream
+    try:
+        for number, line in enumerate(text, 1):
+            if line.strip():
+                yield _parse_report_line(line, f"{name}:{number}")
+    except UnicodeDecodeError as e:
+        yield StreamedReport(name=name, error=f"Not UTF-8 text: {e}")
+    finally:
+        if text is not stream:
+            # Leave the caller's stream open
+            text.detach()
+
+
+def iter_zip_reports(stream: IO, name: str) -> Iterator[StreamedReport]:
+    """Parse the report and JSONL files of a zip bundle, one member at a time."""
+    try:
+        archive = zipfile.ZipFile(stream)
+    except zipfile.BadZipFile as e:
+        yield StreamedReport(name=name, error=f"Not a zip archive: {e}")
+        return
+
+    with archive:
+        for info in archive.infolist():
+            member = info.filename
+            if info.is_dir() or member.startswith('__MACOSX/') or os.path.basename(member).startswith('.'):
+                continue
+            suffix = os.path.splitext(member.lower())[1]
+            if suffix not in REPORT_SUFFIXES + JSONL_SUFFIXES:
+                continue
+            with archive.open(info) as member_stream:
+                if suffix in JSONL_SUFFIXES:
+                    yield from iter_jsonl_reports(member_stream, f"{name}/{member}")
+                else:
+                    yield read_report_stream(member_stream, f"{name}/{member}")
+
+
+def _iter_single_report(stream: IO, name: str) -> Iterator[StreamedReport]:
+    yield read_report_stream(stream, name)
+
+
+def iter_uploaded_reports(stream: IO, name: str, limit: int = MAX_BUNDLE_REPORTS) -> Iterator[StreamedReport]:
+    """
+    Parse an uploaded file, yielding each report as soon as it has been read.
+
+    The format is chosen by the file name: .zip bundles, .jsonl/.ndjson
+    bundles, or a single (possibly markdown-fenced) JSON report. At most
+    limit reports are read from a bundle.
+    """
+    suffix = os.path.splitext(name.lower())[1]
+    if suffix == '.zip':
+        reports = iter_zip_reports(stream, name)
+    elif suffix in JSONL_SUFFIXES:
+        reports = iter_jsonl_reports(stream, name)
+    else:
+        reports = _iter_single_report(stream, name)
+
+    for count, report in enumerate(reports):
+        if count >= limit:
+            print(f"Only the first {limit} reports of {name} were read")
+            reports.close()
+            break
+        yield report
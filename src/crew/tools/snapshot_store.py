@@ -0,0 +1,205 @@
+import fcntl
+import time
+import uuid
+from contextlib import contextmanager
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.feather as feather
+import pyarrow.fs as pafs
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+TIMESTAMP = pa.timestamp("s", tz="UTC")
+
+# Nanosecond write time of an append, shared by its user and repository rows.
+# Breaks ties between snapshots taken within the same second.
+SEQUENCE = pa.int64()
+
+# One row per user per snapshot
+USER_SCHEMA = pa.schema([
+    ("snapshot_at", TIMESTAMP),
+    ("snapshot_seq", SEQUENCE),
+    ("username", pa.string()),
+    ("name", pa.string()),
+    ("bio", pa.string()),
+    ("location", pa.string()),
+    ("company", pa.string()),
+    ("blog", pa.string()),
+    ("public_repos", pa.int32()),
+    ("public_gists", pa.int32()),
+    ("followers", pa.int32()),
+    ("following", pa.int32()),
+    ("created_at", TIMESTAMP),
+    ("updated_at", TIMESTAMP),
+    ("account_age_days", pa.int32()),
+    ("avatar_url", pa.string()),
+    ("html_url", pa.string()),
+])
+
+# One row per repository per user snapshot
+REPO_SCHEMA = pa.schema([
+    ("snapshot_at", TIMESTAMP),
+    ("snapshot_seq", SEQUENCE),
+    ("username", pa.string()),
+    ("name", pa.string()),
+    ("description", pa.string()),
+    ("language", pa.string()),
+    ("size", pa.int64()),
+    ("stargazers_count", pa.int32()),
+    ("watchers_count", pa.int32()),
+    ("forks_count", pa.int32()),
+    ("open_issues_count", pa.int32()),
+    ("created_at", TIMESTAMP),
+    ("updated_at", TIMESTAMP),
+    ("pushed_at", TIMESTAMP),
+    ("fork", pa.bool_()),
+    ("archived", pa.bool_()),
+    ("has_wiki", pa.bool_()),
+    ("has_pages", pa.bool_()),
+    ("has_issues", pa.bool_()),
+    ("license", pa.string()),
+    ("topics", pa.list_(pa.string())),
+    ("default_branch", pa.string()),
+])
+
+# GitHub's ISO 8601 timestamp format
+GITHUB_TIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def _license_name(license_value) -> Optional[str]:
+    """Accept both the raw GitHub license object and an already extracted name."""
+    if isinstance(license_value, dict):
+        return license_value.get("name") or license_value.get("spdx_id")
+    return license_value or None
+
+
+def _build_table(schema: pa.Schema, records: List[Dict]) -> pa.Table:
+    """Build a table from row dicts, parsing GitHub timestamp strings column-wise."""
+    columns = []
+    for field in schema:
+        values = [record.get(field.name) for record in records]
+        if field.type == TIMESTAMP and field.name != "snapshot_at":
+            strings = pa.array([value or None for value in values], pa.string())
+            columns.append(pc.strptime(strings, format=GITHUB_TIME_FORMAT, unit="s", error_is_null=True).cast(TIMESTAMP))
+        else:
+            columns.append(pa.array(values, field.type))
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+class SnapshotStore:
+    """
+    Columnar store of collected GitHub user and repository records.
+
+    Each write appends an uncompressed Arrow IPC (Feather v2) file under
+    users/ and repos/, so scans memory-map the files instead of parsing JSON.
+    Call compact() periodically to merge the small per-analysis files. Scans
+    hold a shared lock on the store; appends and compactions hold an
+    exclusive one, so a scan sees a user snapshot together with its
+    repositories and either the parts or their merge, never both.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.users_dir = self.root / "users"
+        self.repos_dir = self.root / "repos"
+        self.users_dir.mkdir(parents=True, exist_ok=True)
+        self.repos_dir.mkdir(parents=True, exist_ok=True)
+        self._lock_path = self.root / ".lock"
+
+    @contextmanager
+    def _locked(self, mode: int):
+        with open(self._lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, mode)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def append(self, user_info: Dict, repos: List[Dict], snapshot_at: Optional[datetime] = None) -> None:
+        """Store one user snapshot and its repositories."""
+        self.append_many([(user_info, repos)], snapshot_at)
+
+    def append_many(self, profiles: Iterable[Tuple[Dict, List[Dict]]], snapshot_at: Optional[datetime] = None) -> None:
+        """Store many (user_info, repos) snapshots in a single pair of files."""
+        snapshot_at = snapshot_at or datetime.now(timezone.utc)
+        snapshot_seq = time.time_ns()
+        user_rows, repo_rows = [], []
+
+        for user_info, repos in profiles:
+            username = user_info.get("username") or user_info.get("login")
+            stamp = {"username": username, "snapshot_at": snapshot_at, "snapshot_seq": snapshot_seq}
+            user_rows.append({**user_info, **stamp})
+            repo_rows.extend({**repo, **stamp, "license": _license_name(repo.get("license"))} for repo in repos)
+
+        if not user_rows:
+            return
+
+        part_name = f"part-{snapshot_at.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}.arrow"
+        users, repos = _build_table(USER_SCHEMA, user_rows), _build_table(REPO_SCHEMA, repo_rows)
+        # Both parts appear together to scans, and never in the middle of a compaction
+        with self._locked(fcntl.LOCK_EX):
+            self._write(users, self.users_dir / part_name)
+            self._write(repos, self.repos_dir / part_name)
+
+    def _write(self, table: pa.Table, path: Path) -> None:
+        """Write atomically so concurrent scans never see a partial file."""
+        # Datasets skip dot-prefixed files, so the temporary file is never scanned
+        temp_path = path.with_name(f".{path.name}.tmp")
+        feather.write_feather(table, temp_path, compression="uncompressed")
+        temp_path.replace(path)
+
+    def _dataset(self, source, schema: pa.Schema) -> ds.Dataset:
+        return ds.dataset(source, schema=schema, format="arrow", filesystem=pafs.LocalFileSystem(use_mmap=True))
+
+    def users(self, columns: Optional[List[str]] = None, filter: Optional[ds.Expression] = None) -> pa.Table:
+        """Scan all user snapshots."""
+        with self._locked(fcntl.LOCK_SH):
+            return self._dataset(self.users_dir, USER_SCHEMA).to_table(columns=columns, filter=filter)
+
+    def repos(self, columns: Optional[List[str]] = None, filter: Optional[ds.Expression] = None) -> pa.Table:
+        """Scan all repository rows."""
+        with self._locked(fcntl.LOCK_SH):
+            return self._dataset(self.repos_dir, REPO_SCHEMA).to_table(columns=columns, filter=filter)
+
+    def latest(self, columns: Optional[List[str]] = None) -> Tuple[pa.Table, pa.Table]:
+        """Latest user snapshot per username and the repositories collected with it."""
+        repo_columns = None if columns is None else list(dict.fromkeys(["username", "snapshot_at", "snapshot_seq", *columns]))
+        with self._locked(fcntl.LOCK_SH):
+            users = self._dataset(self.users_dir, USER_SCHEMA).to_table()
+            repos = self._dataset(self.repos_dir, REPO_SCHEMA).to_table(columns=repo_columns)
+
+        # Order snapshots newest first (by time, then write sequence) and keep each user's first
+        ordered = users.sort_by([("username", "ascending"), ("snapshot_at", "descending"), ("snapshot_seq", "descending")])
+        latest = ordered.group_by("username", use_threads=False).aggregate([("snapshot_seq", "first")])
+
+        def is_latest(table: pa.Table) -> pa.Array:
+            latest_seq = pc.take(latest["snapshot_seq_first"], pc.index_in(table["username"], value_set=latest["username"]))
+            return pc.fill_null(pc.equal(table["snapshot_seq"], latest_seq), False)
+
+        return users.filter(is_latest(users)), repos.filter(is_latest(repos))
+
+    def latest_frames(self):
+        """Latest snapshots as (users, repos) DataFrames, ready for batch_metrics.compute_batch_metrics."""
+        latest_users, latest_repos = self.latest()
+        return latest_users.to_pandas(), latest_repos.to_pandas()
+
+    def compact(self) -> None:
+        """
+        Merge the part files of each table into one file.
+
+        The whole read-merge-swap runs under the exclusive lock, so no append
+        lands between reading the parts and removing them, and scans never
+        see both the parts and the merged file.
+        """
+        with self._locked(fcntl.LOCK_EX):
+            for directory, schema in ((self.users_dir, USER_SCHEMA), (self.repos_dir, REPO_SCHEMA)):
+                parts = sorted(directory.glob("part-*.arrow"))
+                if len(parts) < 2:
+                    continue
+                table = self._dataset([str(part) for part in parts], schema).to_table()
+                snapshot_at = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S')
+                self._write(table, directory / f"part-{snapshot_at}-compacted-{uuid.uuid4().hex[:8]}.arrow")
+                for part in parts:
+                    part.unlink()
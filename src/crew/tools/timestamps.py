@@ -0,0 +1,52 @@
+import time
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+SECONDS_PER_DAY = 86400
+
+# Repositories pushed within this window count as active
+ACTIVITY_WINDOW_DAYS = 180
+
+
+def parse_timestamp(value: Any) -> Optional[int]:
+    """
+    Parse a GitHub ISO 8601 timestamp ("2024-03-05T12:34:56Z") to epoch seconds.
+
+    Uses the C implementation of datetime.fromisoformat. The trailing "Z" is
+    rewritten to "+00:00" first, since fromisoformat only accepts it from
+    Python 3.11 and the Docker image runs 3.10. Naive values are read as UTC.
+    Returns None for missing or malformed values instead of raising.
+    """
+    if isinstance(value, datetime):
+        moment = value
+    elif isinstance(value, str) and value:
+        try:
+            moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    else:
+        return None
+
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return int(moment.timestamp())
+
+
+def reference_now(now: Optional[datetime] = None) -> int:
+    """
+    Epoch seconds of the reference time for one analysis run.
+
+    Every date comparison in a run uses this single value, so results do not
+    drift while the run is in progress and can be reproduced by passing a
+    fixed time. Naive datetimes are read as UTC.
+    """
+    if now is None:
+        return int(time.time())
+    return parse_timestamp(now)
+
+
+def days_between(start: Optional[int], end: int) -> int:
+    """Whole days from one epoch time to another; 0 when the start is unknown."""
+    if start is None:
+        return 0
+    return (end - start) // SECONDS_PER_DAY
@@ -4,8 +4,8 @@ GitCrew Streamlit UI - Interactive GitHub Developer Analysis Dashboard
 """
 
 import streamlit as st
-import json
-import pandas as pd
+import streamlit.components.v1 as components
+import importlib.util
 from pathlib import Path
 import sys
 import os
@@ -13,22 +13,54 @@ from datetime import datetime
 
 # Add src to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
-
-# Try to import dependencies
-try:
-    import plotly.express as px
-    import plotly.graph_objects as go
-    PLOTLY_AVAILABLE = True
-except ImportError:
-    PLOTLY_AVAILABLE = False
+from src.crew.report_views import render_report
+from src.crew.tools import json_codec, report_charts, report_export
+from src.crew.tools.report_catalog import get_catalog
+from src.crew.tools.report_loader import load_report
+from src.crew.tools.report_normalizer import normalize_report
+from src.crew.tools.report_parsing import strip_markdown_fences
+from src.crew.tools.report_stream import MAX_BUNDLE_REPORTS, iter_uploaded_reports
+
+# Check optional dependencies without importing them; plotly, pandas and the
+# crewai stack are imported on first use to keep cold starts fast
+PLOTLY_AVAILABLE = importlib.util.find_spec("plotly") is not None
+if not PLOTLY_AVAILABLE:
     st.warning("Plotly not installed. Some visualizations will not be available.")
 
-# Try to import GitCrew
-try:
-    from src.crew.gitcrew import GitCrew
-    GITCREW_AVAILABLE = True
-except ImportError:
-    GITCREW_AVAILABLE = False
+GITCREW_AVAILABLE = importlib.util.find_spec("crewai") is not None
+
+# Analysis types offered by the runner, cheapest first
+ANALYSIS_DEPTHS = {
+    "Quick Tool Analysis (metrics only)": "metrics",
+    "Single-Agent AI Analysis": "single",
+    "Full AI Crew Analysis": "full"
+}
+
+# Seconds between progress refreshes while analyses are running
+JOB_POLL_SECONDS = 2
+
+# Report browser sort options and page sizes; the sidebar only lists the most recent reports
+BROWSER_SORTS = {
+    "Report date": "report_date",
+    "Name": "name",
+    "Developer": "developer_name",
+    "Experience score": "experience_score",
+    "Activity rate": "activity_rate",
+    "Last modified": "modified"
+}
+BROWSER_PAGE_SIZES = (25, 50, 100)
+SIDEBAR_REPORT_LIMIT = 50
+
+# Reports offered for comparison (most recent first) and how many can be compared at once
+COMPARISON_CANDIDATE_LIMIT = 500
+MAX_COMPARED_CANDIDATES = 30
+
+VIEW_REPORT_PAGE = "📊 View Analysis Report"
+
+# Report views: the page pre-rendered by report_export, or the Streamlit widgets
+STATIC_VIEW = "⚡ Static"
+INTERACTIVE_VIEW = "🧩 Interactive"
+STATIC_VIEW_HEIGHT = 1800
 
 # Page configuration
 st.set_page_config(
@@ -89,71 +121,46 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 def load_analysis_report(file_path):
-    """Load analysis report from JSON file, handling markdown code blocks"""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            content = file.read()
-        
-        # Parse markdown-wrapped JSON
-        clean_content = parse_markdown_json(content)
-        
-        # Parse the JSON content
-        data = json.loads(clean_content)
-        
-        # Validate report structure
-        is_valid, message = validate_report_structure(data)
-        if not is_valid:
-            st.warning(f"Report structure issue: {message}")
-            st.info("Attempting to load anyway...")
-        
-        return data
-        
-    except json.JSONDecodeError as e:
-        st.error(f"Error parsing JSON: {e}")
+    """
+    Load analysis report from JSON file, handling markdown code blocks.
+
+    Returns the LoadedReport, whose data is the parsed report and whose
+    normalized field is the same report in the canonical layout used for
+    display, or None on failure. Reports are cached process-wide by path,
+    mtime and size, so reruns reuse them; the returned report is shared and
+    must not be modified.
+    """
+    loaded = load_report(file_path)
+
+    if loaded.is_json_error:
+        st.error(f"Error parsing JSON: {loaded.error}")
         
-        # Show debugging information
+        # Show debugging information (previews were captured when the file was read)
         with st.expander("🔍 Debug Information"):
-            st.write("**Error details:**", str(e))
+            st.write("**Error details:**", loaded.error)
             st.write("**File path:**", str(file_path))
-            
-            # Show raw content preview
-            try:
-                with open(file_path, 'r', encoding='utf-8') as file:
-                    raw_content = file.read()
-                    st.write("**Raw content preview (first 1000 chars):**")
-                    st.code(raw_content[:1000] + ("..." if len(raw_content) > 1000 else ""))
-                    
-                    # Show after markdown parsing
-                    parsed_content = parse_markdown_json(raw_content)
-                    st.write("**After markdown parsing (first 500 chars):**")
-                    st.code(parsed_content[:500] + ("..." if len(parsed_content) > 500 else ""))
-            except Exception as debug_e:
-                st.write(f"Could not read file for debugging: {debug_e}")
+            st.write("**Raw content preview (first 1000 chars):**")
+            st.code(loaded.raw_preview)
+            st.write("**After markdown parsing (first 500 chars):**")
+            st.code(loaded.parsed_preview)
         
         return None
-        
-    except Exception as e:
-        st.error(f"Error loading report: {e}")
+
+    if loaded.data is None:
+        st.error(f"Error loading report: {loaded.error}")
         return None
 
+    # Validate report structure
+    is_valid, message = validate_report_structure(loaded.data)
+    if not is_valid:
+        st.warning(f"Report structure issue: {message}")
+        st.info("Attempting to load anyway...")
+    
+    return loaded
+
 def parse_markdown_json(content):
     """Parse JSON content that might be wrapped in markdown code blocks"""
-    content = content.strip()
-    
-    # Handle different markdown code block formats
-    patterns = [
-        ('```json\n', '\n```'),  # Standard JSON code block
-        ('```\n', '\n```'),      # Generic code block
-        ('````json\n', '\n````'), # Quad backticks
-        ('````\n', '\n````'),     # Quad backticks generic
-    ]
-    
-    for start_pattern, end_pattern in patterns:
-        if content.startswith(start_pattern) and content.endswith(end_pattern):
-            content = content[len(start_pattern):-len(end_pattern)].strip()
-            break
-    
-    return content
+    return strip_markdown_fences(content)
 
 def validate_report_structure(data):
     """Validate that the loaded data has the expected report structure"""
@@ -187,844 +194,39 @@ def validate_report_structure(data):
     
     return True, f"Report structure is valid (type: {report_type})"
 
-def create_language_pie_chart(languages_data):
-    """Create a pie chart for programming languages"""
-    if not PLOTLY_AVAILABLE or not languages_data:
-        return None
-    
-    fig = px.pie(
-        values=list(languages_data.values()),
-        names=list(languages_data.keys()),
-        title="Programming Languages Distribution",
-        color_discrete_sequence=px.colors.qualitative.Set3
-    )
-    fig.update_traces(textposition='inside', textinfo='percent+label')
-    return fig
-
-def create_metrics_bar_chart(metrics_data):
-    """Create a bar chart for repository metrics"""
-    if not PLOTLY_AVAILABLE:
-        return None
-    
-    metrics = ['Documentation Rate', 'License Usage Rate', 'Activity Rate']
-    values = [
-        metrics_data.get('documentation_rate', 0),
-        metrics_data.get('license_usage_rate', 0),
-        metrics_data.get('activity_rate', 0)
-    ]
+def analysis_limits_inputs():
+    """Render the analysis limit controls and return them as AnalysisOptions fields"""
+    from src.crew.tools.pydantic import AnalysisOptions
+    defaults = AnalysisOptions()
     
-    colors = ['green' if v >= 70 else 'orange' if v >= 40 else 'red' for v in values]
-    
-    fig = go.Figure(data=[
-        go.Bar(
-            x=metrics,
-            y=values,
-            marker_color=colors,
-            text=[f'{v}%' for v in values],
-            textposition='auto',
+    with st.expander("⚙️ Analysis Limits"):
+        auto = st.checkbox(
+            "Pick limits automatically",
+            value=False,
+            help="Lower the limits to fit the remaining GitHub rate limit and the latency target"
         )
-    ])
-    
-    fig.update_layout(
-        title="Repository Quality Metrics",
-        xaxis_title="Metrics",
-        yaxis_title="Percentage (%)",
-        yaxis=dict(range=[0, 100])
-    )
-    
-    return fig
-
-def display_executive_summary(report_data):
-    """Display executive summary section"""
-    st.markdown('<div class="section-header">📋 Executive Summary</div>', unsafe_allow_html=True)
-    
-    try:
-        report, report_type = get_report_data(report_data)
-        if not report:
-            st.error("Could not extract report data")
-            return
-        
-        exec_summary = report.get('executive_summary', {})
-        
-        # Display overview
-        overview = exec_summary.get('overview', 'No overview available')
-        st.markdown('<div class="info-box">', unsafe_allow_html=True)
-        st.write(overview)
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        # Display recommendations
-        recommendations = exec_summary.get('recommendations', [])
-        if isinstance(recommendations, str):
-            # New format has recommendations as a string
-            st.subheader("🎯 Recommendations")
-            st.write(recommendations)
-        elif isinstance(recommendations, list):
-            # Old format has recommendations as a list
-            st.subheader("🎯 Key Recommendations")
-            for i, recommendation in enumerate(recommendations, 1):
-                st.write(f"{i}. {recommendation}")
-        else:
-            st.info("No recommendations available")
-        
-        # Display strengths and weaknesses if available (new format)
+        latency_target = st.slider("Latency target (seconds)", 5, 300, int(defaults.latency_target_seconds), disabled=not auto)
         col1, col2 = st.columns(2)
         with col1:
-            strengths = exec_summary.get('summary_of_strengths')
-            if strengths:
-                st.markdown(f'<div class="success-box"><strong>Strengths:</strong> {strengths}</div>', unsafe_allow_html=True)
-        
+            max_repos = st.number_input("Repositories listed", 1, 1000, defaults.max_repos)
+            detailed_repos = st.number_input("Repositories analyzed in detail", 0, 100, defaults.detailed_repos)
+            top_repositories = st.number_input("Top repositories shown", 0, 100, defaults.top_repositories)
         with col2:
-            weaknesses = exec_summary.get('summary_of_weaknesses')
-            if weaknesses:
-                st.markdown(f'<div class="warning-box"><strong>Areas for Improvement:</strong> {weaknesses}</div>', unsafe_allow_html=True)
-            
-    except Exception as e:
-        st.error(f"Error displaying executive summary: {e}")
-
-def display_developer_profile(report_data):
-    """Display developer profile overview"""
-    st.markdown('<div class="section-header">👤 Developer Profile Overview</div>', unsafe_allow_html=True)
-    
-    try:
-        report, report_type = get_report_data(report_data)
-        if not report:
-            st.error("Could not extract report data")
-            return
-        
-        profile = report.get('developer_profile_overview', {})
-        
-        # Handle different profile formats
-        if report_type == 'skill_assessment':
-            # New format with separate personal_information and github_metrics
-            personal_info = profile.get('personal_information', {})
-            github_metrics = profile.get('github_metrics', {})
-            
-            # Display personal information
-            st.subheader("👨‍💼 Personal Information")
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                st.metric("Username", personal_info.get('username', 'N/A'))
-                st.metric("Name", personal_info.get('name', 'N/A'))
-            
-            with col2:
-                st.metric("Location", personal_info.get('location', 'N/A'))
-                st.metric("Company", personal_info.get('company', 'N/A'))
-            
-            with col3:
-                account_age = personal_info.get('account_age_days', 0)
-                account_years = round(account_age / 365.25, 1) if account_age else 0
-                st.metric("Account Age", f"{account_years} years")
-                st.metric("Profile URL", "GitHub" if personal_info.get('profile_url') else 'N/A')
-            
-            with col4:
-                if personal_info.get('avatar_url'):
-                    st.image(personal_info['avatar_url'], width=100, caption="Avatar")
-            
-            # Display GitHub metrics
-            st.subheader("📊 GitHub Metrics")
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                st.metric("Public Repos", github_metrics.get('public_repos', 'N/A'))
-                st.metric("Public Gists", github_metrics.get('public_gists', 'N/A'))
-            
-            with col2:
-                st.metric("Followers", github_metrics.get('followers', 'N/A'))
-                st.metric("Following", github_metrics.get('following', 'N/A'))
-            
-            with col3:
-                created_at = github_metrics.get('created_at', '')
-                if created_at:
-                    created_year = created_at[:4]
-                    st.metric("Joined", created_year)
-                
-                updated_at = github_metrics.get('updated_at', '')
-                if updated_at:
-                    updated_year = updated_at[:4]
-                    st.metric("Last Updated", updated_year)
-            
-            # Display bio if available
-            bio = personal_info.get('bio')
-            if bio:
-                st.subheader("📝 Bio")
-                st.markdown(f'<div class="info-box">{bio}</div>', unsafe_allow_html=True)
-            
-            # Display summary
-            summary = profile.get('summary')
-            if summary:
-                st.subheader("📋 Profile Summary")
-                st.write(summary)
-        
-        else:
-            # Old format - keep existing logic
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                st.metric("Account Age", f"{profile.get('account_age_days', 'N/A')} days")
-                st.metric("Public Repos", profile.get('public_repos', 'N/A'))
-            
-            with col2:
-                st.metric("Followers", profile.get('followers', 'N/A'))
-                st.metric("Following", profile.get('following', 'N/A'))
-            
-            with col3:
-                st.metric("Experience Level", profile.get('experience_level', 'N/A'))
-                st.metric("Activity Level", profile.get('activity_level', 'N/A'))
-            
-            with col4:
-                st.metric("Community Involvement", profile.get('community_involvement', 'N/A'))
-            
-            st.subheader("💻 Primary Languages")
-            languages_text = ", ".join(profile.get('primary_languages', []))
-            st.markdown(f'<div class="success-box"><strong>Languages:</strong> {languages_text}</div>', unsafe_allow_html=True)
-            
-            st.subheader("📝 Profile Summary")
-            st.write(profile.get('summary', 'No summary available'))
-            
-    except Exception as e:
-        st.error(f"Error displaying developer profile: {e}")
-
-def display_technical_skills(report_data):
-    """Display technical skills analysis"""
-    st.markdown('<div class="section-header">⚡ Technical Skills Analysis</div>', unsafe_allow_html=True)
-    
-    try:
-        report, report_type = get_report_data(report_data)
-        if not report:
-            st.error("Could not extract report data")
-            return
-        
-        skills = report.get('technical_skills_analysis', {})
-        
-        # Programming Languages
-        st.subheader("💻 Programming Languages")
-        prog_languages = skills.get('programming_languages', {})
-        
-        if prog_languages:
-            if report_type == 'skill_assessment':
-                # New format with detailed proficiency info
-                lang_data = []
-                for lang, details in prog_languages.items():
-                    if isinstance(details, dict):
-                        proficiency = details.get('proficiency', 'Unknown')
-                        evidence = details.get('evidence', 'No evidence provided')
-                        lang_details = details.get('details', 'No additional details')
-                        lang_data.append({
-                            "Language": lang,
-                            "Proficiency": proficiency,
-                            "Evidence": evidence,
-                            "Details": lang_details
-                        })
-                    else:
-                        # Fallback for simple string format
-                        lang_data.append({
-                            "Language": lang,
-                            "Proficiency": "Unknown",
-                            "Evidence": str(details),
-                            "Details": ""
-                        })
-                
-                # Display as expandable cards
-                for lang_info in lang_data:
-                    with st.expander(f"🔧 {lang_info['Language']} - {lang_info['Proficiency']}"):
-                        st.write(f"**Evidence:** {lang_info['Evidence']}")
-                        if lang_info['Details']:
-                            st.write(f"**Details:** {lang_info['Details']}")
-            else:
-                # Old format
-                lang_data = []
-                for lang, description in prog_languages.items():
-                    level = description.split(' - ')[0] if ' - ' in description else "Unknown"
-                    lang_data.append({"Language": lang, "Level": level, "Description": description})
-                
-                if lang_data:
-                    df_langs = pd.DataFrame(lang_data)
-                    st.dataframe(df_langs, use_container_width=True)
-        
-        # Technologies and Frameworks (new format)
-        if report_type == 'skill_assessment':
-            tech_frameworks = skills.get('technologies_and_frameworks', {})
-            if tech_frameworks:
-                st.subheader("🛠️ Technologies & Frameworks")
-                for tech, details in tech_frameworks.items():
-                    if isinstance(details, dict):
-                        proficiency = details.get('proficiency', 'Unknown')
-                        evidence = details.get('evidence', 'No evidence provided')
-                        tech_details = details.get('details', 'No additional details')
-                        
-                        with st.expander(f"⚙️ {tech} - {proficiency}"):
-                            st.write(f"**Evidence:** {evidence}")
-                            if tech_details:
-                                st.write(f"**Details:** {tech_details}")
-            
-            # Language Summary
-            lang_summary = skills.get('language_summary')
-            if lang_summary:
-                st.subheader("📊 Language Summary")
-                st.markdown(f'<div class="info-box">{lang_summary}</div>', unsafe_allow_html=True)
-        
-        # Skill Gaps
-        skill_gaps = skills.get('skill_gaps', [])
-        if skill_gaps:
-            st.subheader("🎯 Areas for Development")
-            for gap in skill_gaps:
-                st.write(f"• {gap}")
-        
-    except Exception as e:
-        st.error(f"Error displaying technical skills: {e}")
-
-def display_repository_analysis(report_data):
-    """Display repository portfolio analysis"""
-    st.markdown('<div class="section-header">📁 Repository Portfolio Analysis</div>', unsafe_allow_html=True)
-    
-    try:
-        # Try to get repository data from either format
-        repo_data = None
-        if 'report' in report_data and 'repository_portfolio_review' in report_data['report']:
-            repo_data = report_data['report']['repository_portfolio_review']
-        elif 'skill_assessment_report' in report_data and 'repository_portfolio_review' in report_data['skill_assessment_report']:
-            repo_data = report_data['skill_assessment_report']['repository_portfolio_review']
-        
-        if not repo_data:
-            st.info("Repository portfolio analysis not available in this report format")
-            return
-        
-        # Top Repositories
-        st.subheader("🌟 Top Repositories")
-        top_repos = repo_data.get('top_repositories', [])
-        if top_repos:
-            for repo in top_repos:
-                with st.expander(f"📦 {repo.get('name', 'Unknown')} ({repo.get('language', 'N/A')})"):
-                    st.write(f"**Description:** {repo.get('description', 'No description')}")
-                    st.write(f"**Recent Commits:** {repo.get('recent_commits_count', 'N/A')}")
-                    st.write(f"**Purpose:** {repo.get('purpose', 'N/A')}")
-                    st.write(f"**Key Aspects:** {repo.get('key_aspects', 'N/A')}")
-        else:
-            st.info("No repository information available")
-        
-        # Coding Patterns Visualization
-        coding_patterns = repo_data.get('coding_patterns', {})
-        languages = coding_patterns.get('languages_used', {})
-        
-        if languages and PLOTLY_AVAILABLE:
-            st.subheader("📊 Language Usage Distribution")
-            fig = create_language_pie_chart(languages)
-            if fig:
-                st.plotly_chart(fig, use_container_width=True)
-        
-        # Repository Metrics
-        st.subheader("📈 Repository Metrics")
-        if PLOTLY_AVAILABLE:
-            fig = create_metrics_bar_chart(coding_patterns)
-            if fig:
-                st.plotly_chart(fig, use_container_width=True)
-        else:
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Documentation Rate", f"{coding_patterns.get('documentation_rate', 0)}%")
-            with col2:
-                st.metric("License Usage Rate", f"{coding_patterns.get('license_usage_rate', 0)}%")
-            with col3:
-                st.metric("Activity Rate", f"{coding_patterns.get('activity_rate', 0)}%")
-                
-    except KeyError as e:
-        st.error(f"Missing section in report: {e}")
-    except Exception as e:
-        st.error(f"Error displaying repository analysis: {e}")
-
-def display_activity_engagement(report_data):
-    """Display activity and engagement assessment"""
-    st.markdown('<div class="section-header">📊 Activity & Engagement Assessment</div>', unsafe_allow_html=True)
-    
-    try:
-        # Try to get activity data from either format
-        activity = None
-        if 'report' in report_data and 'activity_and_engagement_assessment' in report_data['report']:
-            activity = report_data['report']['activity_and_engagement_assessment']
-        elif 'skill_assessment_report' in report_data and 'activity_and_engagement_assessment' in report_data['skill_assessment_report']:
-            activity = report_data['skill_assessment_report']['activity_and_engagement_assessment']
-        
-        if not activity:
-            st.info("Activity and engagement assessment not available in this report format")
-            return
-        
-        st.subheader("📈 Activity Metrics")
-        activity_metrics = activity.get('activity_metrics', {})
-        if activity_metrics:
-            for metric, value in activity_metrics.items():
-                st.write(f"**{metric.replace('_', ' ').title()}:** {value}")
-        else:
-            st.info("No activity metrics available")
-        
-        st.subheader("🤝 Engagement Patterns")
-        engagement_patterns = activity.get('engagement_patterns', {})
-        if engagement_patterns:
-            for pattern, description in engagement_patterns.items():
-                st.write(f"**{pattern.replace('_', ' ').title()}:** {description}")
-        else:
-            st.info("No engagement patterns available")
-        
-        st.subheader("💡 Recommendations")
-        recommendations = activity.get('recommendations', [])
-        if recommendations:
-            for rec in recommendations:
-                st.write(f"• {rec}")
-        else:
-            st.info("No recommendations available")
-            
-    except KeyError as e:
-        st.error(f"Missing section in report: {e}")
-    except Exception as e:
-        st.error(f"Error displaying activity engagement: {e}")
-
-def display_activity_engagement_new(report_data):
-    """Display activity and engagement assessment for new format"""
-    st.markdown('<div class="section-header">📊 Activity & Engagement Assessment</div>', unsafe_allow_html=True)
-    
-    try:
-        report, report_type = get_report_data(report_data)
-        if not report:
-            return
-        
-        activity = report.get('activity_and_engagement_assessment', {})
-        
-        # Metrics section
-        metrics = activity.get('metrics', {})
-        
-        # Coding Patterns
-        coding_patterns = metrics.get('coding_patterns', {})
-        if coding_patterns:
-            st.subheader("💻 Coding Patterns")
-            
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Documentation Rate", f"{coding_patterns.get('documentation_rate', 0)}%")
-                st.metric("Total Stars", coding_patterns.get('total_stars_received', 0))
-            
-            with col2:
-                st.metric("License Usage Rate", f"{coding_patterns.get('license_usage_rate', 0)}%")
-                st.metric("Total Forks", coding_patterns.get('total_forks_received', 0))
-            
-            with col3:
-                st.metric("Activity Rate", f"{coding_patterns.get('activity_rate', 0)}%")
-                st.metric("Active Repos (6m)", coding_patterns.get('active_repos_last_6_months', 0))
-            
-            # Language usage chart
-            languages_used = coding_patterns.get('languages_used', {})
-            if languages_used and PLOTLY_AVAILABLE:
-                fig = create_language_pie_chart(languages_used)
-                if fig:
-                    st.plotly_chart(fig, use_container_width=True)
-        
-        # Skill Metrics
-        skill_metrics = metrics.get('skill_metrics', {})
-        if skill_metrics:
-            st.subheader("📈 Skill Metrics")
-            
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Experience Score", f"{skill_metrics.get('experience_score', 0)}/100")
-                st.metric("Language Diversity", skill_metrics.get('language_diversity', 0))
-            
-            with col2:
-                st.metric("Community Engagement", skill_metrics.get('community_engagement', 0))
-                st.metric("Repos per Year", round(skill_metrics.get('repos_per_year', 0), 1))
-            
-            with col3:
-                st.metric("Project Maintenance", f"{skill_metrics.get('project_maintenance', 0)}%")
-                avg_size = skill_metrics.get('average_repo_size_kb', 0)
-                st.metric("Avg Repo Size", f"{round(avg_size, 1)} KB")
-        
-        # Activity Summary
-        activity_summary = activity.get('activity_summary')
-        if activity_summary:
-            st.subheader("📋 Activity Summary")
-            st.write(activity_summary)
-        
-        # Engagement Summary
-        engagement_summary = activity.get('engagement_summary')
-        if engagement_summary:
-            st.subheader("🤝 Engagement Summary")
-            st.write(engagement_summary)
-        
-    except Exception as e:
-        st.error(f"Error displaying activity assessment: {e}")
-
-def display_strengths_development(report_data):
-    """Display strengths and development areas"""
-    st.markdown('<div class="section-header">💪 Strengths & Development Areas</div>', unsafe_allow_html=True)
-    
-    try:
-        report, report_type = get_report_data(report_data)
-        if not report:
-            st.error("Could not extract report data")
-            return
-        
-        strengths_dev = report.get('strengths_and_development_areas', {})
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("✅ Strengths")
-            strengths = strengths_dev.get('strengths', [])
-            for strength in strengths:
-                st.markdown(f'<div class="success-box">• {strength}</div>', unsafe_allow_html=True)
-        
-        with col2:
-            st.subheader("🎯 Areas for Improvement")
-            improvements = strengths_dev.get('areas_for_improvement', [])
-            for area in improvements:
-                st.markdown(f'<div class="warning-box">• {area}</div>', unsafe_allow_html=True)
-        
-        # Recommendations
-        recommendations = strengths_dev.get('recommendations', [])
-        if recommendations:
-            st.subheader("💡 Recommendations")
-            for rec in recommendations:
-                st.write(f"• {rec}")
-        
-        # Summary
-        summary = strengths_dev.get('summary')
-        if summary:
-            st.subheader("📋 Summary")
-            st.markdown(f'<div class="info-box">{summary}</div>', unsafe_allow_html=True)
-        
-    except Exception as e:
-        st.error(f"Error displaying strengths and development: {e}")
-
-def display_strengths_development_new(report_data):
-    """Display strengths and development areas for new format"""
-    st.markdown('<div class="section-header">💪 Strengths & Development Areas</div>', unsafe_allow_html=True)
-    
-    try:
-        report, report_type = get_report_data(report_data)
-        if not report:
-            return
-        
-        strengths_dev = report.get('strengths_and_development_areas', {})
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("✅ Strengths")
-            strengths = strengths_dev.get('strengths', [])
-            for strength in strengths:
-                st.markdown(f'<div class="success-box">• {strength}</div>', unsafe_allow_html=True)
-        
-        with col2:
-            st.subheader("🎯 Areas for Improvement")
-            improvements = strengths_dev.get('areas_for_improvement', [])
-            for area in improvements:
-                st.markdown(f'<div class="warning-box">• {area}</div>', unsafe_allow_html=True)
-        
-        # Recommendations
-        recommendations = strengths_dev.get('recommendations', [])
-        if recommendations:
-            st.subheader("💡 Recommendations")
-            for rec in recommendations:
-                st.write(f"• {rec}")
-        
-        # Summary
-        summary = strengths_dev.get('summary')
-        if summary:
-            st.subheader("📋 Summary")
-            st.markdown(f'<div class="info-box">{summary}</div>', unsafe_allow_html=True)
-        
-    except Exception as e:
-        st.error(f"Error displaying strengths and development: {e}")
-
-def display_hiring_recommendations(report_data):
-    """Display hiring and project fit recommendations"""
-    st.markdown('<div class="section-header">🎯 Hiring & Project Fit Recommendations</div>', unsafe_allow_html=True)
-    
-    try:
-        # Try to get hiring data from either format
-        hiring = None
-        if 'report' in report_data and 'hiring_and_project_fit_recommendations' in report_data['report']:
-            hiring = report_data['report']['hiring_and_project_fit_recommendations']
-        elif 'skill_assessment_report' in report_data and 'hiring_and_project_fit_recommendations' in report_data['skill_assessment_report']:
-            hiring = report_data['skill_assessment_report']['hiring_and_project_fit_recommendations']
-        
-        if not hiring:
-            st.info("Hiring recommendations not available in this report format")
-            return
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("💼 Suitable Roles")
-            suitable_roles = hiring.get('suitable_roles', [])
-            if suitable_roles:
-                for role in suitable_roles:
-                    st.write(f"• {role}")
-            else:
-                st.info("No suitable roles specified")
-        
-        with col2:
-            st.subheader("🚀 Suitable Projects")
-            suitable_projects = hiring.get('suitable_projects', [])
-            if suitable_projects:
-                for project in suitable_projects:
-                    st.write(f"• {project}")
-            else:
-                st.info("No suitable projects specified")
-        
-        st.subheader("📋 Hiring Recommendations")
-        recommendations = hiring.get('recommendations', [])
-        if recommendations:
-            for rec in recommendations:
-                st.write(f"• {rec}")
-        else:
-            st.info("No hiring recommendations available")
-            
-    except KeyError as e:
-        st.error(f"Missing section in report: {e}")
-    except Exception as e:
-        st.error(f"Error displaying hiring recommendations: {e}")
-
-def display_hiring_recommendations_new(report_data):
-    """Display hiring and project fit recommendations for new format"""
-    st.markdown('<div class="section-header">🎯 Hiring & Project Fit Recommendations</div>', unsafe_allow_html=True)
-    
-    try:
-        report, report_type = get_report_data(report_data)
-        if not report:
-            return
-        
-        hiring = report.get('hiring_and_project_fit_recommendations', {})
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("💼 Suitable Roles")
-            roles = hiring.get('roles', [])
-            for role in roles:
-                st.write(f"• {role}")
-        
-        with col2:
-            st.subheader("🚀 Suitable Project Types")
-            projects = hiring.get('project_types', [])
-            for project in projects:
-                st.write(f"• {project}")
-        
-        # Considerations
-        considerations = hiring.get('considerations')
-        if considerations:
-            st.subheader("🤔 Considerations")
-            st.markdown(f'<div class="warning-box">{considerations}</div>', unsafe_allow_html=True)
-        
-        # Summary
-        summary = hiring.get('summary')
-        if summary:
-            st.subheader("📋 Summary")
-            st.markdown(f'<div class="info-box">{summary}</div>', unsafe_allow_html=True)
-        
-    except Exception as e:
-        st.error(f"Error displaying hiring recommendations: {e}")
-
-def display_risk_analysis(report_data):
-    """Display risk analysis and considerations"""
-    st.markdown('<div class="section-header">⚠️ Risk Analysis & Considerations</div>', unsafe_allow_html=True)
-    
-    try:
-        # Try to get risk data from either format
-        risk = None
-        if 'report' in report_data and 'risk_analysis_and_considerations' in report_data['report']:
-            risk = report_data['report']['risk_analysis_and_considerations']
-        elif 'skill_assessment_report' in report_data and 'risk_analysis_and_considerations' in report_data['skill_assessment_report']:
-            risk = report_data['skill_assessment_report']['risk_analysis_and_considerations']
-        
-        if not risk:
-            st.info("Risk analysis not available in this report format")
-            return
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("🚨 Identified Risks")
-            risks = risk.get('risks', [])
-            if risks:
-                for risk_item in risks:
-                    st.markdown(f'<div class="warning-box">• {risk_item}</div>', unsafe_allow_html=True)
-            else:
-                st.info("No risks identified")
-        
-        with col2:
-            st.subheader("🛡️ Mitigation Strategies")
-            strategies = risk.get('mitigation_strategies', [])
-            if strategies:
-                for strategy in strategies:
-                    st.markdown(f'<div class="info-box">• {strategy}</div>', unsafe_allow_html=True)
-            else:
-                st.info("No mitigation strategies provided")
-                
-    except KeyError as e:
-        st.error(f"Missing section in report: {e}")
-    except Exception as e:
-        st.error(f"Error displaying risk analysis: {e}")
-
-def display_risk_analysis_new(report_data):
-    """Display risk analysis for new format"""
-    st.markdown('<div class="section-header">⚠️ Risk Analysis & Considerations</div>', unsafe_allow_html=True)
-    
-    try:
-        report, report_type = get_report_data(report_data)
-        if not report:
-            return
-        
-        risk = report.get('risk_analysis_and_considerations', {})
-        
-        # Code Quality Assessment
-        code_quality = risk.get('code_quality_and_best_practices_adherence', {})
-        if code_quality:
-            st.subheader("🔍 Code Quality & Best Practices")
-            for aspect, description in code_quality.items():
-                if aspect not in ['risks', 'mitigations', 'summary']:
-                    st.write(f"**{aspect.replace('_', ' ').title()}:** {description}")
-        
-        # Collaboration Assessment
-        collaboration = risk.get('collaboration_and_communication_skills_assessment', {})
-        if collaboration:
-            st.subheader("🤝 Collaboration & Communication")
-            for aspect, description in collaboration.items():
-                if aspect not in ['risks', 'mitigations', 'summary']:
-                    st.write(f"**{aspect.replace('_', ' ').title()}:** {description}")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("🚨 Identified Risks")
-            risks = risk.get('risks', [])
-            for risk_item in risks:
-                st.markdown(f'<div class="warning-box">• {risk_item}</div>', unsafe_allow_html=True)
-        
-        with col2:
-            st.subheader("🛡️ Mitigation Strategies")
-            mitigations = risk.get('mitigations', [])
-            for strategy in mitigations:
-                st.markdown(f'<div class="info-box">• {strategy}</div>', unsafe_allow_html=True)
-        
-        # Summary
-        summary = risk.get('summary')
-        if summary:
-            st.subheader("📋 Summary")
-            st.markdown(f'<div class="info-box">{summary}</div>', unsafe_allow_html=True)
-        
-    except Exception as e:
-        st.error(f"Error displaying risk analysis: {e}")
-
-def display_action_steps(report_data):
-    """Display actionable next steps"""
-    st.markdown('<div class="section-header">🚀 Actionable Next Steps</div>', unsafe_allow_html=True)
-    
-    actions = report_data['report']['actionable_next_steps']
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.subheader("👨‍💻 Developer Actions")
-        for action in actions.get('developer_actions', []):
-            st.write(f"• {action}")
-    
-    with col2:
-        st.subheader("👔 Managerial Actions")
-        for action in actions.get('managerial_actions', []):
-            st.write(f"• {action}")
-
-def display_actionable_steps_new(report_data):
-    """Display actionable next steps for new format"""
-    st.markdown('<div class="section-header">🚀 Actionable Next Steps</div>', unsafe_allow_html=True)
-    
-    try:
-        report, report_type = get_report_data(report_data)
-        if not report:
-            return
-        
-        actions = report.get('actionable_next_steps', {})
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader("👨‍💻 Developer Actions")
-            dev_actions = actions.get('developer', [])
-            for action in dev_actions:
-                st.write(f"• {action}")
-        
-        with col2:
-            st.subheader("👔 Hiring Manager Actions")
-            mgr_actions = actions.get('hiring_manager', [])
-            for action in mgr_actions:
-                st.write(f"• {action}")
-        
-        # Summary
-        summary = actions.get('summary')
-        if summary:
-            st.subheader("📋 Summary")
-            st.markdown(f'<div class="info-box">{summary}</div>', unsafe_allow_html=True)
-        
-    except Exception as e:
-        st.error(f"Error displaying actionable steps: {e}")
-
-def display_experience_classification(report_data):
-    """Display experience level classification"""
-    st.markdown('<div class="section-header">🎓 Experience Level Classification</div>', unsafe_allow_html=True)
-    
-    try:
-        report, report_type = get_report_data(report_data)
-        if not report:
-            return
-        
-        exp_class = report.get('experience_level_classification', {})
-        
-        if exp_class:
-            level = exp_class.get('level', 'Unknown')
-            evidence = exp_class.get('evidence', 'No evidence provided')
-            reasoning = exp_class.get('reasoning', 'No reasoning provided')
-            
-            st.metric("Experience Level", level)
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                st.subheader("📊 Evidence")
-                st.write(evidence)
-            
-            with col2:
-                st.subheader("🤔 Reasoning")
-                st.write(reasoning)
-        
-    except Exception as e:
-        st.error(f"Error displaying experience classification: {e}")
-
-def display_specialization_areas(report_data):
-    """Display specialization areas and domain expertise"""
-    st.markdown('<div class="section-header">🎯 Specialization Areas</div>', unsafe_allow_html=True)
-    
-    try:
-        report, report_type = get_report_data(report_data)
-        if not report:
-            return
-        
-        specialization = report.get('specialization_areas_and_domain_expertise', {})
-        
-        if specialization:
-            areas = specialization.get('areas', [])
-            details = specialization.get('details', '')
-            
-            if areas:
-                st.subheader("🏆 Areas of Expertise")
-                for area in areas:
-                    st.write(f"• {area}")
-            
-            if details:
-                st.subheader("📋 Details")
-                st.write(details)
-        
-    except Exception as e:
-        st.error(f"Error displaying specialization areas: {e}")
+            language_budget = st.number_input("Extra language requests", 0, 1000, defaults.language_request_budget)
+            commit_pages = st.number_input("Commit pages per repository", 0, 10, defaults.max_commit_pages)
+    
+    return {
+        "max_repos": int(max_repos),
+        "detailed_repos": int(detailed_repos),
+        "top_repositories": int(top_repositories),
+        "max_commit_pages": int(commit_pages),
+        "language_request_budget": int(language_budget),
+        "auto": auto,
+        "latency_target_seconds": float(latency_target)
+    }
 
 def run_new_analysis():
-    """Run new GitHub analysis"""
+    """Submit GitHub analyses to the shared background runner and show their progress"""
     st.markdown('<div class="section-header">🔍 Run New Analysis</div>', unsafe_allow_html=True)
     
     if not GITCREW_AVAILABLE:
@@ -1035,29 +237,71 @@ def run_new_analysis():
     
     analysis_type = st.selectbox(
         "Select Analysis Type",
-        ["Quick Tool Analysis", "Full AI Crew Analysis"]
+        list(ANALYSIS_DEPTHS.keys()),
+        index=len(ANALYSIS_DEPTHS) - 1
     )
     
+    limits = analysis_limits_inputs()
+    
+    from src.crew.analysis_jobs import get_job_manager
+    from src.crew.tools.pydantic import AnalysisOptions
+    manager = get_job_manager()
+    job_ids = st.session_state.setdefault("analysis_job_ids", [])
+    
     if st.button("🚀 Start Analysis"):
         if username:
-            try:
-                with st.spinner(f"Analyzing GitHub user: {username}..."):
-                    git_crew = GitCrew()
-                    
-                    if analysis_type == "Quick Tool Analysis":
-                        result = git_crew.github_analyzer._run(username)
-                        st.subheader("📊 Quick Analysis Result")
-                        st.json(json.loads(result))
-                    else:
-                        inputs = {"github_username": username}
-                        result = git_crew.crew().kickoff(inputs=inputs)
-                        st.subheader("🤖 Full AI Crew Analysis Result")
-                        st.write(result)
-                        
-            except Exception as e:
-                st.error(f"Analysis failed: {e}")
+            # Runs on the shared executor; this session only keeps the job id
+            job = manager.submit(username.strip(), ANALYSIS_DEPTHS[analysis_type], AnalysisOptions(**limits))
+            if job.job_id not in job_ids:
+                job_ids.insert(0, job.job_id)
+            st.success(f"Analysis of {job.username} queued")
         else:
             st.warning("Please enter a GitHub username")
+    
+    jobs = [job for job in map(manager.get, job_ids) if job]
+    if any(job.is_active for job in jobs) and hasattr(st, "fragment"):
+        # Re-run only the job list every few seconds while analyses are in flight
+        st.fragment(show_analysis_jobs, run_every=JOB_POLL_SECONDS)(job_ids)
+    else:
+        show_analysis_jobs(job_ids)
+        if any(job.is_active for job in jobs):
+            st.button("🔄 Refresh progress")
+
+def show_analysis_jobs(job_ids):
+    """Show this session's analysis jobs; rerun the app once they have all finished"""
+    from src.crew.analysis_jobs import JobStatus, get_job_manager
+    from src.crew.tools.pydantic import AnalysisDepth
+    manager = get_job_manager()
+    jobs = [job for job in map(manager.get, job_ids) if job]
+    if not jobs:
+        return
+    
+    st.subheader("🗂️ Your Analyses")
+    running = sum(job.is_active for job in manager.jobs())
+    st.caption(f"{running} analyses queued or running on this server")
+    
+    depth_labels = {depth: label for label, depth in ANALYSIS_DEPTHS.items()}
+    for job in jobs:
+        label = f"**{job.username}** · {depth_labels.get(job.depth.value, job.depth.value)}"
+        if job.is_active:
+            completed, total, stage = job.progress
+            status = "Queued" if job.status == JobStatus.QUEUED else f"{stage} ({completed}/{total})"
+            st.write(label)
+            st.progress(job.fraction, text=status)
+        elif job.status == JobStatus.FAILED:
+            st.error(f"{job.username}: analysis failed: {job.error}")
+        elif job.depth == AnalysisDepth.METRICS:
+            with st.expander(f"📊 {job.username} - Quick Analysis Result"):
+                st.json(job.result)
+        else:
+            st.success(f"✅ {job.username}: report saved as {job.report_file}; select it under Existing Reports")
+    
+    # Rerun the whole app when the last job finishes, so the report list picks up new reports
+    active = any(job.is_active for job in jobs)
+    if st.session_state.get("analysis_jobs_active") and not active:
+        st.session_state["analysis_jobs_active"] = False
+        st.rerun()
+    st.session_state["analysis_jobs_active"] = active
 
 def test_report_parsing():
     """Test function to verify report parsing works correctly"""
@@ -1083,7 +327,7 @@ def test_report_parsing():
         st.write("**Parsed content:**")
         st.code(parsed)
         
-        data = json.loads(parsed)
+        data = json_codec.loads(parsed)
         st.write("**JSON object:**")
         st.json(data)
         
@@ -1093,78 +337,206 @@ def test_report_parsing():
     except Exception as e:
         st.error(f"Test failed: {e}")
 
+def open_report(path):
+    """Button callback: show a report on the View Analysis Report page"""
+    st.session_state["report_path"] = path
+    st.session_state["page"] = VIEW_REPORT_PAGE
+
+def browse_reports(catalog):
+    """Filter, sort and page through the report catalog without opening the report files"""
+    st.markdown('<div class="section-header">🗂️ Browse Reports</div>', unsafe_allow_html=True)
+    
+    facets = catalog.facets()
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        search = st.text_input("Search name or username")
+        language = st.selectbox("Language", ["Any"] + facets["language"])
+    with col2:
+        experience_level = st.selectbox("Experience Level", ["Any"] + facets["experience_level"])
+        activity_level = st.selectbox("Activity Level", ["Any"] + facets["activity_level"])
+    with col3:
+        date_range = st.date_input("Report Date Range", value=(), help="Undated reports use the file's modification date")
+        sort_label = st.selectbox("Sort By", list(BROWSER_SORTS))
+        descending = st.checkbox("Descending", value=True)
+    
+    filters = {
+        "search": search.strip() or None,
+        "language": None if language == "Any" else language,
+        "experience_level": None if experience_level == "Any" else experience_level,
+        "activity_level": None if activity_level == "Any" else activity_level,
+        # The range is inclusive of both days; a half-picked range has no end yet
+        "date_from": datetime.combine(date_range[0], datetime.min.time()) if len(date_range) > 0 else None,
+        "date_to": datetime.combine(date_range[1], datetime.max.time()) if len(date_range) > 1 else None,
+        "sort": BROWSER_SORTS[sort_label],
+        "descending": descending
+    }
+    page_size = st.sidebar.selectbox("Reports per page", BROWSER_PAGE_SIZES)
+    
+    # Go back to the first page whenever the filters or page size change
+    if st.session_state.get("browser_filters") != (filters, page_size):
+        st.session_state["browser_filters"] = (filters, page_size)
+        st.session_state["browser_page"] = 1
+    
+    page_number = st.session_state.get("browser_page", 1)
+    entries, total = catalog.query(limit=page_size, offset=(page_number - 1) * page_size, **filters)
+    pages = max(1, -(-total // page_size))
+    if page_number > pages:
+        # Reports were removed since the page was picked
+        st.session_state["browser_page"] = page_number = pages
+        entries, total = catalog.query(limit=page_size, offset=(page_number - 1) * page_size, **filters)
+    
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        st.write(f"**{total}** matching reports")
+    with col2:
+        st.number_input("Page", 1, pages, key="browser_page", help=f"{pages} pages")
+    
+    if not entries:
+        st.info("No reports match these filters")
+        return
+    
+    st.dataframe(
+        [
+            {
+                "Report": entry.name,
+                "Developer": entry.developer_name or entry.username,
+                "Experience": entry.experience_level,
+                "Activity": entry.activity_level,
+                "Languages": ", ".join(entry.primary_languages[:5]),
+                "Experience Score": entry.experience_score,
+                "Activity Rate": entry.activity_rate,
+                "Date": entry.report_date or entry.modified_at.strftime("%Y-%m-%d"),
+            }
+            for entry in entries
+        ],
+        use_container_width=True,
+        hide_index=True
+    )
+    
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        selected_path = st.selectbox(
+            "Open a report from this page:",
+            [entry.path for entry in entries],
+            format_func=lambda path: next(entry.name for entry in entries if entry.path == path)
+        )
+    with col2:
+        st.button("📊 Open Report", on_click=open_report, args=(selected_path,))
+
+def compare_candidates(catalog):
+    """Compare several candidates' precomputed metrics in one table and one combined figure"""
+    st.markdown('<div class="section-header">⚖️ Compare Candidates</div>', unsafe_allow_html=True)
+    
+    entries = {entry.path: entry for entry in catalog.query(sort="modified", descending=True, limit=COMPARISON_CANDIDATE_LIMIT)[0]}
+    selected_paths = st.multiselect(
+        "Select candidates to compare:",
+        list(entries),
+        format_func=lambda path: f"{entries[path].developer_name or entries[path].username or entries[path].name} ({entries[path].name})",
+        max_selections=MAX_COMPARED_CANDIDATES
+    )
+    if len(selected_paths) < 2:
+        st.info("Select at least two reports to compare")
+        return
+    
+    from src.crew.tools.batch_metrics import metrics_from_reports
+    
+    # Reports come from the shared parse cache; labels must be unique for the columnar frames
+    reports, failed = {}, []
+    for path in selected_paths:
+        loaded = load_report(path)
+        if loaded.data is None:
+            failed.append(entries[path].name)
+            continue
+        label = entries[path].username or entries[path].name
+        if label in reports:
+            label = f"{label} ({entries[path].name})"
+        reports[label] = loaded.data
+    if failed:
+        st.warning(f"Could not load: {', '.join(failed)}")
+    if not reports:
+        return
+    
+    batch = metrics_from_reports(reports)
+    
+    if PLOTLY_AVAILABLE:
+        fig = report_charts.comparison_chart(batch)
+        if fig:
+            st.plotly_chart(fig, use_container_width=True)
+    
+    st.subheader("📊 Metrics")
+    st.dataframe(batch.metrics, use_container_width=True)
+
+def read_uploaded_reports(uploaded_file):
+    """
+    Parse an uploaded report or bundle once; reruns reuse the reports kept in the session.
+
+    The upload is parsed straight from the file object, a section (or bundle
+    line) at a time, so the file is never decoded into one string.
+    """
+    cached = st.session_state.get("uploaded_reports")
+    if cached and cached[0] == uploaded_file.file_id:
+        return cached[1]
+    
+    uploaded_file.seek(0)
+    with st.spinner("Reading reports..."):
+        reports = list(iter_uploaded_reports(uploaded_file, uploaded_file.name))
+    st.session_state["uploaded_reports"] = (uploaded_file.file_id, reports)
+    return reports
+
 def upload_and_view_report():
-    """Allow users to upload and view their own report files"""
+    """Allow users to upload and view their own report files, or bundles of them"""
     st.markdown('<div class="section-header">📤 Upload Report File</div>', unsafe_allow_html=True)
     
     uploaded_file = st.file_uploader(
-        "Choose a report file",
-        type=['json', 'txt'],
-        help="Upload a JSON report file (can be markdown-wrapped)"
+        "Choose a report file or bundle",
+        type=['json', 'txt', 'jsonl', 'ndjson', 'zip'],
+        help="Upload a JSON report file (can be markdown-wrapped), a JSONL file with one report per line, "
+             f"or a zip of report files (up to {MAX_BUNDLE_REPORTS} reports per bundle)"
     )
     
     if uploaded_file is not None:
+        # Show file info
+        st.write(f"**File name:** {uploaded_file.name}")
+        st.write(f"**File size:** {uploaded_file.size:,} bytes")
+        
         try:
-            # Read the uploaded file
-            content = uploaded_file.read().decode('utf-8')
-            
-            # Show file info
-            st.write(f"**File name:** {uploaded_file.name}")
-            st.write(f"**File size:** {len(content)} characters")
-            
-            # Parse the content
-            clean_content = parse_markdown_json(content)
-            data = json.loads(clean_content)
-            
-            # Validate structure
-            is_valid, message = validate_report_structure(data)
-            if is_valid:
-                st.success("✅ Report uploaded and validated successfully!")
-                
-                # Display the report
-                st.markdown("---")
-                display_executive_summary({'report': data['report']})
-                display_developer_profile({'report': data['report']})
-                display_technical_skills({'report': data['report']})
-                
-            else:
-                st.warning(f"⚠️ Validation warning: {message}")
-                st.info("Displaying available sections...")
-                
-                # Try to display what we can
-                if 'report' in data:
-                    st.json(data['report'])
-                else:
-                    st.json(data)
-            
-        except json.JSONDecodeError as e:
-            st.error(f"❌ Error parsing JSON: {e}")
-            
-            with st.expander("🔍 Debug Information"):
-                st.code(content[:1000] + ("..." if len(content) > 1000 else ""))
-                
+            reports = read_uploaded_reports(uploaded_file)
         except Exception as e:
             st.error(f"❌ Error processing file: {e}")
-
-def get_report_data(data):
-    """Extract report data regardless of format (new or old)"""
-    if 'skill_assessment_report' in data:
-        return data['skill_assessment_report'], 'skill_assessment'
-    elif 'report' in data:
-        return data['report'], 'standard'
-    else:
-        return None, 'unknown'
-
-def get_nested_value(data, path, default=None):
-    """Safely get nested dictionary values using dot notation"""
-    keys = path.split('.')
-    current = data
-    for key in keys:
-        if isinstance(current, dict) and key in current:
-            current = current[key]
+            return
+        
+        failed = [report for report in reports if report.error]
+        readable = [report for report in reports if report.data is not None]
+        for report in failed:
+            st.error(f"❌ {report.name}: {report.error}")
+        if not readable:
+            if not failed:
+                st.warning("No reports found in the upload.")
+            return
+        
+        if len(readable) > 1:
+            st.success(f"✅ Read {len(readable)} reports from the bundle.")
+            index = st.selectbox(
+                "Report to view:",
+                range(len(readable)),
+                format_func=lambda i: readable[i].name,
+                key="uploaded_report_index"
+            )
+            report = readable[min(index, len(readable) - 1)]
+        else:
+            report = readable[0]
+        
+        # Sections were validated as they were read; show what failed and display the rest
+        if report.problems:
+            st.warning(f"⚠️ {len(report.problems)} validation issue(s) in {report.name}; displaying available sections.")
+            with st.expander("🔍 Validation Details"):
+                for problem in report.problems:
+                    st.write(f"• {problem}")
         else:
-            return default
-    return current
+            st.success("✅ Report uploaded and validated successfully!")
+        
+        st.markdown("---")
+        render_report(normalize_report(report.data))
 
 def main():
     """Main Streamlit application"""
@@ -1176,70 +548,112 @@ def main():
     # Sidebar
     st.sidebar.title("📋 Navigation")
     
-    # Check for existing reports
-    report_files = list(Path(".").glob("**/github_analysis_report_*.json"))
+    # Check for existing reports (indexed catalog, refreshed incrementally); the sidebar
+    # lists the most recent ones and the browser pages through the rest
+    catalog = get_catalog()
+    catalog.refresh()
+    recent, report_count = catalog.query(sort="modified", descending=True, limit=SIDEBAR_REPORT_LIMIT)
+    report_files = {entry.path: entry for entry in recent}
+    opened_path = st.session_state.get("report_path")
+    if opened_path and opened_path != "None" and opened_path not in report_files:
+        # Opened from the browser: keep it selectable
+        opened = catalog.get(opened_path)
+        if opened:
+            report_files = {opened_path: opened, **report_files}
     
     if report_files:
         st.sidebar.subheader("📁 Existing Reports")
-        selected_report = st.sidebar.selectbox(
+        selected_path = st.sidebar.selectbox(
             "Select a report to view:",
-            ["None"] + [f.name for f in report_files]
+            ["None"] + list(report_files),
+            format_func=lambda path: path if path == "None" else report_files[path].name,
+            key="report_path"
         )
+        selected_report = report_files[selected_path].name if selected_path != "None" else "None"
     else:
         selected_report = "None"
     
     page = st.sidebar.radio(
         "Choose Action:",
-        ["📊 View Analysis Report", "� Upload Report", "�🔍 Run New Analysis", "🧪 Test Parser"]
+        [VIEW_REPORT_PAGE, "🗂️ Browse Reports", "⚖️ Compare Candidates", "� Upload Report", "�🔍 Run New Analysis", "🧪 Test Parser"],
+        key="page"
     )
     
-    if page == "📊 View Analysis Report":
+    if page == VIEW_REPORT_PAGE:
         if selected_report != "None":
-            report_path = next(f for f in report_files if f.name == selected_report)
-            report_data = load_analysis_report(report_path)
-            
-            if report_data:
-                # Validate report structure
-                is_valid, validation_message = validate_report_structure(report_data)
-                if not is_valid:
-                    st.error(f"Report structure is invalid: {validation_message}")
+            report_path = Path(selected_path)
+            loaded = load_analysis_report(report_path)
+            
+            if loaded:
+                report = loaded.normalized
+                # Rendered once per report version and served from disk afterwards
+                page_html = report_export.cached_html(report_path)
+                view = st.radio(
+                    "View:",
+                    [STATIC_VIEW, INTERACTIVE_VIEW],
+                    horizontal=True,
+                    key="report_view",
+                    help="The static view shows the pre-rendered page; the interactive view renders the report here"
+                )
+                if view == STATIC_VIEW and page_html:
+                    components.html(page_html, height=STATIC_VIEW_HEIGHT, scrolling=True)
                 else:
-                    # Display sections
-                    display_executive_summary(report_data)
-                    display_developer_profile(report_data)
-                    display_technical_skills(report_data)
-                    display_repository_analysis(report_data)
-                    display_activity_engagement(report_data)
-                    display_strengths_development(report_data)
-                    display_hiring_recommendations(report_data)
-                    display_risk_analysis(report_data)
-                    display_action_steps(report_data)
-                    
-                    # Export options
-                    st.markdown("---")
-                    st.subheader("📤 Export Options")
-                    
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        if st.button("📄 Download as JSON"):
+                    render_report(report)
+                
+                # Export options
+                st.markdown("---")
+                st.subheader("📤 Export Options")
+                
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    if st.button("📄 Download as JSON"):
+                        st.download_button(
+                            label="Download JSON Report",
+                            data=json_codec.dumps(loaded.data, indent=2),
+                            file_name=f"report_{selected_report.replace('.json', '')}.json",
+                            mime="application/json"
+                        )
+                
+                with col2:
+                    if st.button("📋 Copy Summary"):
+                        profile = report['developer_profile_overview']
+                        name = profile['name'] or profile['username'] or 'Unknown'
+                        summary_text = f"GitHub Analysis Summary for {name}"
+                        st.text_area("Summary (copy this text):", summary_text, height=100)
+                
+                with col3:
+                    if page_html:
+                        st.download_button(
+                            label="🌐 Download as HTML",
+                            data=page_html,
+                            file_name=f"report_{selected_report.replace('.json', '')}.html",
+                            mime="text/html"
+                        )
+                    if report_export.PDF_AVAILABLE and st.button("📑 Export as PDF"):
+                        with st.spinner("Rendering PDF..."):
+                            pdf_path = report_export.export_pdf(report_path)
+                        if pdf_path:
                             st.download_button(
-                                label="Download JSON Report",
-                                data=json.dumps(report_data, indent=2),
-                                file_name=f"report_{selected_report.replace('.json', '')}.json",
-                                mime="application/json"
+                                label="Download PDF Report",
+                                data=pdf_path.read_bytes(),
+                                file_name=f"report_{selected_report.replace('.json', '')}.pdf",
+                                mime="application/pdf"
                             )
-                    
-                    with col2:
-                        if st.button("📋 Copy Summary"):
-                            summary_text = f"GitHub Analysis Summary for {report_data['report']['developer_profile_overview'].get('name', 'Unknown')}"
-                            st.text_area("Summary (copy this text):", summary_text, height=100)
-                    
-                    # Raw data in expander
-                    with st.expander("🔍 View Raw Data"):
-                        st.json(report_data['report']['appendices']['raw_data_summary'])
+                        else:
+                            st.error("PDF export failed")
+                
+                # Raw data in expander
+                with st.expander("🔍 View Raw Data"):
+                    st.json(report['appendices']['raw_data_summary'])
         else:
             st.info("Please select a report from the sidebar or run a new analysis.")
     
+    elif page == "🗂️ Browse Reports":
+        browse_reports(catalog)
+    
+    elif page == "⚖️ Compare Candidates":
+        compare_candidates(catalog)
+    
     elif page == "� Upload Report":
         upload_and_view_report()
     
@@ -1262,7 +676,8 @@ def main():
     with st.expander("🔧 System Status"):
         st.write(f"**GitCrew Available:** {'✅ Yes' if GITCREW_AVAILABLE else '❌ No'}")
         st.write(f"**Plotly Available:** {'✅ Yes' if PLOTLY_AVAILABLE else '❌ No'}")
-        st.write(f"**Reports Found:** {len(report_files) if report_files else 0}")
+        st.write(f"**PDF Export Available:** {'✅ Yes' if report_export.PDF_AVAILABLE else '❌ No'}")
+        st.write(f"**Reports Found:** {report_count}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,25 @@
+import json
+import math
+
+from src.crew.tools.batch_metrics import metrics_from_reports
+from src.crew.tools.report_parsing import strip_markdown_fences
+
+
+def _sample():
+    with open("github_analysis_report_Sarthakdevil.json", encoding="utf-8") as file:
+        return json.loads(strip_markdown_fences(file.read()))
+
+
+def test_malformed_reports_do_not_abort_the_batch():
+    reports = {
+        "sample": _sample(),
+        "string_patterns": {"report": {"appendices": {"raw_data_summary": {"coding_patterns": "many languages"}}}},
+        "list_patterns": {"report": {"appendices": {"raw_data_summary": {"coding_patterns": ["Python"]}}}},
+        "string_languages": {"report": {"appendices": {"raw_data_summary": {"coding_patterns": {"languages_used": "Go"}}}}},
+        "not_a_report": "plain text",
+    }
+    batch = metrics_from_reports(reports)
+
+    assert list(batch.metrics.index) == list(reports)
+    assert set(batch.languages["username"]) == {"sample"}
+    assert all(math.isnan(value) for value in batch.metrics.loc["string_patterns"])
@@ -0,0 +1,32 @@
+from datetime import datetime, timezone
+
+from src.crew.tools.commit_activity import COMMITS_PER_PAGE, CommitActivityCollector, CommitActivityStore
+
+NOW = datetime(2026, 10, 19, tzinfo=timezone.utc)
+COMMIT = {"commit": {"author": {"date": "2026-10-10T00:00:00Z"}}}
+
+
+def _collector(pages, participation=None):
+    def make_request(endpoint, params=None):
+        if endpoint.endswith("/stats/participation"):
+            return participation
+        page = params["page"]
+        return pages[page - 1] if page <= len(pages) else []
+    return CommitActivityCollector(make_request, CommitActivityStore())
+
+
+def test_participation_still_computing_falls_back_to_commits():
+    collector = _collector([[COMMIT] * 5])
+    assert sum(collector.collect("owner", "repo", "pushed", NOW)) == 5
+    assert collector.store.cursor("owner", "repo") is not None
+
+
+def test_truncated_history_is_counted_but_not_stored():
+    collector = _collector([[COMMIT] * COMMITS_PER_PAGE, [COMMIT]])
+    assert sum(collector.collect("owner", "repo", "pushed", NOW)) == COMMITS_PER_PAGE
+    assert collector.store.cursor("owner", "repo") is None
+
+
+def test_unknown_activity_is_none():
+    collector = _collector([None])
+    assert collector.collect("owner", "repo", "pushed", NOW) is None
@@ -0,0 +1,53 @@
+import io
+import json
+
+from src.crew.tools.json_stream import JSONStreamReader
+from src.crew.tools.report_parsing import strip_markdown_fences, wrap_report_envelope
+from src.crew.tools.report_stream import read_report_stream
+
+DOCUMENT = json.dumps({
+    "score": 33.5,
+    "count": 1200,
+    "ratio": -0.25e-3,
+    "large": 12345678901234567890,
+    "flag": True,
+    "missing": None,
+    "name": "café ☃",
+    "nested": {"values": [1, 2.5, {"deep": -7}], "empty": {}},
+    "tail": 42,
+})
+
+
+def _read_object(stream, chunk_size):
+    reader = JSONStreamReader(stream, chunk_size)
+    reader.begin_object()
+    data = {}
+    while True:
+        key = reader.next_key()
+        if key is None:
+            break
+        data[key] = reader.read_value()
+    assert reader.at_end()
+    return data
+
+
+def test_every_chunk_size_decodes_the_document():
+    expected = json.loads(DOCUMENT)
+    for chunk_size in range(1, len(DOCUMENT) + 2):
+        assert _read_object(io.StringIO(DOCUMENT), chunk_size) == expected, chunk_size
+
+
+def test_every_chunk_size_decodes_binary_streams():
+    encoded = DOCUMENT.encode("utf-8")
+    expected = json.loads(DOCUMENT)
+    for chunk_size in range(1, len(encoded) + 2):
+        assert _read_object(io.BytesIO(encoded), chunk_size) == expected, chunk_size
+
+
+def test_sample_reports_read_like_json_loads():
+    for name in ("github_analysis_report_Sarthakdevil.json", "github_analysis_report_tushar1977.json"):
+        with open(name, "rb") as file:
+            report = read_report_stream(file, name)
+        assert report.error is None, report.error
+        with open(name, encoding="utf-8") as file:
+            assert report.data == wrap_report_envelope(json.loads(strip_markdown_fences(file.read())))
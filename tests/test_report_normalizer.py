@@ -0,0 +1,33 @@
+import json
+
+import pytest
+
+from src.crew.tools.report_normalizer import CANONICAL_LAYOUT, normalize_report
+from src.crew.tools.report_parsing import strip_markdown_fences
+
+# One sample report per saved format
+SAMPLES = {
+    "github_analysis_report": "github_analysis_report_Sarthakdevil.json",
+    "skill_assessment_report": "github_analysis_report_tushar1977.json",
+}
+
+
+def _load(name):
+    with open(name, encoding="utf-8") as file:
+        return json.loads(strip_markdown_fences(file.read()))
+
+
+@pytest.mark.parametrize("source_format, name", SAMPLES.items())
+def test_every_canonical_section_is_filled(source_format, name):
+    normalized = normalize_report(_load(name))
+    assert normalized["metadata"]["source_format"] == source_format
+    for section, fields in CANONICAL_LAYOUT.items():
+        assert set(normalized[section]) == set(fields)
+        filled = [field for field, value in normalized[section].items() if value not in (None, "", [], {})]
+        assert filled, f"{section} is empty for {name}"
+
+
+def test_github_analysis_activity_section():
+    activity = normalize_report(_load(SAMPLES["github_analysis_report"]))["activity_and_engagement_assessment"]
+    assert activity["activity_metrics"]["Active Repos Last 6 Months"] == "12"
+    assert activity["engagement_patterns"]["Follower Count"] == "10"
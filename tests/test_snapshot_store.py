@@ -0,0 +1,26 @@
+from datetime import datetime, timezone
+
+from src.crew.tools.snapshot_store import SnapshotStore
+
+SNAPSHOT_AT = datetime(2026, 10, 19, tzinfo=timezone.utc)
+
+
+def test_latest_breaks_same_second_ties_by_write_order(tmp_path):
+    store = SnapshotStore(tmp_path)
+    store.append({"login": "octocat", "public_repos": 1}, [{"name": "old"}], SNAPSHOT_AT)
+    store.append({"login": "octocat", "public_repos": 2}, [{"name": "new"}, {"name": "newer"}], SNAPSHOT_AT)
+
+    users, repos = store.latest(["name"])
+    assert users["public_repos"].to_pylist() == [2]
+    assert sorted(repos["name"].to_pylist()) == ["new", "newer"]
+
+
+def test_compact_keeps_every_row(tmp_path):
+    store = SnapshotStore(tmp_path)
+    for index in range(3):
+        store.append({"login": f"user{index}"}, [{"name": "a"}, {"name": "b"}], SNAPSHOT_AT)
+    store.compact()
+
+    assert len(list(store.users_dir.glob("part-*.arrow"))) == 1
+    users, repos = store.latest()
+    assert users.num_rows == 3 and repos.num_rows == 6
@@ -0,0 +1,22 @@
+from datetime import datetime, timezone
+
+from src.crew.tools.timestamps import days_between, parse_timestamp
+
+EXPECTED = int(datetime(2024, 3, 5, 12, 34, 56, tzinfo=timezone.utc).timestamp())
+
+
+def test_trailing_z_is_utc():
+    assert parse_timestamp("2024-03-05T12:34:56Z") == EXPECTED
+
+
+def test_offsets_and_naive_values():
+    assert parse_timestamp("2024-03-05T14:34:56+02:00") == EXPECTED
+    assert parse_timestamp("2024-03-05T12:34:56") == EXPECTED
+    assert parse_timestamp(datetime(2024, 3, 5, 12, 34, 56)) == EXPECTED
+
+
+def test_missing_and_malformed_values():
+    assert parse_timestamp(None) is None
+    assert parse_timestamp("") is None
+    assert parse_timestamp("not a date") is None
+    assert days_between(None, EXPECTED) == 0